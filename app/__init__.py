@@ -3,20 +3,25 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
 from config import Config
+from app.workflows.engines import engine_options, register_engine
+from app.assets import StaticAssets
 
 # Initialize Flask extensions
 db = SQLAlchemy()
 login_manager = LoginManager()
 migrate = Migrate()
+static_assets = StaticAssets()
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config['SQLALCHEMY_DATABASE_URI']))
 
     # Initialize Flask extensions with app
     db.init_app(app)
     login_manager.init_app(app)
     migrate.init_app(app, db)
+    static_assets.init_app(app)
 
     # Set up login configuration
     login_manager.login_view = 'auth.login'
@@ -29,13 +34,20 @@ def create_app(config_class=Config):
     from app.routes.auth import auth as auth_blueprint
     app.register_blueprint(auth_blueprint, url_prefix='/auth')
 
+    from app.routes.api import api as api_blueprint
+    app.register_blueprint(api_blueprint, url_prefix='/api')
+
     # Create database tables
     with app.app_context():
         db.create_all()
+        # Raw SQL helpers asking for the same URL reuse the ORM's pool
+        register_engine(db.engine)
+        from app.workflows.assessment_search import setup_search_index
+        setup_search_index(db.engine)
 
     return app
 
 @login_manager.user_loader
 def load_user(id):
-    from app.models.user import User  # Import here to avoid circular imports
-    return User.query.get(int(id))
+    from app.workflows.user_cache import load_cached_user  # Import here to avoid circular imports
+    return load_cached_user(int(id))
@@ -0,0 +1,120 @@
+from flask import current_app, request
+from typing import Dict, Optional, Tuple
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+FINGERPRINT_PATTERN = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]+)$')
+
+
+class StaticAsset:
+    """One static file with its content hash and precompressed variants."""
+
+    def __init__(self, filename: str, path: str):
+        self.filename = filename
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        self.hash = hashlib.sha256(self.data).hexdigest()[:12]
+        stem, ext = os.path.splitext(filename)
+        self.fingerprinted = f"{stem}.{self.hash}{ext}"
+        self.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        # Only keep a variant when it is actually smaller
+        self.encodings: Dict[str, bytes] = {}
+        if self.mimetype.startswith(COMPRESSIBLE_TYPES):
+            variants = {'gzip': gzip.compress(self.data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants['br'] = brotli.compress(self.data, quality=11)
+            self.encodings = {name: body for name, body in variants.items() if len(body) < len(self.data)}
+
+    def negotiate(self, accept_encodings) -> Tuple[Optional[str], bytes]:
+        """Pick brotli, then gzip, then identity according to Accept-Encoding."""
+        for name in ('br', 'gzip'):
+            if name in self.encodings and accept_encodings[name]:
+                return name, self.encodings[name]
+        return None, self.data
+
+
+class StaticAssets:
+    """Content-hash fingerprinted, precompressed static files with immutable caching.
+
+    url_for('static', filename='css/style.css') returns css/style.<hash>.css, so
+    a fingerprinted URL always names the same bytes and can be cached for a
+    year. Unfingerprinted and stale URLs fall back to Flask's default handler.
+    """
+
+    def __init__(self, app=None):
+        self.assets: Dict[str, StaticAsset] = {}
+        self.by_fingerprint: Dict[str, StaticAsset] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('STATIC_FINGERPRINTING', True)
+        app.config.setdefault('STATIC_IMMUTABLE_MAX_AGE', 365 * 24 * 3600)
+        app.extensions['static_assets'] = self
+        if not app.config['STATIC_FINGERPRINTING'] or not app.static_folder:
+            return
+
+        self.scan(app.static_folder)
+        app.url_defaults(self.fingerprint_url)
+        app.view_functions['static'] = self.send_static
+
+    def scan(self, static_folder: str):
+        assets = {}
+        for root, _, files in os.walk(static_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, static_folder).replace(os.sep, '/')
+                assets[filename] = StaticAsset(filename, path)
+        self.assets = assets
+        self.by_fingerprint = {asset.fingerprinted: asset for asset in assets.values()}
+        logger.info(f"Fingerprinted {len(assets)} static assets")
+
+    def lookup(self, filename: str) -> Optional[StaticAsset]:
+        asset = self.assets.get(filename)
+        # Pick up edits without a restart while developing
+        if asset is not None and current_app.debug and os.path.getmtime(asset.path) != asset.mtime:
+            self.by_fingerprint.pop(asset.fingerprinted, None)
+            asset = self.assets[filename] = StaticAsset(filename, asset.path)
+            self.by_fingerprint[asset.fingerprinted] = asset
+        return asset
+
+    def fingerprint_url(self, endpoint: str, values: dict):
+        if endpoint != 'static' or 'filename' not in values:
+            return
+        asset = self.lookup(values['filename'])
+        if asset is not None:
+            values['filename'] = asset.fingerprinted
+
+    def send_static(self, filename: str):
+        asset = self.by_fingerprint.get(filename)
+        if asset is None:
+            # Unfingerprinted or stale hash: serve the current file with default caching
+            match = FINGERPRINT_PATTERN.match(filename)
+            original = f"{match['stem']}{match['ext']}" if match else filename
+            return current_app.send_static_file(original if original in self.assets else filename)
+
+        encoding, body = asset.negotiate(request.accept_encodings)
+        response = current_app.response_class(body, mimetype=asset.mimetype)
+        if encoding:
+            response.content_encoding = encoding
+        response.vary.add('Accept-Encoding')
+        response.set_etag(f"{asset.hash}-{encoding or 'identity'}")
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config['STATIC_IMMUTABLE_MAX_AGE']
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
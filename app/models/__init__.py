@@ -1,5 +1,5 @@
 from .user import User
-from .assessment import Assessment
+from .assessment import Assessment, AssessmentMetric
 from .relationships import *
 
-__all__ = ['User', 'Assessment']
+__all__ = ['User', 'Assessment', 'AssessmentMetric']
@@ -1,8 +1,18 @@
 from app import db
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Any, Dict, Optional
+import json
 
 class Assessment(db.Model):
     __tablename__ = 'assessment'
+    __table_args__ = (
+        # Keyset pagination of a user's assessments by (review_date, id)
+        db.Index('ix_assessment_user_review_date_id', 'user_id', 'review_date', 'id'),
+        db.Index('ix_assessment_employee_review_date', 'employee_id', 'review_date'),
+        db.Index('ix_assessment_department_status', 'department', 'status'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.String(50), nullable=False)
@@ -14,13 +24,62 @@ class Assessment(db.Model):
     sentiment_analysis = db.Column(db.JSON, nullable=False)
     promotion_recommendation = db.Column(db.JSON, nullable=False)
     additional_comments = db.Column(db.Text)
+    # Fairness validation report of the stored analysis, set only when validation flagged it
+    validation_report = db.Column(db.JSON)
     review_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     status = db.Column(db.String(20), nullable=False, default='pending')  # 'pending' or 'completed'
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # Bumped on every ORM update of the row; with analysis_version it forms the ETag
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    analysis_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                           onupdate=datetime.utcnow, server_default=db.func.now())
+
+    # Typed copies of the JSON documents, kept in sync on flush, so filters and aggregates run in SQL
+    overall_rating = db.Column(db.Float)
+    sentiment_score = db.Column(db.Float)
+    sentiment_label = db.Column(db.String(20))
+    sentiment_confidence = db.Column(db.Float)
+    promotion_recommended = db.Column(db.Boolean)
+    promotion_confidence = db.Column(db.Float)
+
+    metrics = db.relationship('AssessmentMetric', backref='assessment',
+                              cascade='all, delete-orphan', passive_deletes=True)
+
+    __mapper_args__ = {'version_id_col': version}
 
     def __repr__(self):
         return f'<Assessment {self.employee_name} - {self.review_date}>'
 
+    @property
+    def etag(self):
+        return assessment_etag(self.id, self.version, self.analysis_version)
+
+    def store_analysis(self, result):
+        """Keep a successful pipeline result so views can serve it without re-analyzing."""
+        self.sentiment_analysis = json.dumps(result["sentiment_analysis"])
+        self.promotion_recommendation = json.dumps(result["promotion_recommendation"])
+        self.validation_report = result.get("validation_report") if result.get("validation_warning") else None
+        self.status = 'completed'
+        self.analysis_version = (self.analysis_version or 0) + 1
+
+    def stored_analysis(self):
+        """The last stored analysis in the pipeline's result shape, or None if never analyzed."""
+        if not self.analysis_version:
+            return None
+        def load(value):
+            return json.loads(value) if isinstance(value, str) else value
+        analysis = {
+            "status": "success",
+            "employee_id": str(self.id),
+            "sentiment_analysis": load(self.sentiment_analysis),
+            "promotion_recommendation": load(self.promotion_recommendation)
+        }
+        if self.validation_report is not None:
+            analysis["validation_warning"] = True
+            analysis["validation_report"] = load(self.validation_report)
+        return analysis
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -35,5 +94,109 @@ class Assessment(db.Model):
             'additional_comments': self.additional_comments,
             'review_date': self.review_date.isoformat(),
             'status': self.status,
-            'user_id': self.user_id
-        } 
\ No newline at end of file
+            'user_id': self.user_id,
+            'version': self.version,
+            'analysis_version': self.analysis_version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'overall_rating': self.overall_rating,
+            'sentiment_score': self.sentiment_score,
+            'sentiment_label': self.sentiment_label,
+            'sentiment_confidence': self.sentiment_confidence,
+            'promotion_recommended': self.promotion_recommended,
+            'promotion_confidence': self.promotion_confidence
+        }
+
+
+class AssessmentMetric(db.Model):
+    """One numeric performance metric of an assessment (e.g. teamwork=0.9)."""
+    __tablename__ = 'assessment_metric'
+    __table_args__ = (
+        db.UniqueConstraint('assessment_id', 'name', name='uq_assessment_metric_assessment_name'),
+        db.Index('ix_assessment_metric_name_value', 'name', 'value'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    assessment_id = db.Column(db.Integer, db.ForeignKey('assessment.id', ondelete='CASCADE'), nullable=False)
+    name = db.Column(db.String(50), nullable=False)
+    value = db.Column(db.Float, nullable=False)
+
+    def __repr__(self):
+        return f'<AssessmentMetric {self.assessment_id} {self.name}={self.value}>'
+
+
+def _document(value: Any) -> Dict[str, Any]:
+    """A JSON column's value as a dict; the app stores serialized text, sometimes encoded twice."""
+    for _ in range(2):
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def metric_values(performance_metrics: Any) -> Dict[str, float]:
+    """The numeric entries of a performance_metrics document, by metric name."""
+    values = {}
+    for name, value in _document(performance_metrics).items():
+        number = _number(value)
+        if number is not None and len(str(name)) <= 50:
+            values[str(name)] = number
+    return values
+
+
+def typed_columns(performance_metrics: Any, sentiment_analysis: Any, promotion_recommendation: Any) -> Dict[str, Any]:
+    """Typed column values derived from the three JSON documents."""
+    sentiment = _document(sentiment_analysis)
+    promotion = _document(promotion_recommendation)
+    label = sentiment.get('sentiment_label')
+    recommended = promotion.get('promotion_recommended')
+    return {
+        'overall_rating': _number(_document(performance_metrics).get('overall_rating')),
+        'sentiment_score': _number(sentiment.get('sentiment_score')),
+        'sentiment_label': str(label)[:20] if label is not None else None,
+        'sentiment_confidence': _number(sentiment.get('confidence')),
+        'promotion_recommended': recommended if isinstance(recommended, bool) else None,
+        'promotion_confidence': _number(promotion.get('confidence_score'))
+    }
+
+
+@event.listens_for(Session, 'before_flush')
+def _sync_typed_columns(session, flush_context, instances):
+    for instance in (*session.new, *session.dirty):
+        if not isinstance(instance, Assessment):
+            continue
+        attrs = inspect(instance).attrs
+        if not any(attrs[name].history.has_changes()
+                   for name in ('performance_metrics', 'sentiment_analysis', 'promotion_recommendation')):
+            continue
+        for name, value in typed_columns(instance.performance_metrics, instance.sentiment_analysis,
+                                         instance.promotion_recommendation).items():
+            setattr(instance, name, value)
+
+        if attrs.performance_metrics.history.has_changes():
+            # Update rows in place; replacing them would insert before deleting and hit the unique constraint
+            values = metric_values(instance.performance_metrics)
+            existing = {metric.name: metric for metric in instance.metrics}
+            for name, metric in existing.items():
+                if name in values:
+                    metric.value = values[name]
+                else:
+                    instance.metrics.remove(metric)
+            for name, value in values.items():
+                if name not in existing:
+                    instance.metrics.append(AssessmentMetric(name=name, value=value))
+
+
+def assessment_etag(assessment_id, version, analysis_version):
+    """Strong validator for one assessment's stored data and analysis."""
+    return f"assessment-{assessment_id}-{version}-{analysis_version}" 
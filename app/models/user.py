@@ -26,4 +26,4 @@ class User(UserMixin, db.Model):
         return check_password_hash(self.password_hash, password)
 
     def get_assessments(self):
-        return self.assessments.order_by(Assessment.created_at.desc()) 
\ No newline at end of file
+        return self.assessments.order_by(Assessment.review_date.desc()) 
\ No newline at end of file
@@ -0,0 +1,177 @@
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from flask_login import login_required, current_user
+from app.workflows.assessment_queries import InvalidQuery, assessment_by_id, list_assessments_page, parse_date, parse_fields
+from app.workflows.assessment_search import search_assessments
+from app.workflows.employee_timeline import DEFAULT_ROLLING_WINDOW, get_employee_timeline
+from app.workflows.assessment_export import EXPORT_FORMATS, EXPORT_MIMETYPES, export_assessments
+from app.workflows.bulk_import import IMPORT_FORMATS, analyze_imported_assessments, detect_format, import_assessments
+from app.workflows.event_loop import get_background_loop
+from app.workflows.engines import pool_metrics
+from app.routes.main import get_pipeline
+from app.routes.conditional import assessment_validators, not_modified, not_modified_response, precondition_failed, representation_etag, with_validators
+import io
+
+api = Blueprint('api', __name__)
+
+@api.route('/assessments')
+@login_required
+def list_assessments():
+    """List the current user's assessments, newest first, with keyset pagination.
+
+    Query parameters: limit, cursor (from the previous page's next_cursor),
+    department, position, status, start_date, end_date and fields (a
+    comma-separated projection).
+    """
+    try:
+        limit = request.args.get('limit', current_app.config['ITEMS_PER_PAGE'], type=int)
+        page = list_assessments_page(
+            current_user.id,
+            current_app.secret_key,
+            limit,
+            cursor=request.args.get('cursor'),
+            fields=parse_fields(request.args.get('fields')),
+            department=request.args.get('department'),
+            position=request.args.get('position'),
+            status=request.args.get('status'),
+            start_date=parse_date(request.args.get('start_date'), 'start_date'),
+            end_date=parse_date(request.args.get('end_date'), 'end_date')
+        )
+        # Pages have no single row version, so validate on the body itself
+        response = jsonify(page)
+        response.add_etag()
+        return response.make_conditional(request)
+    except InvalidQuery as e:
+        return jsonify({"error": str(e)}), 400
+
+@api.route('/db-pool-metrics')
+@login_required
+def db_pool_metrics():
+    """Connection pool usage per engine; admins only, the keys are the (password-masked) engine URLs."""
+    if not current_user.is_admin:
+        return jsonify({"error": "Permission denied"}), 403
+    return jsonify(pool_metrics())
+
+@api.route('/assessments/search')
+@login_required
+def search_assessments_endpoint():
+    """Ranked full-text search over the current user's assessments.
+
+    Query parameters: q, limit and offset (from the previous page's
+    next_offset). Each item carries an HTML snippet with matches in <mark>.
+    """
+    try:
+        results = search_assessments(
+            current_user.id,
+            request.args.get('q', ''),
+            limit=request.args.get('limit', current_app.config['ITEMS_PER_PAGE'], type=int),
+            offset=request.args.get('offset', 0, type=int)
+        )
+        return jsonify(results)
+    except InvalidQuery as e:
+        return jsonify({"error": str(e)}), 400
+
+@api.route('/employees/<employee_id>/timeline')
+@login_required
+def employee_timeline(employee_id):
+    """An employee's assessments with quarter-over-quarter deltas, rolling averages
+    (over `window` reviews) and rank within their department, all computed in SQL.
+    """
+    window = request.args.get('window', DEFAULT_ROLLING_WINDOW, type=int)
+    timeline = get_employee_timeline(current_user.id, employee_id, window)
+    if not timeline:
+        return jsonify({"error": "No assessments found for this employee"}), 404
+    return jsonify({"employee_id": employee_id, "window": window, "items": timeline})
+
+@api.route('/assessments/export')
+@login_required
+def export_assessments_endpoint():
+    """Stream the current user's assessments as a CSV or NDJSON download.
+
+    Query parameters: format (csv or ndjson), gzip=true, fields and the same
+    filters as the listing. Rows are read with a server-side cursor and sent
+    as a chunked response, so large exports start immediately.
+    """
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(EXPORT_FORMATS)}"}), 400
+    compress = request.args.get('gzip', 'false').lower() == 'true'
+    try:
+        chunks = export_assessments(
+            current_user.id,
+            fmt,
+            fields=parse_fields(request.args.get('fields')),
+            compress=compress,
+            department=request.args.get('department'),
+            position=request.args.get('position'),
+            status=request.args.get('status'),
+            start_date=parse_date(request.args.get('start_date'), 'start_date'),
+            end_date=parse_date(request.args.get('end_date'), 'end_date')
+        )
+    except InvalidQuery as e:
+        return jsonify({"error": str(e)}), 400
+
+    filename = f"assessments.{fmt}" + (".gz" if compress else "")
+    return Response(
+        stream_with_context(chunks),
+        mimetype='application/gzip' if compress else EXPORT_MIMETYPES[fmt],
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'Cache-Control': 'no-store',
+            # Stop reverse proxies from buffering the whole export
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@api.route('/assessments/<int:id>')
+@login_required
+def get_assessment(id):
+    """One assessment as JSON, answering 304 from the version columns when unchanged
+    and 412 when an If-Match names a version that is no longer current.
+    """
+    validators = assessment_validators(id)
+    if validators is None or validators[0] != current_user.id:
+        return jsonify({"error": "Assessment not found"}), 404
+    etag = representation_etag(validators[1], 'json')
+    if precondition_failed(etag):
+        return with_validators(jsonify({"error": "Assessment has changed"}), etag, validators[2]), 412
+    if not_modified(etag, validators[2]):
+        return not_modified_response(etag, validators[2])
+
+    assessment = assessment_by_id(id)
+    response = jsonify(assessment.to_dict())
+    return with_validators(response, representation_etag(assessment.etag, 'json'), assessment.updated_at)
+
+@api.route('/assessments/import', methods=['POST'])
+@login_required
+def import_assessments_endpoint():
+    """Bulk import assessments from a JSONL or CSV upload (multipart `file` or raw body).
+
+    The body is parsed as a stream and inserted in batches; bodies larger than
+    MAX_CONTENT_LENGTH are rejected with 413, use import_assessments.py for
+    bigger files. With `analyze=true` the imported rows are queued for analysis
+    on the background event loop.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        binary, fmt = upload.stream, detect_format(upload.filename, upload.mimetype)
+    else:
+        binary, fmt = request.stream, detect_format(content_type=request.mimetype)
+    fmt = request.args.get('format', fmt)
+    if fmt not in IMPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(IMPORT_FORMATS)}"}), 400
+
+    analyze = request.args.get('analyze', 'false').lower() == 'true'
+    stream = io.TextIOWrapper(binary, encoding='utf-8', newline='')
+    try:
+        result = import_assessments(stream, fmt, current_user.id, return_ids=analyze)
+    except UnicodeDecodeError:
+        return jsonify({"error": "upload must be UTF-8 encoded"}), 400
+
+    if analyze and result["ids"]:
+        get_background_loop().submit(
+            analyze_imported_assessments(current_app._get_current_object(), get_pipeline(), result["ids"])
+        )
+        result["analysis_queued"] = len(result["ids"])
+    result.pop("ids")
+    status = 200 if result["imported"] or not result["total"] else 400
+    return jsonify(result), status
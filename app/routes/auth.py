@@ -3,6 +3,7 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash
 from app import db
 from app.models.user import User
+from app.workflows.user_cache import user_by_email, user_by_username
 
 auth = Blueprint('auth', __name__)
 
@@ -16,7 +17,7 @@ def login():
         password = request.form.get('password')
         remember = True if request.form.get('remember') else False
         
-        user = User.query.filter_by(username=username).first()
+        user = user_by_username(username)
         
         if not user or not user.check_password(password):
             flash('Please check your login details and try again.')
@@ -45,12 +46,12 @@ def register():
         password = request.form.get('password')
         
         # Check if user already exists
-        user = User.query.filter_by(username=username).first()
+        user = user_by_username(username)
         if user:
             flash('Username already exists')
             return redirect(url_for('auth.register'))
         
-        user = User.query.filter_by(email=email).first()
+        user = user_by_email(email)
         if user:
             flash('Email address already registered')
             return redirect(url_for('auth.register'))
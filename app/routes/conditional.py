@@ -0,0 +1,55 @@
+from flask import current_app, request, session
+from werkzeug.http import is_resource_modified
+from app import db
+from app.models import Assessment
+from app.models.assessment import assessment_etag
+from typing import Any, Optional, Tuple
+from datetime import datetime
+
+
+def assessment_validators(assessment_id: int) -> Optional[Tuple[int, str, datetime]]:
+    """Owner, ETag and Last-Modified for an assessment without loading its text or analysis."""
+    row = db.session.query(
+        Assessment.user_id,
+        Assessment.version,
+        Assessment.analysis_version,
+        Assessment.updated_at
+    ).filter(Assessment.id == assessment_id).first()
+    if row is None:
+        return None
+    return row.user_id, assessment_etag(assessment_id, row.version, row.analysis_version), row.updated_at
+
+
+def representation_etag(etag: str, representation: str) -> str:
+    """HTML and JSON bodies differ, so each gets its own strong validator."""
+    return f"{etag}-{representation}"
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """True when the client's If-None-Match/If-Modified-Since still match.
+
+    A page with pending flash messages is never answered with 304, the
+    messages would otherwise never be shown.
+    """
+    if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+        return False
+    return not is_resource_modified(request.environ, etag=etag, last_modified=last_modified)
+
+
+def precondition_failed(etag: str) -> bool:
+    """True when the request carries an If-Match that the current ETag does not satisfy."""
+    return bool(request.if_match) and not request.if_match.contains(etag)
+
+
+def with_validators(response: Any, etag: str, last_modified: Optional[datetime]):
+    """Attach ETag/Last-Modified and make clients revalidate before reusing the body."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]):
+    return with_validators(current_app.response_class(status=304), etag, last_modified)
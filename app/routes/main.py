@@ -1,14 +1,19 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, abort, make_response
 from flask_login import login_required, current_user
+from sqlalchemy.orm.exc import StaleDataError
 from app import db
 from app.models import Assessment
 from app.forms import AssessmentForm
 from app.workflows.assessment_pipeline import AssessmentPipeline
 from app.workflows.db_utils import add_review_to_vector_store, get_review_statistics
+from app.workflows.event_loop import run_async
+from app.workflows.dashboard_stats import get_dashboard_stats
+from app.workflows.assessment_queries import assessment_by_id
+from app.routes.conditional import assessment_validators, not_modified, not_modified_response, representation_etag, with_validators
 from datetime import datetime
 import os
-import asyncio
 import logging
+import threading
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -16,11 +21,20 @@ logger.setLevel(logging.INFO)
 
 main = Blueprint('main', __name__)
 
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
 def get_pipeline():
-    return AssessmentPipeline(
-        db_connection_string=os.getenv('DATABASE_URL'),
-        openai_api_key=os.getenv('OPENAI_API_KEY')
-    )
+    """Return the worker's shared pipeline so its clients and vector store persist across requests."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = AssessmentPipeline(
+                    db_connection_string=os.getenv('DATABASE_URL'),
+                    openai_api_key=os.getenv('OPENAI_API_KEY')
+                )
+    return _pipeline
 
 @main.route('/')
 def index():
@@ -31,7 +45,8 @@ def index():
 def dashboard():
     # Get review statistics
     stats = get_review_statistics(os.getenv('DATABASE_URL'))
-    return render_template('dashboard.html', stats=stats)
+    summary = get_dashboard_stats(current_user.id)
+    return render_template('dashboard.html', stats=stats, summary=summary)
 
 @main.route('/assessment/new', methods=['GET', 'POST'])
 @login_required
@@ -92,6 +107,7 @@ def new_assessment():
                 review_text,
                 {
                     "employee_id": str(assessment.id),
+                    "assessment_id": assessment.id,
                     "department": form.department.data,
                     "position": form.position.data
                 }
@@ -99,11 +115,8 @@ def new_assessment():
             
             return result
 
-        # Run the async function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(process_assessment())
-        loop.close()
+        # Run on the shared background event loop
+        result = run_async(process_assessment())
 
         if result["status"] == "success":
             flash('Assessment created and analyzed successfully!', 'success')
@@ -116,13 +129,26 @@ def new_assessment():
 @main.route('/assessment/<int:id>')
 @login_required
 def view_assessment(id):
+    # Answer revalidation from the version columns alone, before loading the review
+    validators = assessment_validators(id)
+    if validators is None:
+        abort(404)
+    owner_id, etag, last_modified = validators
+    if owner_id != current_user.id:
+        flash('You do not have permission to view this assessment.', 'danger')
+        return redirect(url_for('main.dashboard'))
+    etag = representation_etag(etag, 'html')
+    if not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
     try:
-        assessment = Assessment.query.get_or_404(id)
-        if assessment.user_id != current_user.id:
-            flash('You do not have permission to view this assessment.', 'danger')
-            return redirect(url_for('main.dashboard'))
+        assessment = assessment_by_id(id) or abort(404)
+        analysis = assessment.stored_analysis()
+        if analysis is not None:
+            response = make_response(render_template('view_assessment.html', assessment=assessment, analysis=analysis))
+            return with_validators(response, representation_etag(assessment.etag, 'html'), assessment.updated_at)
 
-        # Get the analysis results
+        # Not analyzed yet: run the pipeline once and keep the result
         pipeline = get_pipeline()
         try:
             metrics = pipeline.get_performance_metrics(assessment.employee_name)
@@ -132,7 +158,7 @@ def view_assessment(id):
             flash('Error retrieving performance metrics.', 'warning')
             metrics = {}
         
-        # Run the pipeline asynchronously to get fresh analysis
+        # Run the pipeline asynchronously to get the analysis
         async def get_analysis():
             try:
                 review_text = f"""
@@ -169,16 +195,25 @@ def view_assessment(id):
                 logger.error(f"Error in analysis: {str(e)}")
                 return None
 
-        # Run the async function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        analysis = loop.run_until_complete(get_analysis())
-        loop.close()
+        # Run on the shared background event loop
+        analysis = run_async(get_analysis())
 
         if analysis is None:
             flash('Unable to analyze the assessment. Please try again later.', 'warning')
             return render_template('view_assessment.html', assessment=assessment, analysis=None)
 
+        if analysis.get("status") == "success":
+            assessment.store_analysis(analysis)
+            try:
+                db.session.commit()
+            except StaleDataError:
+                # Another request edited or analyzed it meanwhile; show whatever it stored
+                db.session.rollback()
+                logger.warning(f"Assessment {id} changed during analysis, reloading")
+                return redirect(url_for('main.view_assessment', id=id))
+            response = make_response(render_template('view_assessment.html', assessment=assessment, analysis=analysis))
+            return with_validators(response, representation_etag(assessment.etag, 'html'), assessment.updated_at)
+
         return render_template('view_assessment.html', assessment=assessment, analysis=analysis)
     except Exception as e:
         logger.error(f"Error viewing assessment: {str(e)}")
@@ -188,7 +223,7 @@ def view_assessment(id):
 @main.route('/assessment/<int:id>/edit', methods=['GET', 'POST'])
 @login_required
 def edit_assessment(id):
-    assessment = Assessment.query.get_or_404(id)
+    assessment = assessment_by_id(id) or abort(404)
     if assessment.user_id != current_user.id:
         flash('You do not have permission to edit this assessment.', 'danger')
         return redirect(url_for('main.dashboard'))
@@ -205,7 +240,12 @@ def edit_assessment(id):
         assessment.goals = form.goals.data
         assessment.comments = form.comments.data
         assessment.updated_at = datetime.utcnow()
-        db.session.commit()
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            flash('This assessment was changed while you were editing it. Please review it and save again.', 'warning')
+            return redirect(url_for('main.edit_assessment', id=id))
 
         # Update the vector store with the new version
         pipeline = get_pipeline()
@@ -234,17 +274,15 @@ def edit_assessment(id):
                 review_text,
                 {
                     "employee_id": str(assessment.id),
+                    "assessment_id": assessment.id,
                     "department": form.department.data,
                     "position": form.position.data,
                     "is_update": True
                 }
             )
 
-        # Run the async function
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(update_vector_store())
-        loop.close()
+        # Run on the shared background event loop
+        run_async(update_vector_store())
 
         flash('Assessment updated successfully!', 'success')
         return redirect(url_for('main.view_assessment', id=assessment.id))
@@ -267,7 +305,7 @@ def edit_assessment(id):
 @login_required
 def analyze_assessment(id):
     """Endpoint to manually trigger analysis of an assessment."""
-    assessment = Assessment.query.get_or_404(id)
+    assessment = assessment_by_id(id) or abort(404)
     if assessment.user_id != current_user.id:
         return jsonify({"error": "Permission denied"}), 403
 
@@ -300,13 +338,16 @@ def analyze_assessment(id):
             performance_metrics=metrics
         )
 
-    # Run the async function
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    result = loop.run_until_complete(run_analysis())
-    loop.close()
+    # Run on the shared background event loop
+    result = run_async(run_analysis())
 
     if result["status"] == "success":
+        assessment.store_analysis(result)
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            return jsonify({"error": "Assessment was changed by another request, please try again"}), 409
         return jsonify(result)
     else:
         return jsonify({"error": result["error"]}), 500 
\ No newline at end of file
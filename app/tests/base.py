@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from config import Config
+from app import create_app
+from app.models import db, User, Assessment
+from app.workflows.dashboard_stats import invalidate_dashboard_stats
+from app.workflows.user_cache import invalidate_user
+
+
+class AppTestCase(unittest.TestCase):
+    """Runs each test against a fresh SQLite database in a temporary directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+        class TestConfig(Config):
+            TESTING = True
+            WTF_CSRF_ENABLED = False
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(self.tmpdir, 'test.db')
+            VECTOR_STORE_PATH = os.path.join(self.tmpdir, 'vector_store')
+            ASSESSMENT_ARCHIVE_PATH = os.path.join(self.tmpdir, 'assessment_archive')
+
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.client = self.app.test_client()
+        self.user = self.create_user('reviewer')
+
+    def tearDown(self):
+        db.session.remove()
+        db.engine.dispose()
+        self.app_context.pop()
+        # The caches are process-wide and ids repeat across the per-test databases
+        invalidate_user()
+        invalidate_dashboard_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def create_user(self, username: str, is_admin: bool = False) -> User:
+        user = User(username=username, email=f'{username}@example.com', is_admin=is_admin)
+        user.set_password('password')
+        db.session.add(user)
+        db.session.commit()
+        return user
+
+    def create_assessment(self, **fields) -> Assessment:
+        values = {
+            'employee_id': 'EMP001',
+            'employee_name': 'Jane Doe',
+            'department': 'Engineering',
+            'position': 'Developer',
+            'review_text': 'Consistently delivers high quality work.',
+            'performance_metrics': '{}',
+            'sentiment_analysis': '{}',
+            'promotion_recommendation': '{}',
+            'user_id': self.user.id,
+        }
+        values.update(fields)
+        assessment = Assessment(**values)
+        db.session.add(assessment)
+        db.session.commit()
+        return assessment
+
+    def login(self, user: User = None):
+        with self.client.session_transaction() as session:
+            session['_user_id'] = str((user or self.user).id)
+            session['_fresh'] = True
@@ -0,0 +1,54 @@
+import unittest
+
+from app.models import db
+from app.tests.base import AppTestCase
+
+
+class TestAssessmentApi(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.assessment = self.create_assessment()
+        self.login()
+
+    def test_get_returns_validators(self):
+        response = self.client.get(f'/api/assessments/{self.assessment.id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['employee_id'], 'EMP001')
+        self.assertTrue(response.headers['ETag'])
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get(f'/api/assessments/{self.assessment.id}').headers['ETag']
+        response = self.client.get(f'/api/assessments/{self.assessment.id}', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_edit_changes_etag(self):
+        etag = self.client.get(f'/api/assessments/{self.assessment.id}').headers['ETag']
+        self.assessment.department = 'Sales'
+        db.session.commit()
+        response = self.client.get(f'/api/assessments/{self.assessment.id}', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.get_json()['department'], 'Sales')
+
+    def test_if_match(self):
+        etag = self.client.get(f'/api/assessments/{self.assessment.id}').headers['ETag']
+        response = self.client.get(f'/api/assessments/{self.assessment.id}', headers={'If-Match': etag})
+        self.assertEqual(response.status_code, 200)
+
+        self.assessment.department = 'Sales'
+        db.session.commit()
+        response = self.client.get(f'/api/assessments/{self.assessment.id}', headers={'If-Match': etag})
+        self.assertEqual(response.status_code, 412)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_other_users_assessment_is_not_found(self):
+        self.login(self.create_user('other'))
+        response = self.client.get(f'/api/assessments/{self.assessment.id}')
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
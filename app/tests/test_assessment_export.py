@@ -0,0 +1,53 @@
+import csv
+import gzip
+import io
+import json
+import unittest
+
+from app.workflows.assessment_export import serialize_rows
+from app.tests.base import AppTestCase
+
+
+class TestAssessmentExport(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        for n in range(3):
+            self.create_assessment(employee_id=f'EMP{n}', department='Sales' if n else 'Engineering',
+                                   performance_metrics=json.dumps({"overall_rating": n}))
+        self.create_assessment(user_id=self.create_user('other').id)
+        self.login()
+
+    def test_csv_export(self):
+        response = self.client.get('/api/assessments/export', query_string={'format': 'csv', 'fields': 'employee_id,department'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/csv')
+        self.assertIn('attachment; filename="assessments.csv"', response.headers['Content-Disposition'])
+        rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+        self.assertEqual(rows[0], ['id', 'employee_id', 'department'])
+        self.assertEqual([row[1] for row in rows[1:]], ['EMP0', 'EMP1', 'EMP2'])
+
+    def test_gzipped_ndjson_export(self):
+        response = self.client.get('/api/assessments/export', query_string={'format': 'ndjson', 'gzip': 'true', 'department': 'Sales'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/gzip')
+        self.assertIn('assessments.ndjson.gz', response.headers['Content-Disposition'])
+        lines = gzip.decompress(response.data).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record['employee_id'] for record in records], ['EMP1', 'EMP2'])
+        # Stored JSON text is nested as objects rather than strings
+        self.assertEqual(records[1]['performance_metrics'], {"overall_rating": 2})
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.get('/api/assessments/export', query_string={'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_serialize_rows_chunks(self):
+        rows = [{"id": n, "employee_id": f"EMP{n}"} for n in range(50)]
+        chunks = list(serialize_rows(rows, "ndjson", ["id", "employee_id"], chunk_size=100))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(len("".join(chunks).splitlines()), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
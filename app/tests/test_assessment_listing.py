@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime, timedelta
+
+from app.workflows.assessment_queries import encode_cursor
+from app.tests.base import AppTestCase
+
+
+class TestAssessmentListing(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        start = datetime(2024, 1, 1)
+        # Two rows share a review date so the id tie-breaker is exercised
+        dates = [start + timedelta(days=day) for day in (0, 1, 1, 2, 3)]
+        self.ids = [self.create_assessment(employee_id=f'EMP{n}', review_date=date).id for n, date in enumerate(dates)]
+        self.create_assessment(user_id=self.create_user('other').id)
+        self.login()
+
+    def _page(self, **params):
+        response = self.client.get('/api/assessments', query_string=params)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_cursor_round_trip_visits_every_row_once(self):
+        seen, cursor = [], None
+        while True:
+            page = self._page(limit=2, **({'cursor': cursor} if cursor else {}))
+            seen.extend(item['id'] for item in page['items'])
+            if not page['has_more']:
+                self.assertIsNone(page['next_cursor'])
+                break
+            cursor = page['next_cursor']
+        # Newest first, ties on review_date broken by the higher id
+        self.assertEqual(seen, [self.ids[4], self.ids[3], self.ids[2], self.ids[1], self.ids[0]])
+
+    def test_fields_projection(self):
+        page = self._page(limit=1, fields='employee_id')
+        self.assertEqual(set(page['items'][0]), {'id', 'employee_id'})
+        response = self.client.get('/api/assessments', query_string={'fields': 'password'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_tampered_cursor_is_rejected(self):
+        cursor = self._page(limit=2)['next_cursor']
+        payload, signature = cursor.rsplit('.', 1)
+        tampered = encode_cursor(self.app.secret_key, datetime(2030, 1, 1), 1).rsplit('.', 1)[0] + '.' + signature
+        for bad in (tampered, payload + '.' + signature[::-1], 'not-a-cursor',
+                    encode_cursor('another-secret', datetime(2024, 1, 2), self.ids[2])):
+            response = self.client.get('/api/assessments', query_string={'cursor': bad})
+            self.assertEqual(response.status_code, 400, bad)
+            self.assertIn('Invalid cursor', response.get_json()['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from app.models import db
+from app.tests.base import AppTestCase
+
+
+class TestAssessmentSearch(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.body_match = self.create_assessment(
+            employee_name='Alex Kim', review_text='Communicates clearly with <b>stakeholders</b>.')
+        self.name_match = self.create_assessment(
+            employee_name='Robin Communicator', review_text='Ships reliable code.')
+        self.unrelated = self.create_assessment(review_text='Improved the deployment pipeline.')
+        self.create_assessment(user_id=self.create_user('other').id, review_text='Communication is strong.')
+        self.login()
+
+    def _search(self, **params):
+        response = self.client.get('/api/assessments/search', query_string=params)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_ranked_stemmed_matches_for_current_user(self):
+        results = self._search(q='communicating')
+        # The name column weighs more than the review body
+        self.assertEqual([item['id'] for item in results['items']], [self.name_match.id, self.body_match.id])
+        self.assertFalse(results['has_more'])
+
+    def test_snippet_is_escaped_and_highlighted(self):
+        snippet = self._search(q='stakeholders')['items'][0]['snippet']
+        self.assertIn('<mark>stakeholders</mark>', snippet)
+        self.assertIn('&lt;b&gt;', snippet)
+        self.assertNotIn('<b>', snippet)
+
+    def test_index_follows_edits_and_deletes(self):
+        self.unrelated.review_text = 'Mentors new hires on communication.'
+        db.session.commit()
+        self.assertEqual(len(self._search(q='communication')['items']), 3)
+        db.session.delete(self.body_match)
+        db.session.commit()
+        self.assertEqual(len(self._search(q='communication')['items']), 2)
+
+    def test_paging(self):
+        first = self._search(q='communicate', limit=1)
+        self.assertTrue(first['has_more'])
+        second = self._search(q='communicate', limit=1, offset=first['next_offset'])
+        self.assertFalse(second['has_more'])
+        self.assertNotEqual(first['items'][0]['id'], second['items'][0]['id'])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(self._search(q='pipeline" OR NEAR(')['items'], [])
+        for query in ('', '"*()'):
+            response = self.client.get('/api/assessments/search', query_string={'q': query})
+            self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+import unittest
+from sqlalchemy import text
+
+from app.models import db, Assessment
+from app.workflows.bulk_import import COPY_COLUMNS, _copy_buffer, insert_batch, validate_record
+from app.tests.base import AppTestCase
+
+
+RECORD = {
+    "employee_id": "EMP042",
+    "employee_name": "Sam Lee",
+    "department": "Sales",
+    "position": "Account Executive",
+    "review_text": "Closed the largest deal of the quarter.",
+    "performance_metrics": {"overall_rating": 4.5},
+    "sentiment_analysis": {"sentiment_label": "positive", "sentiment_score": 0.9},
+    "promotion_recommendation": {"promotion_recommended": True},
+    "status": "completed",
+}
+
+
+class TestBulkImport(AppTestCase):
+    def _copy_into_table(self, row):
+        # What COPY ... FROM STDIN stores: each CSV cell as literal column text, no bind processing
+        cells = next(csv.reader(_copy_buffer([row])))
+        params = {column: (cell if cell != "" else None) for column, cell in zip(COPY_COLUMNS, cells)}
+        db.session.execute(
+            text(f"INSERT INTO assessment ({', '.join(COPY_COLUMNS)}, version) "
+                 f"VALUES ({', '.join(':' + column for column in COPY_COLUMNS)}, 1)"),
+            params
+        )
+        db.session.commit()
+
+    def test_copy_row_reads_back_like_orm_rows(self):
+        row = validate_record(RECORD, self.user.id)
+        self._copy_into_table(row)
+        insert_batch([validate_record(RECORD, self.user.id)])
+        db.session.commit()
+
+        copied, inserted = Assessment.query.order_by(Assessment.id).all()
+        for field in ("performance_metrics", "sentiment_analysis", "promotion_recommendation"):
+            self.assertEqual(getattr(copied, field), getattr(inserted, field))
+            self.assertEqual(json.loads(getattr(copied, field)), RECORD[field])
+        self.assertEqual(copied.overall_rating, 4.5)
+        self.assertEqual(copied.analysis_version, 1)
+
+    def test_import_endpoint_reports_invalid_lines(self):
+        self.login()
+        body = "\n".join([
+            json.dumps(RECORD),
+            "{not json",
+            json.dumps({**RECORD, "employee_id": "", "status": "archived"}),
+            json.dumps({**RECORD, "employee_id": "EMP043"}),
+        ])
+        response = self.client.post('/api/assessments/import', data=body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        result = response.get_json()
+        self.assertEqual((result["total"], result["imported"], result["failed"]), (4, 2, 2))
+        self.assertEqual([error["line"] for error in result["errors"]], [2, 3])
+        self.assertIn("invalid JSON", result["errors"][0]["error"])
+        self.assertIn("missing employee_id", result["errors"][1]["error"])
+        self.assertIn("status must be one of", result["errors"][1]["error"])
+        self.assertEqual(Assessment.query.count(), 2)
+
+    def test_import_endpoint_rejects_all_invalid_upload(self):
+        self.login()
+        response = self.client.post(
+            '/api/assessments/import',
+            data={"file": (io.BytesIO(b"employee_id,employee_name\n,Nobody\n"), "reviews.csv")},
+            content_type='multipart/form-data'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["failed"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
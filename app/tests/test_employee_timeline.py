@@ -0,0 +1,47 @@
+import json
+import unittest
+from datetime import datetime
+
+from app.tests.base import AppTestCase
+
+
+class TestEmployeeTimeline(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        for month, rating in ((1, 2), (4, 4), (7, 3), (10, 5)):
+            self._review('EMP1', datetime(2024, month, 15), rating)
+        # A peer reviewed in the second quarter outranks EMP1 there
+        self._review('EMP2', datetime(2024, 5, 1), 4.5)
+        self._review('EMP3', datetime(2024, 5, 1), 1, department='Sales')
+        self.login()
+
+    def _review(self, employee_id, review_date, rating, department='Engineering'):
+        return self.create_assessment(
+            employee_id=employee_id, department=department, review_date=review_date,
+            performance_metrics=json.dumps({"overall_rating": rating})
+        )
+
+    def _timeline(self, **params):
+        response = self.client.get('/api/employees/EMP1/timeline', query_string=params)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['items']
+
+    def test_deltas_and_department_rank(self):
+        items = self._timeline()
+        self.assertEqual([item['review_quarter'] for item in items], ['2024Q1', '2024Q2', '2024Q3', '2024Q4'])
+        self.assertEqual([item['rating_delta'] for item in items], [None, 2.0, -1.0, 2.0])
+        self.assertEqual((items[1]['department_rank'], items[1]['department_size']), (2, 2))
+        self.assertEqual((items[0]['department_rank'], items[0]['department_size']), (1, 1))
+
+    def test_rolling_window(self):
+        self.assertEqual([item['rolling_rating'] for item in self._timeline(window=2)], [2.0, 3.0, 3.5, 4.0])
+        self.assertEqual([item['rolling_rating'] for item in self._timeline(window=3)], [2.0, 3.0, 3.0, 4.0])
+        self.assertEqual([item['rolling_rating'] for item in self._timeline(window=1)], [2.0, 4.0, 3.0, 5.0])
+
+    def test_unknown_employee(self):
+        response = self.client.get('/api/employees/EMP9/timeline')
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
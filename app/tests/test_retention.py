@@ -0,0 +1,72 @@
+import os
+import unittest
+from datetime import datetime
+
+from app.models import db, Assessment
+from app.workflows.retention import (
+    ARCHIVE_FIELDS, _write_archive_file, archive_assessments, archived_ids, archived_years, query_archive
+)
+from app.tests.base import AppTestCase
+
+
+class TestRetention(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.archive_path = os.path.join(self.tmpdir, 'archive')
+        self.old = [self.create_assessment(employee_id=f'EMP{n}', review_date=datetime(2020 + n % 2, 3, 1)).id
+                    for n in range(5)]
+        self.recent = self.create_assessment(review_date=datetime(2024, 6, 1)).id
+        self.cutoff = datetime(2023, 1, 1)
+
+    def test_after_delete_sees_committed_batches(self):
+        calls = []
+
+        def after_delete(ids):
+            # Another connection must already see the batch gone
+            with db.engine.connect() as connection:
+                remaining = connection.execute(Assessment.__table__.select().where(Assessment.id.in_(ids))).all()
+            calls.append((ids, remaining))
+
+        result = archive_assessments(self.archive_path, self.cutoff, batch_size=2, after_delete=after_delete)
+        self.assertEqual(result['archived'], 5)
+        self.assertEqual(result['years'], [2020, 2021])
+        self.assertEqual([ids for ids, _ in calls], [self.old[0:2], self.old[2:4], self.old[4:]])
+        self.assertTrue(all(remaining == [] for _, remaining in calls))
+        self.assertEqual([a.id for a in Assessment.query.all()], [self.recent])
+
+    def test_failed_after_delete_keeps_archived_batch_recoverable(self):
+        def after_delete(ids):
+            raise RuntimeError("vector store unavailable")
+
+        with self.assertRaises(RuntimeError):
+            archive_assessments(self.archive_path, self.cutoff, batch_size=2, after_delete=after_delete)
+        # The first batch is archived and deleted; its ids can be replayed
+        self.assertEqual(Assessment.query.count(), 4)
+        self.assertEqual(list(archived_ids(self.archive_path)), [self.old[0:2]])
+
+    def test_query_archive_dedups_rearchived_batch(self):
+        # An earlier run wrote a file for this batch and stopped before its delete
+        interrupted = [
+            {field: getattr(db.session.get(Assessment, assessment_id), field) for field in ARCHIVE_FIELDS}
+            for assessment_id in self.old[:3]
+        ]
+        for year in {row['review_date'].year for row in interrupted}:
+            _write_archive_file(self.archive_path, year, [row for row in interrupted if row['review_date'].year == year],
+                                'assessments-interrupted-00000.ndjson.gz')
+
+        archive_assessments(self.archive_path, self.cutoff, batch_size=2)
+        self.assertEqual(archived_years(self.archive_path), [2020, 2021])
+        rows = list(query_archive(self.archive_path))
+        self.assertEqual(sorted(row['id'] for row in rows), self.old)
+        self.assertEqual([row['employee_id'] for row in query_archive(self.archive_path, years=[2021])], ['EMP1', 'EMP3'])
+        self.assertEqual(sorted(sum(archived_ids(self.archive_path, batch_size=2), [])), self.old)
+
+    def test_dry_run_changes_nothing(self):
+        result = archive_assessments(self.archive_path, self.cutoff, dry_run=True)
+        self.assertEqual(result['archived'], 5)
+        self.assertEqual(Assessment.query.count(), 6)
+        self.assertEqual(archived_years(self.archive_path), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+from typing import Optional
+
+from .base import VectorBackend, MetadataFilter, matches_filter
+from .numpy_backend import LocalNumpyBackend
+
+VECTOR_BACKENDS = ("numpy", "faiss", "pgvector", "pinecone")
+
+
+def create_vector_backend(name: Optional[str] = None, index_name: str = "default", dimension: int = 384, **options) -> VectorBackend:
+    """Create the vector backend selected by `name` or the VECTOR_BACKEND setting.
+
+    `index_name` separates independent indexes: a subdirectory for the local
+    backend, a namespace for pgvector and the index name for Pinecone. Extra
+    options override the configured connection settings.
+    """
+    from config import Config
+
+    name = name or Config.VECTOR_BACKEND
+    if name == "numpy":
+        path = options.pop("path", None) or os.path.join(Config.VECTOR_STORE_PATH, index_name)
+        return LocalNumpyBackend(path, dimension, **options)
+    if name == "faiss":
+        # Optional dependency, only imported when selected
+        from .faiss_backend import FaissBackend
+        return FaissBackend(dimension)
+    if name == "pgvector":
+        from .pgvector_backend import PGVectorBackend
+        connection_string = options.pop("connection_string", None) or Config.VECTOR_DATABASE_URL
+        return PGVectorBackend(connection_string, dimension, namespace=index_name, **options)
+    if name == "pinecone":
+        from .pinecone_backend import PineconeBackend
+        api_key = options.pop("api_key", None) or Config.PINECONE_API_KEY
+        environment = options.pop("environment", None) or Config.PINECONE_ENV
+        return PineconeBackend(index_name, dimension, api_key, environment, **options)
+    raise ValueError(f"Unknown vector backend '{name}', expected one of {VECTOR_BACKENDS}")
+
+
+__all__ = [
+    "VectorBackend",
+    "MetadataFilter",
+    "matches_filter",
+    "LocalNumpyBackend",
+    "VECTOR_BACKENDS",
+    "create_vector_backend",
+]
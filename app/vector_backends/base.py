@@ -0,0 +1,115 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+# Filters use the Pinecone metadata filter subset: {"field": value} or
+# {"field": {"$eq" | "$ne" | "$in" | "$nin" | "$gt" | "$gte" | "$lt" | "$lte": value}}
+MetadataFilter = Dict[str, Any]
+
+FILTER_OPERATORS = ("$eq", "$ne", "$in", "$nin", "$gt", "$gte", "$lt", "$lte")
+
+
+def normalize_condition(condition: Any) -> Dict[str, Any]:
+    """Expand a bare filter value into its {"$eq": value} form and validate operators."""
+    if not isinstance(condition, dict):
+        return {"$eq": condition}
+    unknown = set(condition) - set(FILTER_OPERATORS)
+    if unknown:
+        raise ValueError(f"Unsupported filter operators: {sorted(unknown)}")
+    return condition
+
+
+def matches_filter(metadata: Dict[str, Any], metadata_filter: Optional[MetadataFilter]) -> bool:
+    """Evaluate a metadata filter against one record's metadata."""
+    if not metadata_filter:
+        return True
+    for field, condition in metadata_filter.items():
+        value = metadata.get(field)
+        for operator, operand in normalize_condition(condition).items():
+            if operator == "$eq" and value != operand:
+                return False
+            if operator == "$ne" and value == operand:
+                return False
+            if operator == "$in" and value not in operand:
+                return False
+            if operator == "$nin" and value in operand:
+                return False
+            if operator in ("$gt", "$gte", "$lt", "$lte"):
+                if value is None:
+                    return False
+                try:
+                    if operator == "$gt" and not value > operand:
+                        return False
+                    if operator == "$gte" and not value >= operand:
+                        return False
+                    if operator == "$lt" and not value < operand:
+                        return False
+                    if operator == "$lte" and not value <= operand:
+                        return False
+                except TypeError:
+                    return False
+    return True
+
+
+def as_matrix(vectors: Any, dimension: int) -> np.ndarray:
+    """Coerce a vector or list of vectors into a (n, dimension) float32 matrix."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.shape[1] != dimension:
+        raise ValueError(f"Expected vectors of dimension {dimension}, got {matrix.shape[1]}")
+    return matrix
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so that dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorBackend(ABC):
+    """Common interface for vector storage backends.
+
+    Search results are lists of {"id", "score", "metadata"} dicts ordered by
+    descending cosine similarity, the same shape VectorDB.search_vectors returns.
+    """
+
+    name = "base"
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    @abstractmethod
+    def upsert(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        """Insert or replace vectors by id. Returns the number of vectors written."""
+
+    def add(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        """Insert new vectors. Backends that track ids reject ids that already exist."""
+        return self.upsert(ids, vectors, metadata)
+
+    @abstractmethod
+    def delete(self, ids: Sequence[str]) -> int:
+        """Delete vectors by id. Returns the number of vectors removed (if known)."""
+
+    @abstractmethod
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[MetadataFilter]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several query vectors at once, with an optional filter per query."""
+
+    def search(self, query: Any, top_k: int = 5, metadata_filter: Optional[MetadataFilter] = None) -> List[Dict[str, Any]]:
+        return self.search_batch(as_matrix(query, self.dimension), top_k, [metadata_filter])[0]
+
+    def filtered_search(self, query: Any, metadata_filter: MetadataFilter, top_k: int = 5) -> List[Dict[str, Any]]:
+        return self.search(query, top_k, metadata_filter)
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live vectors."""
+
+    def close(self):
+        """Flush and release any resources held by the backend."""
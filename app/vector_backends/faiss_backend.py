@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, Optional, Sequence
+import json
+import threading
+
+import faiss
+import numpy as np
+
+from .base import VectorBackend, MetadataFilter, as_matrix, matches_filter, normalize_rows
+
+
+class FaissBackend(VectorBackend):
+    """In-memory FAISS backend (exact inner product over normalized vectors).
+
+    String ids are mapped to int64 FAISS ids. Filtered queries resolve the
+    matching ids from the in-memory metadata and pass them to FAISS as an ID
+    selector, so only matching vectors are scanned.
+    """
+
+    name = "faiss"
+
+    def __init__(self, dimension: int):
+        super().__init__(dimension)
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._int_ids: Dict[str, int] = {}
+        self._str_ids: Dict[int, str] = {}
+        self._metadata: Dict[int, Dict[str, Any]] = {}
+
+    def upsert(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        matrix = normalize_rows(as_matrix(vectors, self.dimension))
+        metadata = metadata or [{} for _ in ids]
+        with self._lock:
+            self.delete([vector_id for vector_id in ids if vector_id in self._int_ids])
+            int_ids = np.arange(self._next_id, self._next_id + len(ids), dtype=np.int64)
+            self._next_id += len(ids)
+            for int_id, vector_id, item_metadata in zip(int_ids.tolist(), ids, metadata):
+                self._int_ids[vector_id] = int_id
+                self._str_ids[int_id] = vector_id
+                self._metadata[int_id] = dict(item_metadata)
+            self.index.add_with_ids(matrix, int_ids)
+        return len(ids)
+
+    def add(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        with self._lock:
+            existing = [vector_id for vector_id in ids if vector_id in self._int_ids]
+            if existing:
+                raise ValueError(f"Vectors already exist: {existing[:5]}")
+            return self.upsert(ids, vectors, metadata)
+
+    def delete(self, ids: Sequence[str]) -> int:
+        with self._lock:
+            int_ids = [self._int_ids.pop(vector_id) for vector_id in ids if vector_id in self._int_ids]
+            for int_id in int_ids:
+                self._str_ids.pop(int_id, None)
+                self._metadata.pop(int_id, None)
+            if int_ids:
+                self.index.remove_ids(np.array(int_ids, dtype=np.int64))
+            return len(int_ids)
+
+    def _matches(self, scores: np.ndarray, indices: np.ndarray) -> List[Dict[str, Any]]:
+        return [
+            {"id": self._str_ids[int(idx)], "score": float(score), "metadata": self._metadata[int(idx)]}
+            for score, idx in zip(scores, indices) if idx != -1
+        ]
+
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[MetadataFilter]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        query_matrix = normalize_rows(as_matrix(queries, self.dimension))
+        filters = list(filters) if filters is not None else [None] * len(query_matrix)
+        with self._lock:
+            if self.index.ntotal == 0:
+                return [[] for _ in range(len(query_matrix))]
+            k = min(top_k, self.index.ntotal)
+
+            results: List[Optional[List[Dict[str, Any]]]] = [None] * len(query_matrix)
+            unfiltered = [q for q, metadata_filter in enumerate(filters) if not metadata_filter]
+            if unfiltered:
+                scores, indices = self.index.search(query_matrix[unfiltered], k)
+                for row, q in enumerate(unfiltered):
+                    results[q] = self._matches(scores[row], indices[row])
+
+            id_map = faiss.vector_to_array(self.index.id_map)
+            positions_by_filter: Dict[str, np.ndarray] = {}
+            for q, metadata_filter in enumerate(filters):
+                if not metadata_filter:
+                    continue
+                key = json.dumps(metadata_filter, sort_keys=True, default=str)
+                if key not in positions_by_filter:
+                    allowed = [int_id for int_id, metadata in self._metadata.items() if matches_filter(metadata, metadata_filter)]
+                    # IndexIDMap does not accept search parameters, so select on the
+                    # positions in the wrapped flat index and map them back to ids
+                    positions_by_filter[key] = np.flatnonzero(np.isin(id_map, allowed)).astype(np.int64)
+                positions = positions_by_filter[key]
+                if len(positions) == 0:
+                    results[q] = []
+                    continue
+                selector = faiss.IDSelectorBatch(len(positions), faiss.swig_ptr(positions))
+                scores, indices = self.index.index.search(
+                    query_matrix[q:q + 1], min(k, len(positions)), params=faiss.SearchParameters(sel=selector)
+                )
+                results[q] = self._matches(scores[0], np.where(indices[0] == -1, -1, id_map[indices[0]]))
+            return results
+
+    def count(self) -> int:
+        return self.index.ntotal
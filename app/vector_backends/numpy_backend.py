@@ -0,0 +1,276 @@
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+import json
+import logging
+import mmap
+import os
+import threading
+
+import numpy as np
+
+from .base import VectorBackend, MetadataFilter, as_matrix, matches_filter, normalize_condition, normalize_rows
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block during search, bounding the temporary score matrix
+SEARCH_BLOCK_ROWS = 65536
+
+
+class LocalNumpyBackend(VectorBackend):
+    """Vector backend storing a NumPy matrix memory-mapped from a local directory.
+
+    Layout of `path`:
+      - header.json: dimension, row count and capacity
+      - vectors.f32: (capacity, dimension) float32 matrix of L2-normalized vectors
+      - records.jsonl: one {"id", "metadata"} JSON line per row (append-only)
+      - offsets.i64: (capacity, 2) byte offset/length of each row's record
+      - alive.u8: 1 for live rows, 0 for deleted or superseded rows
+
+    Writes append rows and tombstone the previous row for an upserted id, so the
+    files are only ever extended. Searches are a single matrix product over the
+    memory-mapped vectors; metadata is decoded only for the returned rows. Scalar
+    metadata values are kept in an in-memory inverted index for equality filters.
+    """
+
+    name = "numpy"
+
+    def __init__(self, path: str, dimension: int, initial_capacity: int = 1024):
+        super().__init__(dimension)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._ids: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[Any, Set[int]]] = defaultdict(lambda: defaultdict(set))
+
+        header_path = self.path / "header.json"
+        if header_path.exists():
+            header = json.loads(header_path.read_text())
+            if header["dimension"] != dimension:
+                raise ValueError(f"Store at {path} has dimension {header['dimension']}, not {dimension}")
+            self._rows = header["rows"]
+            self._capacity = header["capacity"]
+        else:
+            self._rows = 0
+            self._capacity = initial_capacity
+
+        self._records = open(self.path / "records.jsonl", "a+b")
+        self._records_map = None
+        self._map_arrays()
+        self._map_records()
+        self._load_index()
+
+    def _map_arrays(self):
+        self._vectors = np.memmap(self._file("vectors.f32"), dtype=np.float32, mode="r+", shape=(self._capacity, self.dimension))
+        self._offsets = np.memmap(self._file("offsets.i64"), dtype=np.int64, mode="r+", shape=(self._capacity, 2))
+        self._alive = np.memmap(self._file("alive.u8"), dtype=np.uint8, mode="r+", shape=(self._capacity,))
+
+    def _map_records(self):
+        """(Re)map the records file after it has grown."""
+        self._records.flush()
+        if self._records_map is not None:
+            self._records_map.close()
+            self._records_map = None
+        if os.path.getsize(self.path / "records.jsonl"):
+            self._records_map = mmap.mmap(self._records.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _file(self, name: str) -> str:
+        """Return the path of a data file, creating or growing it to the current capacity."""
+        item_sizes = {"vectors.f32": 4 * self.dimension, "offsets.i64": 16, "alive.u8": 1}
+        file_path = self.path / name
+        required = self._capacity * item_sizes[name]
+        if not file_path.exists() or file_path.stat().st_size < required:
+            with open(file_path, "ab") as handle:
+                handle.truncate(required)
+        return str(file_path)
+
+    def _write_header(self):
+        (self.path / "header.json").write_text(json.dumps({
+            "dimension": self.dimension,
+            "rows": self._rows,
+            "capacity": self._capacity
+        }))
+
+    def _load_index(self):
+        """Rebuild the id map and metadata postings from the live rows."""
+        for row in np.flatnonzero(self._alive[:self._rows]):
+            record = self._record(int(row))
+            self._ids[record["id"]] = int(row)
+            self._index_metadata(int(row), record["metadata"])
+        logger.info(f"Opened local vector store at {self.path} with {len(self._ids)} vectors")
+
+    def _record(self, row: int) -> Dict[str, Any]:
+        offset, length = self._offsets[row]
+        return json.loads(self._records_map[offset:offset + length])
+
+    def _index_metadata(self, row: int, metadata: Dict[str, Any], remove: bool = False):
+        for field, value in metadata.items():
+            if isinstance(value, (str, int, float, bool)):
+                postings = self._postings[field][value]
+                if remove:
+                    postings.discard(row)
+                else:
+                    postings.add(row)
+
+    def _ensure_capacity(self, rows: int):
+        if rows <= self._capacity:
+            return
+        for array in (self._vectors, self._offsets, self._alive):
+            array.flush()
+        while self._capacity < rows:
+            self._capacity *= 2
+        self._map_arrays()
+
+    def _tombstone(self, row: int):
+        self._alive[row] = 0
+        self._index_metadata(row, self._record(row)["metadata"], remove=True)
+
+    def upsert(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        matrix = normalize_rows(as_matrix(vectors, self.dimension))
+        metadata = metadata or [{} for _ in ids]
+        with self._lock:
+            start = self._rows
+            self._ensure_capacity(start + len(ids))
+
+            self._records.seek(0, os.SEEK_END)
+            offset = self._records.tell()
+            for i, (vector_id, item_metadata) in enumerate(zip(ids, metadata)):
+                line = json.dumps({"id": vector_id, "metadata": item_metadata}).encode("utf-8") + b"\n"
+                self._records.write(line)
+                self._offsets[start + i] = (offset, len(line) - 1)
+                offset += len(line)
+            self._map_records()
+
+            self._vectors[start:start + len(ids)] = matrix
+            for i, (vector_id, item_metadata) in enumerate(zip(ids, metadata)):
+                previous = self._ids.get(vector_id)
+                if previous is not None:
+                    self._tombstone(previous)
+                self._ids[vector_id] = start + i
+                self._alive[start + i] = 1
+                self._index_metadata(start + i, item_metadata)
+
+            self._rows = start + len(ids)
+            self._write_header()
+        return len(ids)
+
+    def add(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        with self._lock:
+            existing = [vector_id for vector_id in ids if vector_id in self._ids]
+            if existing:
+                raise ValueError(f"Vectors already exist: {existing[:5]}")
+            return self.upsert(ids, vectors, metadata)
+
+    def delete(self, ids: Sequence[str]) -> int:
+        removed = 0
+        with self._lock:
+            for vector_id in ids:
+                row = self._ids.pop(vector_id, None)
+                if row is not None:
+                    self._tombstone(row)
+                    removed += 1
+            self._alive.flush()
+        return removed
+
+    def _filter_mask(self, metadata_filter: Optional[MetadataFilter]) -> np.ndarray:
+        """Boolean mask over rows that are alive and match the filter."""
+        mask = self._alive[:self._rows].astype(bool)
+        if not metadata_filter:
+            return mask
+
+        residual = {}
+        for field, condition in metadata_filter.items():
+            condition = normalize_condition(condition)
+            if set(condition) <= {"$eq", "$in"}:
+                values = [condition["$eq"]] if "$eq" in condition else list(condition["$in"])
+                rows = set().union(*(self._postings[field].get(value, set()) for value in values)) if values else set()
+                field_mask = np.zeros(self._rows, dtype=bool)
+                if rows:
+                    field_mask[np.fromiter(rows, dtype=np.int64)] = True
+                mask &= field_mask
+            else:
+                residual[field] = condition
+
+        if residual:
+            for row in np.flatnonzero(mask):
+                if not matches_filter(self._record(int(row))["metadata"], residual):
+                    mask[row] = False
+        return mask
+
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[MetadataFilter]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        query_matrix = normalize_rows(as_matrix(queries, self.dimension))
+        filters = list(filters) if filters is not None else [None] * len(query_matrix)
+        with self._lock:
+            rows = self._rows
+            if rows == 0:
+                return [[] for _ in range(len(query_matrix))]
+
+            # Queries sharing a filter share one row mask
+            groups: Dict[str, List[int]] = defaultdict(list)
+            masks = {}
+            for q, metadata_filter in enumerate(filters):
+                key = json.dumps(metadata_filter, sort_keys=True, default=str)
+                if key not in masks:
+                    masks[key] = self._filter_mask(metadata_filter)
+                groups[key].append(q)
+
+            best_scores = np.full((len(query_matrix), 0), -np.inf, dtype=np.float32)
+            best_rows = np.empty((len(query_matrix), 0), dtype=np.int64)
+            for start in range(0, rows, SEARCH_BLOCK_ROWS):
+                end = min(start + SEARCH_BLOCK_ROWS, rows)
+                scores = query_matrix @ self._vectors[start:end].T
+                for key, query_rows in groups.items():
+                    excluded = ~masks[key][start:end]
+                    if excluded.any():
+                        scores[np.ix_(query_rows, np.flatnonzero(excluded))] = -np.inf
+                block_rows = np.broadcast_to(np.arange(start, end), scores.shape)
+                best_scores = np.concatenate([best_scores, scores], axis=1)
+                best_rows = np.concatenate([best_rows, block_rows], axis=1)
+                if best_scores.shape[1] > top_k:
+                    keep = np.argpartition(-best_scores, top_k - 1, axis=1)[:, :top_k]
+                    best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                    best_rows = np.take_along_axis(best_rows, keep, axis=1)
+
+            results = []
+            for q in range(len(query_matrix)):
+                order = np.argsort(-best_scores[q])
+                matches = []
+                for idx in order:
+                    score = best_scores[q, idx]
+                    if not np.isfinite(score):
+                        continue
+                    record = self._record(int(best_rows[q, idx]))
+                    matches.append({"id": record["id"], "score": float(score), "metadata": record["metadata"]})
+                results.append(matches)
+            return results
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def compact(self):
+        """Rewrite the store without deleted or superseded rows."""
+        with self._lock:
+            live_rows = np.flatnonzero(self._alive[:self._rows])
+            records = [self._record(int(row)) for row in live_rows]
+            vectors = np.array(self._vectors[live_rows])
+            self.close()
+            for name in ("header.json", "vectors.f32", "records.jsonl", "offsets.i64", "alive.u8"):
+                (self.path / name).unlink(missing_ok=True)
+            self.__init__(str(self.path), self.dimension, initial_capacity=max(len(records), 1024))
+            if records:
+                self.upsert([r["id"] for r in records], vectors, [r["metadata"] for r in records])
+            logger.info(f"Compacted local vector store at {self.path} to {len(records)} vectors")
+
+    def close(self):
+        with self._lock:
+            for array in (self._vectors, self._offsets, self._alive):
+                array.flush()
+            if self._records_map is not None:
+                self._records_map.close()
+                self._records_map = None
+            self._records.close()
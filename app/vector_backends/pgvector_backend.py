@@ -0,0 +1,125 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+
+from sqlalchemy import text
+
+from app.workflows.engines import get_engine
+
+from .base import VectorBackend, MetadataFilter, as_matrix, normalize_condition
+
+SQL_OPERATORS = {"$eq": "=", "$ne": "<>", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _vector_literal(vector: Sequence[float]) -> str:
+    return "[" + ",".join(str(float(x)) for x in vector) + "]"
+
+
+def filter_to_sql(metadata_filter: Optional[MetadataFilter], prefix: str = "f") -> Tuple[str, Dict[str, Any]]:
+    """Translate a metadata filter into a SQL predicate over the jsonb `metadata` column."""
+    clauses, params = [], {}
+    for i, (field, condition) in enumerate((metadata_filter or {}).items()):
+        for j, (operator, operand) in enumerate(normalize_condition(condition).items()):
+            name = f"{prefix}{i}_{j}"
+            params[f"{name}_key"] = field
+            numeric = isinstance(operand, (int, float)) and not isinstance(operand, bool)
+            column = f"(metadata->>:{name}_key)" + ("::float" if numeric else "")
+            if operator in ("$in", "$nin"):
+                params[name] = [str(value) for value in operand]
+                negate = "NOT " if operator == "$nin" else ""
+                clauses.append(f"{negate}(metadata->>:{name}_key = ANY(:{name}))")
+            else:
+                params[name] = operand if numeric else str(operand).lower() if isinstance(operand, bool) else str(operand)
+                clauses.append(f"{column} {SQL_OPERATORS[operator]} :{name}")
+    return " AND ".join(clauses) or "TRUE", params
+
+
+class PGVectorBackend(VectorBackend):
+    """PostgreSQL pgvector backend storing vectors in a `vector_items` table, one namespace per index."""
+
+    name = "pgvector"
+
+    def __init__(self, connection_string: str, dimension: int, namespace: str = "default"):
+        super().__init__(dimension)
+        self.namespace = namespace
+        self.engine = get_engine(connection_string)
+        with self.engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+            connection.execute(text(f"""
+                CREATE TABLE IF NOT EXISTS vector_items (
+                    namespace VARCHAR(100) NOT NULL,
+                    id VARCHAR(200) NOT NULL,
+                    embedding vector({int(dimension)}) NOT NULL,
+                    metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+                    PRIMARY KEY (namespace, id)
+                );
+            """))
+
+    def upsert(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        matrix = as_matrix(vectors, self.dimension)
+        metadata = metadata or [{} for _ in ids]
+        rows = [{
+            "namespace": self.namespace,
+            "id": vector_id,
+            "embedding": _vector_literal(vector),
+            "metadata": json.dumps(item_metadata)
+        } for vector_id, vector, item_metadata in zip(ids, matrix, metadata)]
+        with self.engine.begin() as connection:
+            connection.execute(text("""
+                INSERT INTO vector_items (namespace, id, embedding, metadata)
+                VALUES (:namespace, :id, CAST(:embedding AS vector), CAST(:metadata AS jsonb))
+                ON CONFLICT (namespace, id) DO UPDATE
+                SET embedding = EXCLUDED.embedding, metadata = EXCLUDED.metadata;
+            """), rows)
+        return len(rows)
+
+    def add(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        with self.engine.connect() as connection:
+            existing = connection.execute(text("""
+                SELECT id FROM vector_items WHERE namespace = :namespace AND id = ANY(:ids) LIMIT 5;
+            """), {"namespace": self.namespace, "ids": list(ids)}).scalars().all()
+        if existing:
+            raise ValueError(f"Vectors already exist: {existing}")
+        return self.upsert(ids, vectors, metadata)
+
+    def delete(self, ids: Sequence[str]) -> int:
+        with self.engine.begin() as connection:
+            result = connection.execute(text("""
+                DELETE FROM vector_items WHERE namespace = :namespace AND id = ANY(:ids);
+            """), {"namespace": self.namespace, "ids": list(ids)})
+        return result.rowcount
+
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[MetadataFilter]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        query_matrix = as_matrix(queries, self.dimension)
+        filters = list(filters) if filters is not None else [None] * len(query_matrix)
+        if len(query_matrix) == 0:
+            return []
+        # One round trip: a UNION ALL of per-query top-k subqueries, each with its own filter
+        subqueries, params = [], {"namespace": self.namespace, "top_k": top_k}
+        for q, (vector, metadata_filter) in enumerate(zip(query_matrix, filters)):
+            where, filter_params = filter_to_sql(metadata_filter, prefix=f"q{q}_")
+            params.update(filter_params)
+            params[f"query_{q}"] = _vector_literal(vector)
+            subqueries.append(f"""
+                (SELECT {q} AS query_index, id, 1 - (embedding <=> CAST(:query_{q} AS vector)) AS score, metadata
+                FROM vector_items
+                WHERE namespace = :namespace AND {where}
+                ORDER BY embedding <=> CAST(:query_{q} AS vector)
+                LIMIT :top_k)
+            """)
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(" UNION ALL ".join(subqueries) + " ORDER BY query_index, score DESC;"), params).fetchall()
+        results: List[List[Dict[str, Any]]] = [[] for _ in range(len(query_matrix))]
+        for row in rows:
+            results[row[0]].append({"id": row[1], "score": float(row[2]), "metadata": row[3] or {}})
+        return results
+
+    def count(self) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(text("""
+                SELECT COUNT(*) FROM vector_items WHERE namespace = :namespace;
+            """), {"namespace": self.namespace}).scalar()
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from .base import VectorBackend, MetadataFilter, as_matrix
+
+# Pinecone recommends upserting in batches of at most 100 vectors
+UPSERT_BATCH_SIZE = 100
+
+
+class PineconeBackend(VectorBackend):
+    """Pinecone serverless index backend. The client is created lazily, not at import time."""
+
+    name = "pinecone"
+
+    def __init__(self, index_name: str, dimension: int, api_key: str, environment: Optional[str] = None, max_workers: int = 8):
+        super().__init__(dimension)
+        from pinecone import Pinecone
+
+        self.client = Pinecone(api_key=api_key, environment=environment)
+        if index_name not in self.client.list_indexes().names():
+            self.client.create_index(
+                name=index_name,
+                dimension=dimension,
+                metric='cosine'
+            )
+        self.index = self.client.Index(index_name)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def upsert(self, ids: Sequence[str], vectors: Any, metadata: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        values = as_matrix(vectors, self.dimension).tolist()
+        items = list(zip(ids, values, metadata)) if metadata else list(zip(ids, values))
+        for start in range(0, len(items), UPSERT_BATCH_SIZE):
+            self.index.upsert(vectors=items[start:start + UPSERT_BATCH_SIZE])
+        return len(items)
+
+    def delete(self, ids: Sequence[str]) -> int:
+        self.index.delete(ids=list(ids))
+        return len(ids)
+
+    def _query(self, vector: List[float], top_k: int, metadata_filter: Optional[MetadataFilter]) -> List[Dict[str, Any]]:
+        result = self.index.query(vector=vector, top_k=top_k, filter=metadata_filter or None, include_metadata=True)
+        return [{"id": match['id'], "score": match['score'], "metadata": match.get('metadata') or {}} for match in result['matches']]
+
+    def search_batch(
+        self,
+        queries: Any,
+        top_k: int = 5,
+        filters: Optional[Sequence[Optional[MetadataFilter]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        # Pinecone queries take one vector each; issue them concurrently
+        query_matrix = as_matrix(queries, self.dimension).tolist()
+        filters = list(filters) if filters is not None else [None] * len(query_matrix)
+        return list(self._executor.map(lambda args: self._query(args[0], top_k, args[1]), zip(query_matrix, filters)))
+
+    def count(self) -> int:
+        return self.index.describe_index_stats()['total_vector_count']
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,50 @@
+import tempfile
+import unittest
+import numpy as np
+from app.vector_backends.numpy_backend import LocalNumpyBackend
+
+class TestLocalNumpyBackend(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.backend = LocalNumpyBackend(self.directory.name, dimension=3, initial_capacity=2)
+        self.backend.add(
+            ["a", "b", "c"],
+            [[1.0, 0.0, 0.0], [0.8, 0.6, 0.0], [0.0, 0.0, 1.0]],
+            [{"department": "Engineering"}, {"department": "Sales"}, {"department": "Engineering"}]
+        )
+
+    def tearDown(self):
+        self.backend.close()
+        self.directory.cleanup()
+
+    def test_search_orders_by_similarity(self):
+        """Test that search returns the top-k vectors by cosine similarity, best first."""
+        results = self.backend.search([1.0, 0.1, 0.0], top_k=2)
+        self.assertEqual([match["id"] for match in results], ["a", "b"])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_search_applies_metadata_filter(self):
+        """Test that equality filters restrict the candidates."""
+        results = self.backend.search([1.0, 0.1, 0.0], top_k=2, metadata_filter={"department": "Engineering"})
+        self.assertEqual([match["id"] for match in results], ["a", "c"])
+
+    def test_delete_and_upsert(self):
+        """Test that deleted vectors disappear and upserts replace the previous row."""
+        self.assertEqual(self.backend.delete(["a", "missing"]), 1)
+        self.backend.upsert(["b"], [[0.0, 1.0, 0.0]], [{"department": "Sales"}])
+        self.assertEqual(self.backend.count(), 2)
+        results = self.backend.search([1.0, 0.0, 0.0], top_k=3)
+        self.assertNotIn("a", [match["id"] for match in results])
+        self.assertAlmostEqual(next(m["score"] for m in results if m["id"] == "b"), 0.0, places=5)
+
+    def test_reopen_keeps_live_rows(self):
+        """Test that a reopened store sees the same vectors."""
+        self.backend.delete(["c"])
+        self.backend.close()
+        self.backend = LocalNumpyBackend(self.directory.name, dimension=3)
+        self.assertEqual(self.backend.count(), 2)
+        results = self.backend.search(np.array([1.0, 1.0, 1.0]), top_k=5)
+        self.assertEqual(sorted(match["id"] for match in results), ["a", "b"])
+
+if __name__ == '__main__':
+    unittest.main()
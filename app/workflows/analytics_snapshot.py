@@ -0,0 +1,231 @@
+from sqlalchemy import select
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+from collections import defaultdict
+import json
+import logging
+import os
+import shutil
+import uuid
+
+from ..models import db, Assessment, AssessmentMetric
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "_snapshot_state.json"
+PARTITION_COLUMNS = ("department", "review_quarter")
+SNAPSHOT_COLUMNS = (
+    "id", "user_id", "employee_id", "employee_name", "department", "position",
+    "review_date", "review_quarter", "status", "overall_rating",
+    "sentiment_score", "sentiment_label", "sentiment_confidence",
+    "promotion_recommended", "promotion_confidence", "metrics", "updated_at"
+)
+DEFAULT_BATCH_SIZE = 10000
+# updated_at is set at flush, so a transaction committing later can land behind
+# the high-water mark; each refresh re-reads this far back to pick such rows up
+DEFAULT_SAFETY_LAG_SECONDS = 300
+
+
+def _arrow():
+    # pyarrow is only needed by the snapshot job and its readers
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(f"The analytics snapshot requires pyarrow: {str(e)}")
+    return pa, pq
+
+
+def snapshot_schema():
+    pa, _ = _arrow()
+    return pa.schema([
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("employee_id", pa.string()),
+        ("employee_name", pa.string()),
+        ("department", pa.string()),
+        ("position", pa.string()),
+        ("review_date", pa.timestamp("us")),
+        ("review_quarter", pa.string()),
+        ("status", pa.string()),
+        ("overall_rating", pa.float64()),
+        ("sentiment_score", pa.float64()),
+        ("sentiment_label", pa.string()),
+        ("sentiment_confidence", pa.float64()),
+        ("promotion_recommended", pa.bool_()),
+        ("promotion_confidence", pa.float64()),
+        ("metrics", pa.map_(pa.string(), pa.float64())),
+        ("updated_at", pa.timestamp("us"))
+    ])
+
+
+def review_quarter(review_date: datetime) -> str:
+    return f"{review_date.year}Q{(review_date.month - 1) // 3 + 1}"
+
+
+def read_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(path, STATE_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_state(path: str, state: Dict[str, Any]):
+    # Replace atomically so a crashed refresh never leaves a half-written mark
+    tmp_path = os.path.join(path, f"{STATE_FILE}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, os.path.join(path, STATE_FILE))
+
+
+def _changed_rows(since: Optional[datetime], batch_size: int):
+    """Yield batches of assessments updated at or after `since`, in (updated_at, id) order."""
+    columns = [getattr(Assessment, name) for name in SNAPSHOT_COLUMNS if name not in ("review_quarter", "metrics")]
+    statement = select(*columns).order_by(Assessment.updated_at, Assessment.id)
+    if since:
+        statement = statement.where(Assessment.updated_at >= since)
+    result = db.session.execute(statement.execution_options(yield_per=batch_size)).mappings()
+    for rows in result.partitions():
+        yield [dict(row) for row in rows]
+
+
+def _metrics_by_assessment(ids: List[int]) -> Dict[int, List[Tuple[str, float]]]:
+    metrics = defaultdict(list)
+    rows = db.session.execute(
+        select(AssessmentMetric.assessment_id, AssessmentMetric.name, AssessmentMetric.value)
+        .where(AssessmentMetric.assessment_id.in_(ids))
+    )
+    for assessment_id, name, value in rows:
+        metrics[assessment_id].append((name, value))
+    return metrics
+
+
+def _to_table(rows: List[Dict[str, Any]]):
+    pa, _ = _arrow()
+    metrics = _metrics_by_assessment([row["id"] for row in rows])
+    for row in rows:
+        row["review_quarter"] = review_quarter(row["review_date"])
+        row["metrics"] = metrics.get(row["id"], [])
+    return pa.Table.from_pylist(rows, schema=snapshot_schema())
+
+
+def refresh_snapshot(
+    path: str,
+    full: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    safety_lag: float = DEFAULT_SAFETY_LAG_SECONDS
+) -> Dict[str, Any]:
+    """Write assessments changed since the last run into Parquet partitioned by department and quarter.
+
+    Each run appends new files and advances the (updated_at, id) high-water
+    mark; a row updated since a previous run is written again, and readers keep
+    its newest copy. Rows are re-read from `safety_lag` seconds before the mark,
+    so late commits are not skipped; versions already written inside that window
+    are remembered in the state file and not written twice. Rows are streamed
+    from the database one batch at a time. A full refresh rebuilds into a fresh
+    directory and swaps it in, which also drops rows deleted from the database.
+    Must run in an app context.
+    """
+    _, pq = _arrow()
+    target = f"{path}.rebuild-{uuid.uuid4().hex[:8]}" if full else path
+    os.makedirs(target, exist_ok=True)
+    state = {} if full else read_state(path)
+    high_water = state.get("high_water")
+    if high_water:
+        high_water = (datetime.fromisoformat(high_water[0]), high_water[1])
+    lag = timedelta(seconds=safety_lag)
+    # (id, updated_at) of versions written within the lag window of the mark
+    recent = {(assessment_id, updated_at) for assessment_id, updated_at in state.get("recent", [])}
+
+    run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S") + "-" + uuid.uuid4().hex[:8]
+    written = 0
+    for rows in _changed_rows(high_water[0] - lag if high_water else None, batch_size):
+        rows = [row for row in rows if (row["id"], row["updated_at"].isoformat()) not in recent]
+        if not rows:
+            continue
+        pq.write_to_dataset(
+            _to_table(rows),
+            root_path=target,
+            partition_cols=list(PARTITION_COLUMNS),
+            basename_template=f"part-{run_id}-{written}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+        written += len(rows)
+        # Late commits re-read from the lag window sort before the mark and must not move it back
+        mark = (rows[-1]["updated_at"], rows[-1]["id"])
+        high_water = max(high_water, mark) if high_water else mark
+        window_start = (high_water[0] - lag).isoformat()
+        recent = {
+            version for version in recent | {(row["id"], row["updated_at"].isoformat()) for row in rows}
+            if version[1] >= window_start
+        }
+        # Persist progress after each batch so an interrupted run resumes where it stopped
+        _write_state(target, {
+            "high_water": [high_water[0].isoformat(), high_water[1]],
+            "recent": sorted(recent),
+            "refreshed_at": datetime.utcnow().isoformat()
+        })
+
+    if full:
+        if not written:
+            _write_state(target, {"high_water": None, "refreshed_at": datetime.utcnow().isoformat()})
+        previous = f"{path}.old-{uuid.uuid4().hex[:8]}"
+        if os.path.exists(path):
+            os.replace(path, previous)
+        os.replace(target, path)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    logger.info(f"Analytics snapshot {'rebuilt' if full else 'refreshed'} with {written} assessments")
+    return {"written": written, "high_water": read_state(path).get("high_water")}
+
+
+def load_snapshot(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    departments: Optional[Sequence[str]] = None,
+    quarters: Optional[Sequence[str]] = None,
+    user_id: Optional[int] = None
+):
+    """Read the snapshot as a pandas DataFrame, loading only the requested columns and partitions.
+
+    Department and quarter filters prune whole partition directories before
+    any file is opened; files are memory-mapped rather than copied into memory.
+    Only the newest copy of each assessment is returned: the newest version is
+    found across all partitions first, so a stale copy left in a partition the
+    row has moved out of is never returned.
+    """
+    _, pq = _arrow()
+    unknown = sorted(set(columns or ()) - set(SNAPSHOT_COLUMNS))
+    if unknown:
+        raise ValueError(f"Unknown snapshot columns: {', '.join(unknown)}")
+
+    filters = []
+    if departments is not None:
+        filters.append(("department", "in", list(departments)))
+    if quarters is not None:
+        filters.append(("review_quarter", "in", list(quarters)))
+    if user_id is not None:
+        filters.append(("user_id", "=", user_id))
+
+    read_columns = None
+    if columns:
+        read_columns = list(dict.fromkeys([*columns, "id", "updated_at"]))
+    table = pq.read_table(
+        path,
+        columns=read_columns,
+        filters=filters or None,
+        partitioning="hive",
+        memory_map=True
+    )
+    frame = table.to_pandas()
+    if filters:
+        # Only the two key columns are read for every partition
+        newest = pq.read_table(
+            path, columns=["id", "updated_at"], partitioning="hive", memory_map=True
+        ).to_pandas().groupby("id")["updated_at"].max()
+        frame = frame[frame["updated_at"] == frame["id"].map(newest)]
+    frame = frame.sort_values("updated_at").drop_duplicates("id", keep="last").sort_values("id")
+    if columns:
+        frame = frame[list(columns)]
+    return frame.reset_index(drop=True)
@@ -0,0 +1,106 @@
+from sqlalchemy import select
+from typing import Dict, Any, Optional, Iterable, Iterator, Sequence
+from datetime import datetime
+import csv
+import io
+import json
+import zlib
+
+from ..models import db, Assessment
+from .assessment_queries import ASSESSMENT_FIELDS, filter_assessments
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_MIMETYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+JSON_FIELDS = ("performance_metrics", "sentiment_analysis", "promotion_recommendation")
+# Rows fetched per round trip from the server-side cursor
+DEFAULT_YIELD_PER = 1000
+# Serialized text buffered before a chunk is handed to the response
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_assessment_rows(
+    user_id: int,
+    fields: Optional[Sequence[str]] = None,
+    yield_per: int = DEFAULT_YIELD_PER,
+    **filters: Any
+) -> Iterator[Dict[str, Any]]:
+    """Stream a user's assessments in id order without loading them all.
+
+    Only the requested columns are selected, and yield_per makes the driver use
+    a server-side cursor where it can (psycopg2 named cursors on PostgreSQL).
+    """
+    columns = [getattr(Assessment, field) for field in fields or ASSESSMENT_FIELDS]
+    statement = filter_assessments(
+        select(*columns).where(Assessment.user_id == user_id), **filters
+    ).order_by(Assessment.id).execution_options(yield_per=yield_per)
+    for row in db.session.execute(statement).mappings():
+        yield dict(row)
+
+
+def _plain(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _ndjson_value(field: str, value: Any) -> Any:
+    # JSON columns hold serialized text; nest them as objects rather than strings
+    if field in JSON_FIELDS and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    return _plain(value)
+
+
+def serialize_rows(rows: Iterable[Dict[str, Any]], fmt: str, fields: Sequence[str], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Serialize rows to CSV or NDJSON, yielding text in chunks of about chunk_size."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {EXPORT_FORMATS}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer:
+        writer.writerow(fields)
+    for row in rows:
+        if writer:
+            writer.writerow([_plain(row[field]) for field in fields])
+        else:
+            buffer.write(json.dumps({field: _ndjson_value(field, row[field]) for field in fields}))
+            buffer.write("\n")
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip a text stream on the fly, one compressed block per input chunk."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 writes a gzip header
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_assessments(
+    user_id: int,
+    fmt: str,
+    fields: Optional[Sequence[str]] = None,
+    compress: bool = False,
+    yield_per: int = DEFAULT_YIELD_PER,
+    **filters: Any
+) -> Iterator:
+    """Bytes of a complete CSV/NDJSON export, gzipped on the fly when `compress` is set.
+
+    Memory stays bounded by one cursor batch plus one output chunk, so it can
+    be handed straight to a streaming response or written to a file.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {EXPORT_FORMATS}")
+    fields = list(fields or ASSESSMENT_FIELDS)
+    chunks = serialize_rows(iter_assessment_rows(user_id, fields, yield_per=yield_per, **filters), fmt, fields)
+    if compress:
+        return gzip_chunks(chunks)
+    return (chunk.encode("utf-8") for chunk in chunks)
@@ -4,17 +4,21 @@ from langchain_community.vectorstores import FAISS
 from langchain.prompts import ChatPromptTemplate
 from langchain.chains import LLMChain
 from langchain.schema import Document
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import logging
 import asyncio
 from datetime import datetime
 import numpy as np
 from tenacity import retry, stop_after_attempt, wait_exponential
 import os
-from sqlalchemy import create_engine, text
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 from ..validation.fairness_validator import FairnessValidator
+from .metadata_index import MetadataIndex, has_filters, filtered_faiss_search
+from .lexical_index import BM25Index, review_lexical_index, reciprocal_rank_fusion
+from .sharding import ShardedVectorIndex
+from .db_utils import iter_assessment_reviews
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 from ..models import db, Assessment
@@ -41,12 +45,33 @@ class PromotionRecommendation(BaseModel):
     rationale: str = Field(description="Explanation for the recommendation")
     development_areas: Optional[List[str]] = Field(description="Areas that need development before promotion", default_factory=list)
 
+RETRIEVAL_MODES = ("vector", "hybrid", "lexical")
+
 class AssessmentPipeline:
-    def __init__(self, db_connection_string: str, openai_api_key: str):
+    def __init__(
+        self,
+        db_connection_string: str,
+        openai_api_key: str,
+        lexical_index: Optional[BM25Index] = None,
+        vector_timeout: float = 2.0,
+        shard_by: Optional[str] = None,
+        num_shards: int = 8
+    ):
         """Initialize the assessment pipeline with database connection and OpenAI API key."""
         self.db_connection_string = db_connection_string
         self.openai_api_key = openai_api_key
         
+        # Local BM25 index used for lexical and hybrid retrieval
+        self.lexical_index = lexical_index if lexical_index is not None else review_lexical_index
+        if db_connection_string:
+            # Reviews stored before this process started are indexed on first use
+            self.lexical_index.set_loader(partial(iter_assessment_reviews, db_connection_string))
+        self.vector_timeout = vector_timeout
+        
+        # Optional sharding of the review index ("department" or "employee_hash")
+        self.shard_by = shard_by
+        self.num_shards = num_shards
+        
         # Initialize embeddings with minimal required parameters
         self.embeddings = OpenAIEmbeddings(
             openai_api_key=openai_api_key,
@@ -62,6 +87,7 @@ class AssessmentPipeline:
         
         # Initialize vector store as None - will be created lazily when needed
         self.vector_store = None
+        self._metadata_index = MetadataIndex()
         
         # Initialize fairness validator
         self.validator = FairnessValidator()
@@ -100,7 +126,10 @@ class AssessmentPipeline:
 
     def _initialize_vector_store(self):
         """Lazily initialize the vector store when needed."""
-        if self.vector_store is None:
+        if self.vector_store is None and self.shard_by:
+            # Shards are created on first write, so no embedding call is needed here
+            self.vector_store = ShardedVectorIndex(self.embeddings, self.shard_by, self.num_shards)
+        elif self.vector_store is None:
             try:
                 self.vector_store = FAISS.from_texts(
                     ["Initial placeholder text"],
@@ -154,19 +183,76 @@ class AssessmentPipeline:
             "has_failures": report["failed_validations"] > 0
         }
 
+    async def get_similar_reviews(
+        self,
+        review_text: str,
+        limit: int = 3,
+        department: Optional[str] = None,
+        position: Optional[str] = None,
+        employee_id: Optional[str] = None,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        mode: str = "vector"
+    ) -> List[Document]:
+        """Retrieve similar historical reviews, optionally filtered by metadata.
+
+        `mode` selects the retriever: "vector" (embedding search), "lexical" (local
+        BM25 only, no network calls) or "hybrid" (both, fused with reciprocal rank
+        fusion). In hybrid mode the vector search is bounded by `vector_timeout`
+        and the lexical results are returned alone if it fails or times out.
+        """
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode '{mode}', expected one of {RETRIEVAL_MODES}")
+
+        filters = {
+            "department": department,
+            "position": position,
+            "employee_id": employee_id,
+            "start_date": start_date,
+            "end_date": end_date
+        }
+        if mode == "vector":
+            return await self._vector_similar_reviews(review_text, limit, filters)
+
+        await asyncio.to_thread(self.lexical_index.ensure_loaded)
+        lexical_results = [doc for doc, _ in self.lexical_index.search(review_text, k=limit, **filters)]
+        if mode == "lexical":
+            logger.info(f"Retrieved {len(lexical_results)} similar reviews from the lexical index")
+            return lexical_results
+
+        try:
+            vector_results = await asyncio.wait_for(
+                self._vector_similar_reviews(review_text, limit, filters),
+                timeout=self.vector_timeout
+            )
+        except Exception as e:
+            logger.warning(f"Vector retrieval unavailable, using lexical results only: {str(e) or type(e).__name__}")
+            return lexical_results
+
+        results = reciprocal_rank_fusion([vector_results, lexical_results], limit=limit)
+        logger.info(f"Retrieved {len(results)} similar reviews with hybrid retrieval")
+        return results
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         reraise=True
     )
-    async def get_similar_reviews(self, review_text: str, limit: int = 3) -> List[Document]:
+    async def _vector_similar_reviews(self, review_text: str, limit: int, filters: Dict[str, Any]) -> List[Document]:
         """Retrieve similar historical reviews from vector store."""
         try:
-            self._initialize_vector_store()
+            # Off the event loop, so hybrid mode's timeout also bounds the first embedding call
+            await asyncio.to_thread(self._initialize_vector_store)
             if self.vector_store is None:
                 logger.warning("Vector store not available due to API quota limits. Returning empty results.")
                 return []
-            results = await self.vector_store.asimilarity_search(review_text, k=limit)
+
+            if isinstance(self.vector_store, ShardedVectorIndex):
+                results = await self.vector_store.asimilarity_search(review_text, k=limit, **filters)
+            elif has_filters(**filters):
+                results = await self._filtered_similarity_search(review_text, limit, filters)
+            else:
+                results = await self.vector_store.asimilarity_search(review_text, k=limit)
             logger.info(f"Retrieved {len(results)} similar reviews")
             return results
         except Exception as e:
@@ -176,6 +262,12 @@ class AssessmentPipeline:
                 return []
             raise
 
+    async def _filtered_similarity_search(self, review_text: str, limit: int, filters: Dict[str, Any]) -> List[Document]:
+        """Search only the FAISS rows whose metadata matches the filters."""
+        query_vector = await self.embeddings.aembed_query(review_text)
+        results = filtered_faiss_search(self.vector_store, self._metadata_index, query_vector, limit, filters)
+        return [document for document, _ in results]
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -0,0 +1,132 @@
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, lambda_stmt, or_, select
+from sqlalchemy.orm import load_only
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from datetime import datetime
+
+from ..models import db, Assessment
+
+# Fields the listing API may project; id and review_date are always loaded for the cursor
+ASSESSMENT_FIELDS = (
+    "id", "employee_id", "employee_name", "department", "position", "review_text",
+    "performance_metrics", "sentiment_analysis", "promotion_recommendation",
+    "additional_comments", "review_date", "status", "user_id"
+)
+MAX_PAGE_SIZE = 100
+
+
+def assessment_by_id(assessment_id: int) -> Optional[Assessment]:
+    """Hot single-row lookup through a cached lambda statement."""
+    return db.session.execute(
+        lambda_stmt(lambda: select(Assessment).where(Assessment.id == assessment_id))
+    ).scalar_one_or_none()
+
+
+class InvalidQuery(ValueError):
+    """Raised for malformed listing parameters (bad cursor, field or date)."""
+
+
+def _cursor_serializer(secret_key: str) -> URLSafeSerializer:
+    return URLSafeSerializer(secret_key, salt="assessment-cursor")
+
+
+def encode_cursor(secret_key: str, review_date: datetime, assessment_id: int) -> str:
+    """Opaque, signed cursor for the position after (review_date, id)."""
+    return _cursor_serializer(secret_key).dumps([review_date.isoformat(), assessment_id])
+
+
+def decode_cursor(secret_key: str, cursor: str) -> Tuple[datetime, int]:
+    try:
+        review_date, assessment_id = _cursor_serializer(secret_key).loads(cursor)
+        return datetime.fromisoformat(review_date), int(assessment_id)
+    except (BadSignature, ValueError, TypeError) as e:
+        raise InvalidQuery(f"Invalid cursor: {str(e)}")
+
+
+def parse_date(value: Optional[str], name: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise InvalidQuery(f"Invalid {name}: expected an ISO 8601 date")
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Validate a comma-separated field projection (id is always included); None means all fields."""
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    if "id" not in fields:
+        fields.insert(0, "id")
+    unknown = sorted(set(fields) - set(ASSESSMENT_FIELDS))
+    if unknown:
+        raise InvalidQuery(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def filter_assessments(
+    query,
+    department: Optional[str] = None,
+    position: Optional[str] = None,
+    status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """Apply the listing filters to an Assessment query."""
+    if department:
+        query = query.filter(Assessment.department == department)
+    if position:
+        query = query.filter(Assessment.position == position)
+    if status:
+        query = query.filter(Assessment.status == status)
+    if start_date:
+        query = query.filter(Assessment.review_date >= start_date)
+    if end_date:
+        query = query.filter(Assessment.review_date <= end_date)
+    return query
+
+
+def serialize_assessment(assessment: Assessment, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    data = {}
+    for field in fields or ASSESSMENT_FIELDS:
+        value = getattr(assessment, field)
+        data[field] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+
+def list_assessments_page(
+    user_id: int,
+    secret_key: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    **filters: Any
+) -> Dict[str, Any]:
+    """One page of a user's assessments, newest first, using keyset pagination.
+
+    Rows are ordered by (review_date, id) descending and the page starts strictly
+    after the cursor's position, so each page is an index range scan on
+    (user_id, review_date, id) no matter how deep the client has paged.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = filter_assessments(Assessment.query.filter(Assessment.user_id == user_id), **filters)
+    if fields:
+        columns = {"id", "review_date", *fields}
+        query = query.options(load_only(*(getattr(Assessment, column) for column in columns)))
+    if cursor:
+        review_date, assessment_id = decode_cursor(secret_key, cursor)
+        query = query.filter(or_(
+            Assessment.review_date < review_date,
+            and_(Assessment.review_date == review_date, Assessment.id < assessment_id)
+        ))
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.order_by(Assessment.review_date.desc(), Assessment.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": [serialize_assessment(row, fields) for row in rows],
+        "next_cursor": encode_cursor(secret_key, rows[-1].review_date, rows[-1].id) if has_more else None,
+        "has_more": has_more
+    }
@@ -0,0 +1,145 @@
+from markupsafe import escape
+from sqlalchemy import DateTime, text
+from typing import List, Dict, Any
+import logging
+import re
+
+from ..models import db
+from .assessment_queries import MAX_PAGE_SIZE, InvalidQuery
+
+logger = logging.getLogger(__name__)
+
+# Control characters mark matches in the raw snippet so the text can be
+# HTML-escaped before the <mark> tags are put in
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+SNIPPET_TOKENS = 24
+
+# FTS5 index over the searchable columns, kept in sync by triggers so that
+# bulk inserts and raw SQL writes are indexed too
+SQLITE_SETUP = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS assessment_fts USING fts5(
+        employee_name, position, review_text, additional_comments,
+        content='assessment', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_insert AFTER INSERT ON assessment BEGIN
+        INSERT INTO assessment_fts(rowid, employee_name, position, review_text, additional_comments)
+        VALUES (new.id, new.employee_name, new.position, new.review_text, new.additional_comments);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_delete AFTER DELETE ON assessment BEGIN
+        INSERT INTO assessment_fts(assessment_fts, rowid, employee_name, position, review_text, additional_comments)
+        VALUES ('delete', old.id, old.employee_name, old.position, old.review_text, old.additional_comments);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_update AFTER UPDATE OF
+        employee_name, position, review_text, additional_comments ON assessment BEGIN
+        INSERT INTO assessment_fts(assessment_fts, rowid, employee_name, position, review_text, additional_comments)
+        VALUES ('delete', old.id, old.employee_name, old.position, old.review_text, old.additional_comments);
+        INSERT INTO assessment_fts(rowid, employee_name, position, review_text, additional_comments)
+        VALUES (new.id, new.employee_name, new.position, new.review_text, new.additional_comments);
+    END"""
+]
+
+# A stored generated column is recomputed by PostgreSQL on every write, names
+# and positions weigh more than the review body. Each statement runs only when
+# its object is missing, so booting never takes the ALTER TABLE lock again.
+POSTGRES_SETUP = [
+    ("""SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'assessment' AND column_name = 'search_vector'""",
+    """ALTER TABLE assessment ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(employee_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(position, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(review_text, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(additional_comments, '')), 'D')
+    ) STORED"""),
+    ("SELECT to_regclass('ix_assessment_search_vector')",
+     "CREATE INDEX IF NOT EXISTS ix_assessment_search_vector ON assessment USING gin (search_vector)")
+]
+
+SQLITE_SEARCH = text(f"""
+    SELECT a.id, a.employee_id, a.employee_name, a.department, a.position, a.review_date, a.status,
+           -bm25(assessment_fts, 4.0, 2.0, 1.0, 0.5) AS rank,
+           snippet(assessment_fts, -1, '{_MATCH_START}', '{_MATCH_END}', '…', {SNIPPET_TOKENS}) AS snippet
+    FROM assessment_fts
+    JOIN assessment a ON a.id = assessment_fts.rowid
+    WHERE assessment_fts MATCH :query AND a.user_id = :user_id
+    ORDER BY bm25(assessment_fts, 4.0, 2.0, 1.0, 0.5), a.id DESC
+    LIMIT :limit OFFSET :offset
+""").columns(review_date=DateTime)
+
+POSTGRES_SEARCH = text(f"""
+    SELECT a.id, a.employee_id, a.employee_name, a.department, a.position, a.review_date, a.status,
+           ts_rank_cd(a.search_vector, q) AS rank,
+           ts_headline('english', concat_ws(' ', a.review_text, a.additional_comments), q,
+                       'StartSel={_MATCH_START}, StopSel={_MATCH_END}, MaxWords={SNIPPET_TOKENS}, MinWords=8, MaxFragments=2') AS snippet
+    FROM assessment a, websearch_to_tsquery('english', :query) q
+    WHERE a.search_vector @@ q AND a.user_id = :user_id
+    ORDER BY rank DESC, a.id DESC
+    LIMIT :limit OFFSET :offset
+""").columns(review_date=DateTime)
+
+
+def setup_search_index(engine):
+    """Create the dialect's full-text index and sync machinery if missing."""
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'assessment_fts'"
+            )).first()
+            for statement in SQLITE_SETUP:
+                conn.execute(text(statement))
+            if not exists:
+                # Index rows written before the table existed
+                conn.execute(text("INSERT INTO assessment_fts(assessment_fts) VALUES ('rebuild')"))
+        elif engine.dialect.name == "postgresql":
+            for exists, statement in POSTGRES_SETUP:
+                if conn.execute(text(exists)).scalar() is None:
+                    conn.execute(text(statement))
+        else:
+            logger.warning(f"Full-text search is not supported on {engine.dialect.name}")
+
+
+def fts5_query(query: str) -> str:
+    """Quote every term so user input can never be parsed as FTS5 syntax (terms are ANDed)."""
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escape a snippet and wrap the matched terms in <mark>."""
+    return str(escape(snippet or "")).replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+
+def search_assessments(user_id: int, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+    """Ranked full-text search over a user's assessments with highlighted snippets."""
+    if not query or not query.strip():
+        raise InvalidQuery("Missing search query")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+
+    dialect = db.engine.dialect.name
+    if dialect == "sqlite":
+        statement, query_param = SQLITE_SEARCH, fts5_query(query)
+        if not query_param:
+            raise InvalidQuery("Search query has no searchable terms")
+    elif dialect == "postgresql":
+        statement, query_param = POSTGRES_SEARCH, query
+    else:
+        raise InvalidQuery(f"Full-text search is not supported on {dialect}")
+
+    # Fetch one extra row to learn whether another page exists
+    rows = db.session.execute(statement, {
+        "query": query_param, "user_id": user_id, "limit": limit + 1, "offset": offset
+    }).mappings().all()
+    has_more = len(rows) > limit
+    results: List[Dict[str, Any]] = []
+    for row in rows[:limit]:
+        result = dict(row)
+        result["rank"] = float(result["rank"])
+        result["snippet"] = highlight(result["snippet"])
+        review_date = result["review_date"]
+        result["review_date"] = review_date.isoformat() if hasattr(review_date, "isoformat") else review_date
+        results.append(result)
+    return {
+        "items": results,
+        "next_offset": offset + limit if has_more else None,
+        "has_more": has_more
+    }
@@ -0,0 +1,279 @@
+from sqlalchemy import insert
+from sqlalchemy.orm.exc import StaleDataError
+from typing import List, Dict, Any, Optional, Iterator, Iterable, TextIO, Tuple
+from datetime import datetime
+from itertools import islice
+import asyncio
+import csv
+import io
+import json
+import logging
+
+from ..models import db, Assessment, AssessmentMetric
+from ..models.assessment import metric_values, typed_columns
+from .dashboard_stats import invalidate_dashboard_stats
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("jsonl", "csv")
+REQUIRED_FIELDS = ("employee_id", "employee_name", "department", "position", "review_text")
+JSON_FIELDS = ("performance_metrics", "sentiment_analysis", "promotion_recommendation")
+STATUSES = ("pending", "completed")
+# Keep the error report bounded on very large, very broken files
+MAX_REPORTED_ERRORS = 1000
+
+COPY_COLUMNS = (
+    "employee_id", "employee_name", "department", "position", "review_text",
+    "performance_metrics", "sentiment_analysis", "promotion_recommendation",
+    "additional_comments", "review_date", "status", "user_id", "analysis_version",
+    "overall_rating", "sentiment_score", "sentiment_label", "sentiment_confidence",
+    "promotion_recommended", "promotion_confidence"
+)
+
+
+def detect_format(filename: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """Guess the import format from a file name or content type (JSONL by default)."""
+    name = (filename or "").lower()
+    if name.endswith(".csv") or (content_type or "").startswith("text/csv"):
+        return "csv"
+    return "jsonl"
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, raw record) pairs one at a time from a JSONL or CSV text stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"invalid JSON: {e.msg}")
+    else:
+        raise ValueError(f"Unknown import format '{fmt}', expected one of {IMPORT_FORMATS}")
+
+
+def _json_text(value: Any, field: str) -> str:
+    """Stored JSON columns hold serialized text, matching how the forms write them."""
+    if value is None or value == "":
+        return json.dumps({})
+    if isinstance(value, str):
+        try:
+            json.loads(value)
+        except json.JSONDecodeError:
+            raise ValueError(f"{field} is not valid JSON")
+        return value
+    return json.dumps(value)
+
+
+def validate_record(record: Any, user_id: int) -> Dict[str, Any]:
+    """Turn one raw record into insert parameters, raising ValueError listing every problem."""
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("record must be a JSON object")
+
+    errors = [f"missing {field}" for field in REQUIRED_FIELDS if not str(record.get(field) or "").strip()]
+    row = {field: str(record.get(field) or "").strip() for field in REQUIRED_FIELDS}
+
+    for field in JSON_FIELDS:
+        try:
+            row[field] = _json_text(record.get(field), field)
+        except ValueError as e:
+            errors.append(str(e))
+
+    review_date = record.get("review_date")
+    try:
+        row["review_date"] = datetime.fromisoformat(review_date) if review_date else datetime.utcnow()
+    except (TypeError, ValueError):
+        errors.append("review_date is not an ISO 8601 date")
+
+    status = record.get("status") or "pending"
+    if status not in STATUSES:
+        errors.append(f"status must be one of {', '.join(STATUSES)}")
+    row["status"] = status
+
+    for field, limit in (("employee_id", 50), ("employee_name", 100), ("department", 50), ("position", 100)):
+        if len(row[field]) > limit:
+            errors.append(f"{field} is longer than {limit} characters")
+
+    if errors:
+        raise ValueError("; ".join(errors))
+    row["additional_comments"] = record.get("additional_comments") or None
+    row["user_id"] = user_id
+    # Completed rows arrive with their analysis, so they count as analyzed once (as in the versions migration)
+    row["analysis_version"] = 1 if status == "completed" else 0
+    # Bulk inserts skip the flush hook that normally derives these
+    row.update(typed_columns(row["performance_metrics"], row["sentiment_analysis"], row["promotion_recommendation"]))
+    return row
+
+
+def _copy_value(column: str, value: Any) -> Any:
+    if value is None:
+        return ""
+    if column in JSON_FIELDS:
+        # COPY skips the JSON column's bind processing, so encode the text the
+        # way the ORM and executemany paths store it
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy_buffer(rows: List[Dict[str, Any]]) -> io.StringIO:
+    """CSV text for COPY ... FROM STDIN, one line per row in COPY_COLUMNS order."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(column, row[column]) for column in COPY_COLUMNS])
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_rows(rows: List[Dict[str, Any]]):
+    """Insert rows with PostgreSQL COPY through the session's connection."""
+    buffer = _copy_buffer(rows)
+    raw_connection = db.session.connection().connection
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY assessment ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+
+
+def insert_batch(rows: List[Dict[str, Any]], return_ids: bool = False) -> List[int]:
+    """Insert one validated batch with a single statement.
+
+    Uses COPY on PostgreSQL (psycopg2) unless the new ids are needed, otherwise
+    a batched executemany INSERT. Ids are needed when requested and to link
+    the per-metric child rows, which are inserted with one more executemany.
+    """
+    if not rows:
+        return []
+    metrics = [metric_values(row["performance_metrics"]) for row in rows]
+    needs_ids = return_ids or any(metrics)
+    bind = db.session.get_bind()
+    if not needs_ids and bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+        _copy_rows(rows)
+        return []
+    if not needs_ids:
+        db.session.execute(insert(Assessment), rows)
+        return []
+
+    ids = list(db.session.scalars(insert(Assessment).returning(Assessment.id, sort_by_parameter_order=True), rows))
+    metric_rows = [
+        {"assessment_id": assessment_id, "name": name, "value": value}
+        for assessment_id, values in zip(ids, metrics)
+        for name, value in values.items()
+    ]
+    if metric_rows:
+        db.session.execute(insert(AssessmentMetric), metric_rows)
+    return ids if return_ids else []
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_assessments(
+    stream: TextIO,
+    fmt: str,
+    user_id: int,
+    batch_size: int = 1000,
+    return_ids: bool = False,
+    max_errors: Optional[int] = None
+) -> Dict[str, Any]:
+    """Stream-parse, validate and insert assessments in batches.
+
+    Only one batch of records is held in memory at a time and each batch is
+    committed on its own, so a failure partway through keeps earlier batches.
+    Invalid rows are skipped and reported with their line number. Stops early
+    once `max_errors` invalid rows have been seen. Must run in an app context.
+    """
+    result = {"total": 0, "imported": 0, "failed": 0, "errors": [], "ids": [], "stopped_early": False}
+
+    for chunk in _chunks(iter_records(stream, fmt), batch_size):
+        rows = []
+        for line_number, record in chunk:
+            result["total"] += 1
+            try:
+                rows.append(validate_record(record, user_id))
+            except ValueError as e:
+                result["failed"] += 1
+                if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                    result["errors"].append({"line": line_number, "error": str(e)})
+
+        try:
+            ids = insert_batch(rows, return_ids=return_ids)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error inserting import batch ending at line {chunk[-1][0]}: {str(e)}")
+            result["failed"] += len(rows)
+            if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                result["errors"].append({"line": chunk[-1][0], "error": f"batch insert failed: {str(e)}"})
+            continue
+
+        # Bulk inserts bypass the unit of work, so the stats cache is not told automatically
+        invalidate_dashboard_stats(user_id)
+        result["imported"] += len(rows)
+        result["ids"].extend(ids)
+        logger.info(f"Imported {result['imported']}/{result['total']} assessments")
+
+        if max_errors is not None and result["failed"] >= max_errors:
+            result["stopped_early"] = True
+            break
+
+    return result
+
+
+async def analyze_imported_assessments(app, pipeline, assessment_ids: List[int], batch_size: int = 50) -> Dict[str, int]:
+    """Run the pipeline over imported assessments and store the analysis.
+
+    Rows are loaded and updated in worker threads inside an app context, so
+    this coroutine can run on the shared background loop.
+    """
+    def load(ids):
+        with app.app_context():
+            return [{
+                "id": a.id,
+                "employee_id": a.employee_id,
+                "review_text": (f"Employee: {a.employee_name}\nPosition: {a.position}\n"
+                                f"Department: {a.department}\n\n{a.review_text}"),
+                "performance_metrics": json.loads(a.performance_metrics or "{}")
+            } for a in Assessment.query.filter(Assessment.id.in_(ids)).all()]
+
+    def store(updates):
+        with app.app_context():
+            for attempt in range(2):
+                for assessment_id, result in updates:
+                    db.session.get(Assessment, assessment_id).store_analysis(result)
+                try:
+                    db.session.commit()
+                    return len(updates)
+                except StaleDataError:
+                    # Rolling back expires the batch, so the retry reapplies on the current versions
+                    db.session.rollback()
+                    logger.warning(f"Imported assessments changed during analysis (attempt {attempt + 1})")
+            logger.error(f"Could not store the analysis of {len(updates)} imported assessments")
+            return 0
+
+    totals = {"analyzed": 0, "failed": 0}
+    for ids in _chunks(assessment_ids, batch_size):
+        reviews = await asyncio.to_thread(load, ids)
+        results = await pipeline.process_batch(reviews)
+        updates = [(review["id"], result) for review, result in zip(reviews, results) if result.get("status") == "success"]
+        stored = await asyncio.to_thread(store, updates)
+        totals["analyzed"] += stored
+        totals["failed"] += len(reviews) - stored
+    logger.info(f"Analyzed {totals['analyzed']} imported assessments ({totals['failed']} failed)")
+    return totals
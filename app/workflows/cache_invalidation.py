@@ -0,0 +1,52 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Iterable, Optional, Type
+
+
+def invalidate_on_commit(
+    name: str,
+    model: Type[Any],
+    keys_for: Callable[[Any], Iterable[Any]],
+    invalidate: Callable[[Optional[Any]], None],
+    include_new: bool = True,
+):
+    """Drop process-local cache entries once changes to `model` are committed.
+
+    Keys returned by `keys_for(instance)` are collected from every flush and
+    passed to `invalidate(key)` after the commit; a rollback discards them.
+    Invalidating on commit rather than flush keeps a concurrent request from
+    re-caching the pre-commit state after the entry was dropped. Bulk
+    Query.delete()/update() bypass the unit of work, so the affected keys are
+    unknown and `invalidate(None)` clears the whole cache instead.
+    """
+    keys_info = f"{name}_keys"
+    bulk_info = f"{name}_bulk_change"
+
+    @event.listens_for(Session, "after_flush")
+    def _collect_keys(session, flush_context):
+        changed = session.info.setdefault(keys_info, set())
+        instances = (*session.new, *session.dirty, *session.deleted) if include_new else (*session.dirty, *session.deleted)
+        for instance in instances:
+            if isinstance(instance, model):
+                changed.update(keys_for(instance))
+
+    @event.listens_for(Session, "after_commit")
+    def _invalidate_keys(session):
+        changed = session.info.pop(keys_info, set())
+        if session.info.pop(bulk_info, False):
+            invalidate(None)
+            return
+        for key in changed:
+            invalidate(key)
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_keys(session):
+        session.info.pop(keys_info, None)
+        session.info.pop(bulk_info, None)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _track_bulk_changes(orm_execute_state):
+        if (orm_execute_state.is_delete or orm_execute_state.is_update) and any(
+            mapper.class_ is model for mapper in orm_execute_state.all_mappers
+        ):
+            orm_execute_state.session.info[bulk_info] = True
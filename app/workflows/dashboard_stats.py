@@ -0,0 +1,92 @@
+from sqlalchemy import case, func, inspect
+from typing import Dict, Any, Optional
+import logging
+import threading
+import time
+
+from ..models import db, Assessment
+from .cache_invalidation import invalidate_on_commit
+
+logger = logging.getLogger(__name__)
+
+# Bounds staleness when another worker process changed the data
+DEFAULT_TTL_SECONDS = 300
+RECENT_LIMIT = 5
+
+_stats_cache: Dict[int, Any] = {}
+_stats_cache_lock = threading.Lock()
+
+
+def _count_where(condition):
+    return func.sum(case((condition, 1), else_=0)).over()
+
+
+def _load_dashboard_stats(user_id: int) -> Dict[str, Any]:
+    """Counts by status and the most recent assessments in a single query.
+
+    The window aggregates are computed over all of the user's rows before the
+    LIMIT applies, so every returned row carries the full totals.
+    """
+    rows = db.session.query(
+        Assessment.id,
+        Assessment.employee_id,
+        Assessment.employee_name,
+        Assessment.position,
+        Assessment.department,
+        Assessment.review_date,
+        Assessment.status,
+        Assessment.overall_rating,
+        func.count().over().label("total"),
+        _count_where(Assessment.status == "pending").label("pending"),
+        _count_where(Assessment.status == "completed").label("completed")
+    ).filter(
+        Assessment.user_id == user_id
+    ).order_by(
+        Assessment.review_date.desc(), Assessment.id.desc()
+    ).limit(RECENT_LIMIT).all()
+
+    first = rows[0] if rows else None
+    return {
+        "total": first.total if first else 0,
+        "pending": int(first.pending or 0) if first else 0,
+        "completed": int(first.completed or 0) if first else 0,
+        "recent": [{
+            "id": row.id,
+            "employee_id": row.employee_id,
+            "employee_name": row.employee_name,
+            "position": row.position,
+            "department": row.department,
+            "review_date": row.review_date,
+            "status": row.status,
+            "overall_rating": row.overall_rating
+        } for row in rows]
+    }
+
+
+def get_dashboard_stats(user_id: int, ttl: float = DEFAULT_TTL_SECONDS) -> Dict[str, Any]:
+    """Dashboard counts and recent assessments for a user, cached until their assessments change."""
+    now = time.monotonic()
+    cached = _stats_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    stats = _load_dashboard_stats(user_id)
+    with _stats_cache_lock:
+        _stats_cache[user_id] = (now + ttl, stats)
+    return stats
+
+
+def invalidate_dashboard_stats(user_id: Optional[int] = None):
+    """Drop the cached stats for one user, or for everyone when `user_id` is None."""
+    with _stats_cache_lock:
+        if user_id is None:
+            _stats_cache.clear()
+        else:
+            _stats_cache.pop(user_id, None)
+
+
+def _owners(assessment: Assessment):
+    # An assessment moved to another user also changes the previous owner's stats
+    return (assessment.user_id, *(inspect(assessment).attrs.user_id.history.deleted or ()))
+
+
+invalidate_on_commit("dashboard_stats", Assessment, _owners, invalidate_dashboard_stats)
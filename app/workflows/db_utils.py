@@ -1,15 +1,27 @@
 from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.vectorstores import PGVector
-from sqlalchemy import create_engine, text
+from langchain_community.vectorstores import FAISS, PGVector
+from langchain.schema import Document
+from sqlalchemy import bindparam, text
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import asyncio
 from datetime import datetime
+from functools import lru_cache, partial
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+from .lexical_index import review_lexical_index
+from .sharding import ShardedVectorIndex, add_embeddings, stored_embedding
+from .dedup import review_dedup_index
+from .engines import get_engine
+from .metadata_index import timestamp_bounds
+import uuid
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# text-embedding-ada-002; a fixed dimension lets pgvector build ANN indexes on the column
+EMBEDDING_DIMENSION = 1536
+
 async def setup_vector_store(connection_string: str, openai_api_key: str) -> Optional[PGVector]:
     """Initialize and setup the vector store in PostgreSQL."""
     try:
@@ -22,7 +34,11 @@ async def setup_vector_store(connection_string: str, openai_api_key: str) -> Opt
             embeddings,
             collection_name="employee_reviews",
             connection_string=connection_string,
+            connection=get_engine(connection_string),
+            embedding_length=EMBEDDING_DIMENSION,
         )
+        await asyncio.to_thread(seed_dedup_index, connection_string)
+        await asyncio.to_thread(_prepare_review_stats, connection_string)
         logger.info("Vector store initialized successfully")
         return vector_store
     except Exception as e:
@@ -32,24 +48,118 @@ async def setup_vector_store(connection_string: str, openai_api_key: str) -> Opt
             return None
         raise
 
+def shard_collection_name(collection_name: str, shard: str) -> str:
+    """Name of the pgvector collection holding one shard of a sharded review index."""
+    return f"{collection_name}__{shard}"
+
+async def setup_sharded_vector_store(
+    connection_string: str,
+    openai_api_key: str,
+    shard_by: str = "department",
+    num_shards: int = 8,
+    collection_name: str = "employee_reviews"
+) -> Optional[ShardedVectorIndex]:
+    """Initialize a review vector store sharded across pgvector collections.
+
+    Each shard lives in its own collection (e.g. "employee_reviews__engineering").
+    Existing shard collections are attached on startup; new ones are created on
+    first write. The returned index can be passed to add_review_to_vector_store and
+    batch_add_reviews_to_vector_store like a single PGVector store.
+    """
+    try:
+        embeddings = OpenAIEmbeddings(
+            openai_api_key=openai_api_key,
+            model="text-embedding-ada-002"
+        )
+
+        async def create_shard(name, texts, metadatas, ids):
+            return await PGVector.afrom_texts(
+                texts,
+                embeddings,
+                metadatas=metadatas,
+                ids=ids,
+                collection_name=shard_collection_name(collection_name, name),
+                connection_string=connection_string,
+                connection=get_engine(connection_string),
+                embedding_length=EMBEDDING_DIMENSION,
+            )
+
+        sharded = ShardedVectorIndex(embeddings, shard_by, num_shards, shard_factory=create_shard)
+
+        prefix = shard_collection_name(collection_name, "")
+        engine = get_engine(connection_string)
+        existing = []
+        with engine.connect() as connection:
+            if connection.execute(text("SELECT to_regclass('langchain_pg_collection');")).scalar():
+                existing = connection.execute(text("""
+                    SELECT name FROM langchain_pg_collection WHERE name LIKE :prefix;
+                """), {"prefix": prefix.replace("_", "\\_") + "%"}).fetchall()
+
+        for (name,) in existing:
+            shard = name[len(prefix):]
+            sharded.shards[shard] = await asyncio.to_thread(
+                PGVector,
+                connection_string=connection_string,
+                embedding_function=embeddings,
+                collection_name=name,
+                connection=get_engine(connection_string),
+                embedding_length=EMBEDDING_DIMENSION,
+            )
+        await asyncio.to_thread(seed_dedup_index, connection_string)
+        await asyncio.to_thread(_prepare_review_stats, connection_string)
+        logger.info(f"Sharded vector store initialized with {len(sharded.shards)} existing shards")
+        return sharded
+    except Exception as e:
+        logger.error(f"Error setting up sharded vector store: {str(e)}")
+        if "insufficient_quota" in str(e):
+            logger.warning("OpenAI API quota exceeded. Vector store functionality will be limited.")
+            return None
+        raise
+
 async def add_review_to_vector_store(
-    vector_store: Optional[PGVector],
+    vector_store: Optional[Union[PGVector, ShardedVectorIndex]],
     review_text: str,
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any],
+    deduplicate: bool = True
 ) -> bool:
-    """Add a new review to the vector store with metadata."""
+    """Add a new review to the vector store with metadata.
+
+    With `deduplicate`, a review that is a near-duplicate of one already stored
+    is written as its own row reusing the existing vector's embedding instead of
+    being embedded again.
+    """
+    metadata = {
+        **metadata,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    # The lexical index is local, so keep it current even when embeddings are unavailable
+    await asyncio.to_thread(review_lexical_index.ensure_loaded)
+    review_lexical_index.add(review_text, metadata)
+
     if vector_store is None:
         logger.warning("Vector store not available due to API quota limits. Skipping review addition.")
         return False
         
     try:
+        duplicate = review_dedup_index.find_duplicate(review_text) if deduplicate else None
+        if duplicate is not None:
+            canonical_id, similarity = duplicate
+            metadata = await _store_duplicate(vector_store, canonical_id, review_text, metadata)
+            review_dedup_index.link(canonical_id, review_text)
+            await asyncio.to_thread(record_review_stats, _stats_connection_string(vector_store), [metadata])
+            logger.info(f"Stored near-duplicate review for employee {metadata.get('employee_id')} "
+                        f"with the embedding of vector {canonical_id} (similarity {similarity:.2f})")
+            return True
+
+        vector_id = str(uuid.uuid4())
         await vector_store.aadd_texts(
             texts=[review_text],
-            metadatas=[{
-                **metadata,
-                "timestamp": datetime.utcnow().isoformat()
-            }]
+            metadatas=[metadata],
+            ids=[vector_id]
         )
+        if deduplicate:
+            review_dedup_index.add(vector_id, review_text)
+        await asyncio.to_thread(record_review_stats, _stats_connection_string(vector_store), [metadata])
         logger.info(f"Added review to vector store for employee {metadata.get('employee_id')}")
         return True
     except Exception as e:
@@ -59,10 +169,165 @@ async def add_review_to_vector_store(
             return False
         return False
 
+def _canonical_embedding(
+    vector_store: Union[PGVector, ShardedVectorIndex, FAISS],
+    vector_id: str
+) -> Optional[List[float]]:
+    """Read back the stored embedding of a canonical review, or None if it is not in the store."""
+    stores = list(vector_store.shards.values()) if isinstance(vector_store, ShardedVectorIndex) else [vector_store]
+    for store in stores:
+        if isinstance(store, FAISS):
+            embedding = stored_embedding(store, vector_id)
+            if embedding is not None:
+                return embedding
+        elif getattr(store, "connection_string", None):
+            # All collections share the table, so one lookup covers every pgvector shard
+            engine = get_engine(store.connection_string)
+            with engine.connect() as connection:
+                return connection.execute(text("""
+                    SELECT CAST(embedding AS real[])
+                    FROM langchain_pg_embedding
+                    WHERE custom_id = :vector_id
+                    LIMIT 1;
+                """), {"vector_id": vector_id}).scalar()
+    return None
+
+async def _store_duplicate(
+    vector_store: Union[PGVector, ShardedVectorIndex, FAISS],
+    canonical_id: str,
+    review_text: str,
+    metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Store a near-duplicate review as its own row, reusing the canonical review's embedding.
+
+    The row keeps the duplicate's own metadata (plus `duplicate_of`), so filtered
+    search and the statistics see it like any other review. If the canonical
+    vector cannot be read back the text is embedded after all. Returns the
+    stored metadata.
+    """
+    vector_id = str(uuid.uuid4())
+    metadata = {**metadata, "duplicate_of": canonical_id}
+    embedding = await asyncio.to_thread(_canonical_embedding, vector_store, canonical_id)
+    if embedding is None:
+        await vector_store.aadd_texts(texts=[review_text], metadatas=[metadata], ids=[vector_id])
+    elif isinstance(vector_store, ShardedVectorIndex):
+        await vector_store.aadd_embeddings([review_text], [list(embedding)], [metadata], [vector_id])
+    else:
+        await asyncio.to_thread(add_embeddings, vector_store, [review_text], [list(embedding)], [metadata], [vector_id])
+    return metadata
+
+_dedup_seeded = set()
+
+def seed_dedup_index(connection_string: str, page_size: int = 1000) -> int:
+    """Register the reviews already in langchain_pg_embedding with the near-duplicate index.
+
+    Runs once per process. Rows stored as near-duplicates are skipped so they
+    never become canonical themselves. Failures are logged; deduplication then
+    only covers reviews written since startup. Returns the number of reviews registered.
+    """
+    if connection_string in _dedup_seeded:
+        return 0
+    seeded = 0
+    try:
+        engine = get_engine(connection_string)
+        with engine.connect() as connection:
+            if not connection.execute(text("SELECT to_regclass('langchain_pg_embedding');")).scalar():
+                _dedup_seeded.add(connection_string)
+                return 0
+        last_uuid = "00000000-0000-0000-0000-000000000000"
+        while True:
+            with engine.connect() as connection:
+                rows = connection.execute(text("""
+                    SELECT uuid, custom_id, document
+                    FROM langchain_pg_embedding
+                    WHERE uuid > CAST(:after AS uuid)
+                      AND custom_id IS NOT NULL
+                      AND cmetadata->>'duplicate_of' IS NULL
+                    ORDER BY uuid
+                    LIMIT :page_size;
+                """), {"after": last_uuid, "page_size": page_size}).fetchall()
+            if not rows:
+                break
+            last_uuid = str(rows[-1][0])
+            for _, vector_id, document in rows:
+                review_dedup_index.add(vector_id, document or "")
+            seeded += len(rows)
+        _dedup_seeded.add(connection_string)
+        logger.info(f"Seeded near-duplicate index with {seeded} stored reviews")
+    except Exception as e:
+        logger.error(f"Error seeding near-duplicate index: {str(e)}")
+    return seeded
+
+def _metadata_filter_clauses(
+    department: Optional[str] = None,
+    position: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    start_date: Optional[Union[str, datetime]] = None,
+    end_date: Optional[Union[str, datetime]] = None
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Build SQL predicates over langchain_pg_embedding.cmetadata for the given filters."""
+    clauses = []
+    params = {}
+    for key, value in (("department", department), ("position", position), ("employee_id", employee_id)):
+        if value is not None:
+            clauses.append(f"e.cmetadata->>'{key}' = :{key}")
+            params[key] = str(value)
+    start, end = timestamp_bounds(start_date, end_date)
+    if start is not None:
+        clauses.append("e.cmetadata->>'timestamp' >= :start_date")
+        params["start_date"] = start
+    if end is not None:
+        clauses.append("e.cmetadata->>'timestamp' <= :end_date")
+        params["end_date"] = end
+    return clauses, params
+
+async def search_similar_reviews(
+    connection_string: str,
+    embeddings: OpenAIEmbeddings,
+    review_text: str,
+    limit: int = 3,
+    collection_name: str = "employee_reviews",
+    **filters: Any
+) -> List[Document]:
+    """Similarity search over the pgvector store with metadata filters applied in the WHERE clause.
+
+    Accepts the same filters as AssessmentPipeline.get_similar_reviews (department,
+    position, employee_id, start_date, end_date).
+    """
+    try:
+        query_vector = await embeddings.aembed_query(review_text)
+        clauses, params = _metadata_filter_clauses(**filters)
+        where = "".join(f" AND {clause}" for clause in clauses)
+
+        engine = get_engine(connection_string)
+        with engine.connect() as connection:
+            rows = connection.execute(text(f"""
+                SELECT e.document, e.cmetadata
+                FROM langchain_pg_embedding e
+                JOIN langchain_pg_collection c ON c.uuid = e.collection_id
+                WHERE c.name = :collection_name{where}
+                ORDER BY e.embedding <=> CAST(:query_vector AS vector)
+                LIMIT :limit;
+            """), {
+                **params,
+                "collection_name": collection_name,
+                "query_vector": "[" + ",".join(str(x) for x in query_vector) + "]",
+                "limit": limit
+            }).fetchall()
+
+        logger.info(f"Retrieved {len(rows)} filtered similar reviews")
+        return [Document(page_content=row[0], metadata=row[1] or {}) for row in rows]
+    except Exception as e:
+        logger.error(f"Error searching similar reviews: {str(e)}")
+        if "insufficient_quota" in str(e):
+            logger.warning("OpenAI API quota exceeded. Returning empty results.")
+            return []
+        raise
+
 def setup_metrics_table(connection_string: str):
     """Create the employee metrics table if it doesn't exist."""
     try:
-        engine = create_engine(connection_string)
+        engine = get_engine(connection_string)
         with engine.connect() as connection:
             connection.execute(text("""
                 CREATE TABLE IF NOT EXISTS employee_metrics (
@@ -87,76 +352,466 @@ def setup_metrics_table(connection_string: str):
         logger.error(f"Error setting up metrics table: {str(e)}")
         raise
 
+# OpenAI embeddings API request limits
+EMBEDDING_MAX_BATCH_INPUTS = 2048
+EMBEDDING_MAX_BATCH_TOKENS = 300_000
+
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("text-embedding-ada-002")
+    except Exception as e:
+        logger.warning(f"Token encoder unavailable, estimating token counts: {str(e)}")
+        return None
+
+def count_tokens(text: str) -> int:
+    """Number of embedding tokens in `text` (estimated at ~4 characters per token if tiktoken is unavailable)."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return len(encoder.encode(text, disallowed_special=()))
+
+def token_batches(
+    items: List[Tuple[str, str, Dict[str, Any]]],
+    max_items: int = 50,
+    max_tokens: int = 50_000
+) -> List[List[Tuple[str, str, Dict[str, Any]]]]:
+    """Split (vector_id, text, metadata) items into batches bounded by item count and total tokens."""
+    max_items = min(max_items, EMBEDDING_MAX_BATCH_INPUTS)
+    max_tokens = min(max_tokens, EMBEDDING_MAX_BATCH_TOKENS)
+    batches, current, current_tokens = [], [], 0
+    for item in items:
+        tokens = count_tokens(item[1])
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+def _is_quota_error(error: Any) -> bool:
+    return "insufficient_quota" in str(error)
+
+def _review_error(metadata: Dict[str, Any], error: str) -> Dict[str, Any]:
+    # assessment_id is present for reviews read from the assessment table, so failures can be retried
+    return {"employee_id": metadata.get("employee_id"), "assessment_id": metadata.get("assessment_id"), "error": error}
+
 async def batch_add_reviews_to_vector_store(
-    vector_store: Optional[PGVector],
+    vector_store: Optional[Union[PGVector, ShardedVectorIndex]],
     reviews: List[Dict[str, Any]],
-    batch_size: int = 50
+    batch_size: int = 50,
+    deduplicate: bool = True,
+    max_batch_tokens: int = 50_000,
+    max_concurrent_batches: int = 4,
+    max_retries: int = 3
 ) -> Dict[str, Any]:
-    """Add multiple reviews to the vector store in batches."""
+    """Add multiple reviews to the vector store in batches.
+
+    Batches hold at most `batch_size` reviews and `max_batch_tokens` embedding
+    tokens, and up to `max_concurrent_batches` are written at once. When a batch
+    fails, its reviews are retried one by one (with exponential backoff, up to
+    `max_retries` attempts each) so that only the reviews that keep failing are
+    reported as failed. An insufficient_quota error stops all remaining work.
+
+    With `deduplicate`, near-duplicates of already stored reviews (or of earlier
+    reviews in the same call) are stored reusing the existing vector's embedding
+    instead of being embedded; they count as successful and are reported under
+    "deduplicated".
+    """
+    metadatas = [{
+        "employee_id": r["employee_id"],
+        "timestamp": r.get("timestamp") or datetime.utcnow().isoformat(),
+        "department": r.get("department", ""),
+        "position": r.get("position", ""),
+        **({"assessment_id": r["assessment_id"]} if "assessment_id" in r else {})
+    } for r in reviews]
+    await asyncio.to_thread(review_lexical_index.ensure_loaded)
+    review_lexical_index.add_many([r["review_text"] for r in reviews], metadatas)
+
     if vector_store is None:
         logger.warning("Vector store not available due to API quota limits. Skipping batch addition.")
         return {
             "total": len(reviews),
             "successful": 0,
-            "failed": len(reviews)
+            "failed": len(reviews),
+            "deduplicated": 0,
+            "errors": [_review_error(metadata, "vector store not available") for metadata in metadatas]
         }
-        
-    total = len(reviews)
-    successful = 0
-    failed = 0
-    
-    for i in range(0, total, batch_size):
-        batch = reviews[i:i + batch_size]
-        try:
-            texts = [r["review_text"] for r in batch]
-            metadatas = [{
-                "employee_id": r["employee_id"],
-                "timestamp": datetime.utcnow().isoformat(),
-                "department": r.get("department", ""),
-                "position": r.get("position", "")
-            } for r in batch]
-            
-            await vector_store.aadd_texts(texts=texts, metadatas=metadatas)
-            successful += len(batch)
-            logger.info(f"Successfully processed batch {i//batch_size + 1}")
-        except Exception as e:
-            failed += len(batch)
-            logger.error(f"Error processing batch {i//batch_size + 1}: {str(e)}")
-            if "insufficient_quota" in str(e):
-                logger.warning("OpenAI API quota exceeded. Stopping batch processing.")
-                break
-    
+
+    items, links = [], []
+    for review, metadata in zip(reviews, metadatas):
+        duplicate = review_dedup_index.find_duplicate(review["review_text"]) if deduplicate else None
+        if duplicate is not None:
+            links.append((duplicate[0], review["review_text"], metadata))
+            continue
+        vector_id = str(uuid.uuid4())
+        if deduplicate:
+            # Register before writing so later reviews in this call are matched too
+            review_dedup_index.add(vector_id, review["review_text"])
+        items.append((vector_id, review["review_text"], metadata))
+
+    batches = token_batches(items, max_items=batch_size, max_tokens=max_batch_tokens)
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+    quota_exhausted = asyncio.Event()
+    failed_ids = set()
+    errors = []
+
+    async def write(batch):
+        await vector_store.aadd_texts(
+            texts=[text for _, text, _ in batch],
+            metadatas=[metadata for _, _, metadata in batch],
+            ids=[vector_id for vector_id, _, _ in batch]
+        )
+
+    def fail(item, error: str):
+        failed_ids.add(item[0])
+        errors.append(_review_error(item[2], error))
+
+    async def write_batch(batch_number: int, batch):
+        async with semaphore:
+            if quota_exhausted.is_set():
+                for item in batch:
+                    fail(item, "skipped: OpenAI API quota exceeded")
+                return
+            try:
+                await write(batch)
+                logger.info(f"Successfully processed batch {batch_number} ({len(batch)} reviews)")
+                return
+            except Exception as e:
+                if _is_quota_error(e):
+                    logger.warning("OpenAI API quota exceeded. Stopping batch processing.")
+                    quota_exhausted.set()
+                    for item in batch:
+                        fail(item, str(e))
+                    return
+                logger.warning(f"Batch {batch_number} failed, retrying its reviews individually: {str(e)}")
+
+            for item in batch:
+                if quota_exhausted.is_set():
+                    fail(item, "skipped: OpenAI API quota exceeded")
+                    continue
+                try:
+                    async for attempt in AsyncRetrying(
+                        stop=stop_after_attempt(max_retries),
+                        wait=wait_exponential(multiplier=1, min=1, max=10),
+                        retry=retry_if_exception(lambda e: not _is_quota_error(e)),
+                        reraise=True
+                    ):
+                        with attempt:
+                            await write([item])
+                except Exception as e:
+                    if _is_quota_error(e):
+                        quota_exhausted.set()
+                    logger.error(f"Error adding review for employee {item[2].get('employee_id')}: {str(e)}")
+                    fail(item, str(e))
+
+    await asyncio.gather(*(write_batch(number, batch) for number, batch in enumerate(batches, start=1)))
+
+    for vector_id in failed_ids:
+        review_dedup_index.remove(vector_id)
+
+    duplicates = []
+
+    async def store_link(vector_id: str, review_text: str, metadata: Dict[str, Any]):
+        if vector_id in failed_ids:
+            errors.append(_review_error(metadata, "near-duplicate of a review that failed"))
+            return
+        async with semaphore:
+            try:
+                duplicates.append(await _store_duplicate(vector_store, vector_id, review_text, metadata))
+                review_dedup_index.link(vector_id, review_text)
+            except Exception as e:
+                logger.error(f"Error storing near-duplicate review for employee {metadata.get('employee_id')}: {str(e)}")
+                errors.append(_review_error(metadata, str(e)))
+
+    await asyncio.gather(*(store_link(*link) for link in links))
+    deduplicated = len(duplicates)
+
+    if deduplicate:
+        logger.info(f"Deduplication savings: {review_dedup_index.stats()}")
+
+    await asyncio.to_thread(
+        record_review_stats,
+        _stats_connection_string(vector_store),
+        [metadata for vector_id, _, metadata in items if vector_id not in failed_ids] + duplicates
+    )
+
+    failed = len(errors)
     return {
-        "total": total,
-        "successful": successful,
-        "failed": failed
+        "total": len(reviews),
+        "successful": len(reviews) - failed,
+        "failed": failed,
+        "deduplicated": deduplicated,
+        "errors": errors
     }
 
+def _fetch_assessment_page(
+    connection_string: str,
+    after_id: int,
+    page_size: int,
+    assessment_ids: Optional[List[int]] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the next page of assessments after `after_id` using keyset pagination, optionally only `assessment_ids`."""
+    engine = get_engine(connection_string)
+    params = {"after_id": after_id, "page_size": page_size}
+    id_filter = ""
+    if assessment_ids is not None:
+        id_filter = " AND id IN :assessment_ids"
+        params["assessment_ids"] = list(assessment_ids)
+    statement = text(f"""
+        SELECT id, employee_id, department, position, review_text, review_date
+        FROM assessment
+        WHERE id > :after_id{id_filter}
+        ORDER BY id
+        LIMIT :page_size;
+    """)
+    if assessment_ids is not None:
+        statement = statement.bindparams(bindparam("assessment_ids", expanding=True))
+    with engine.connect() as connection:
+        rows = connection.execute(statement, params).fetchall()
+    return [{
+        "assessment_id": row[0],
+        "employee_id": row[1],
+        "department": row[2],
+        "position": row[3],
+        "review_text": row[4],
+        "timestamp": row[5].isoformat() if isinstance(row[5], datetime) else row[5]
+    } for row in rows]
+
+def iter_assessment_reviews(connection_string: str, page_size: int = 500):
+    """Yield (review_text, metadata) for every stored assessment, one keyset page at a time."""
+    last_id = 0
+    while True:
+        page = _fetch_assessment_page(connection_string, last_id, page_size)
+        if not page:
+            return
+        last_id = page[-1]["assessment_id"]
+        for row in page:
+            yield row.pop("review_text"), row
+
+async def backfill_vector_store_from_assessments(
+    vector_store: Optional[Union[PGVector, ShardedVectorIndex]],
+    connection_string: str,
+    after_id: int = 0,
+    page_size: int = 500,
+    assessment_ids: Optional[List[int]] = None,
+    **batch_options: Any
+) -> Dict[str, Any]:
+    """Index historical reviews by streaming the assessment table into the vector store.
+
+    Rows are read in primary-key order with keyset pagination (`WHERE id > :last_id`),
+    and the next page is fetched while the current one is being embedded, so the
+    backfill is bounded by embedding throughput rather than the database loop.
+    `batch_options` are passed to batch_add_reviews_to_vector_store.
+
+    Every id up to the returned "last_id" was attempted; pass it back as
+    `after_id` to resume an interrupted backfill. Rows that failed are listed in
+    "failed_ids"; pass them as `assessment_ids` to retry only those rows.
+    """
+    totals = {
+        "total": 0, "successful": 0, "failed": 0, "deduplicated": 0,
+        "errors": [], "failed_ids": [], "last_id": after_id
+    }
+    fetch_page = partial(_fetch_assessment_page, connection_string, page_size=page_size, assessment_ids=assessment_ids)
+    page = await asyncio.to_thread(fetch_page, after_id)
+
+    while page:
+        last_id = page[-1]["assessment_id"]
+        next_page = asyncio.create_task(asyncio.to_thread(fetch_page, last_id))
+        result = await batch_add_reviews_to_vector_store(vector_store, page, **batch_options)
+        for key in ("total", "successful", "failed", "deduplicated"):
+            totals[key] += result[key]
+        totals["errors"].extend(result["errors"])
+        totals["failed_ids"].extend(sorted({
+            error["assessment_id"] for error in result["errors"] if error.get("assessment_id") is not None
+        }))
+        totals["last_id"] = last_id
+        logger.info(f"Backfilled assessments up to id {last_id} ({totals['successful']}/{totals['total']} indexed)")
+
+        if vector_store is None or any(_is_quota_error(error["error"]) for error in result["errors"]):
+            next_page.cancel()
+            logger.warning(f"Stopping backfill after assessment id {last_id}")
+            break
+        page = await next_page
+
+    return totals
+
+_review_stats_ready = set()
+
+def setup_review_stats_tables(connection_string: str) -> bool:
+    """Create the incrementally maintained review statistics tables.
+
+    review_stats holds a single row of totals, review_stats_departments one row
+    per department and review_stats_employees one row per employee (for the
+    distinct employee count). When the tables are created they are seeded once
+    from langchain_pg_embedding; afterwards record_review_stats keeps them current.
+    Returns True if this call seeded them.
+    """
+    if connection_string in _review_stats_ready:
+        return False
+    seeded = False
+    try:
+        engine = get_engine(connection_string)
+        with engine.begin() as connection:
+            connection.execute(text("""
+                CREATE TABLE IF NOT EXISTS review_stats (
+                    id INT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+                    total_reviews BIGINT NOT NULL DEFAULT 0,
+                    unique_employees BIGINT NOT NULL DEFAULT 0,
+                    oldest_review TIMESTAMP,
+                    newest_review TIMESTAMP,
+                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS review_stats_departments (
+                    department VARCHAR(100) PRIMARY KEY,
+                    count BIGINT NOT NULL DEFAULT 0
+                );
+
+                CREATE TABLE IF NOT EXISTS review_stats_employees (
+                    employee_id VARCHAR(50) PRIMARY KEY,
+                    count BIGINT NOT NULL DEFAULT 0
+                );
+            """))
+            # Lock the singleton row's table so concurrent workers seed only once
+            connection.execute(text("LOCK TABLE review_stats IN EXCLUSIVE MODE;"))
+            if connection.execute(text("SELECT 1 FROM review_stats WHERE id = 1;")).scalar() is None:
+                _seed_review_stats(connection)
+                seeded = True
+        _review_stats_ready.add(connection_string)
+        logger.info("Review statistics tables setup completed")
+        return seeded
+    except Exception as e:
+        logger.error(f"Error setting up review statistics tables: {str(e)}")
+        raise
+
+def _prepare_review_stats(connection_string: str):
+    # Create and seed the statistics before the first write, so no write is counted twice
+    try:
+        setup_review_stats_tables(connection_string)
+    except Exception:
+        pass  # Logged by setup_review_stats_tables; record_review_stats retries on the next write
+
+def _seed_review_stats(connection):
+    """Populate the statistics tables from the reviews already in langchain_pg_embedding."""
+    has_embeddings = connection.execute(text("SELECT to_regclass('langchain_pg_embedding');")).scalar()
+    if has_embeddings:
+        connection.execute(text("""
+            INSERT INTO review_stats_departments (department, count)
+            SELECT cmetadata->>'department', COUNT(*)
+            FROM langchain_pg_embedding
+            WHERE COALESCE(cmetadata->>'department', '') <> ''
+            GROUP BY cmetadata->>'department';
+
+            INSERT INTO review_stats_employees (employee_id, count)
+            SELECT cmetadata->>'employee_id', COUNT(*)
+            FROM langchain_pg_embedding
+            WHERE cmetadata->>'employee_id' IS NOT NULL
+            GROUP BY cmetadata->>'employee_id';
+
+            INSERT INTO review_stats (id, total_reviews, unique_employees, oldest_review, newest_review)
+            SELECT
+                1,
+                COUNT(*),
+                (SELECT COUNT(*) FROM review_stats_employees),
+                MIN(cmetadata->>'timestamp')::timestamp,
+                MAX(cmetadata->>'timestamp')::timestamp
+            FROM langchain_pg_embedding;
+        """))
+    else:
+        connection.execute(text("INSERT INTO review_stats (id) VALUES (1);"))
+    logger.info("Seeded review statistics from existing embeddings")
+
+def _stats_connection_string(vector_store: Optional[Union[PGVector, ShardedVectorIndex]]) -> Optional[str]:
+    if isinstance(vector_store, ShardedVectorIndex):
+        vector_store = next(iter(vector_store.shards.values()), None)
+    return getattr(vector_store, "connection_string", None)
+
+def record_review_stats(connection_string: Optional[str], metadatas: List[Dict[str, Any]]):
+    """Fold newly stored reviews into the statistics tables.
+
+    The batch is aggregated in memory first, so each call is a fixed handful of
+    statements in one transaction regardless of how many reviews it covers.
+    Failures are logged and never fail the write that triggered them.
+    """
+    if not connection_string or not metadatas:
+        return
+    departments: Dict[str, int] = {}
+    employees: Dict[str, int] = {}
+    timestamps = []
+    for metadata in metadatas:
+        if metadata.get("department"):
+            departments[metadata["department"]] = departments.get(metadata["department"], 0) + 1
+        if metadata.get("employee_id") is not None:
+            employee_id = str(metadata["employee_id"])
+            employees[employee_id] = employees.get(employee_id, 0) + 1
+        if metadata.get("timestamp"):
+            timestamps.append(str(metadata["timestamp"]))
+
+    try:
+        if setup_review_stats_tables(connection_string):
+            # The seed already counted these reviews, they were written before this call
+            return
+        engine = get_engine(connection_string)
+        with engine.begin() as connection:
+            new_employees = 0
+            if employees:
+                new_employees = connection.execute(text("""
+                    WITH upserted AS (
+                        INSERT INTO review_stats_employees (employee_id, count)
+                        SELECT * FROM unnest(CAST(:employee_ids AS VARCHAR[]), CAST(:counts AS BIGINT[]))
+                        ON CONFLICT (employee_id) DO UPDATE
+                        SET count = review_stats_employees.count + EXCLUDED.count
+                        RETURNING (xmax = 0) AS inserted
+                    )
+                    SELECT COUNT(*) FILTER (WHERE inserted) FROM upserted;
+                """), {"employee_ids": list(employees), "counts": list(employees.values())}).scalar()
+            if departments:
+                connection.execute(text("""
+                    INSERT INTO review_stats_departments (department, count)
+                    SELECT * FROM unnest(CAST(:departments AS VARCHAR[]), CAST(:counts AS BIGINT[]))
+                    ON CONFLICT (department) DO UPDATE
+                    SET count = review_stats_departments.count + EXCLUDED.count;
+                """), {"departments": list(departments), "counts": list(departments.values())})
+            connection.execute(text("""
+                UPDATE review_stats SET
+                    total_reviews = total_reviews + :reviews,
+                    unique_employees = unique_employees + :new_employees,
+                    oldest_review = LEAST(oldest_review, CAST(:oldest AS timestamp)),
+                    newest_review = GREATEST(newest_review, CAST(:newest AS timestamp)),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = 1;
+            """), {
+                "reviews": len(metadatas),
+                "new_employees": new_employees,
+                "oldest": min(timestamps) if timestamps else None,
+                "newest": max(timestamps) if timestamps else None
+            })
+    except Exception as e:
+        logger.error(f"Error updating review statistics: {str(e)}")
+
 def get_review_statistics(connection_string: str) -> Dict[str, Any]:
     """Get statistics about stored reviews and embeddings."""
     try:
-        engine = create_engine(connection_string)
+        setup_review_stats_tables(connection_string)
+        engine = get_engine(connection_string)
         with engine.connect() as connection:
-            # Get vector store statistics
             vector_stats = connection.execute(text("""
-                SELECT 
-                    COUNT(*) as total_reviews,
-                    COUNT(DISTINCT metadata->>'employee_id') as unique_employees,
-                    MIN(metadata->>'timestamp')::timestamp as oldest_review,
-                    MAX(metadata->>'timestamp')::timestamp as newest_review
-                FROM langchain_pg_embedding;
+                SELECT total_reviews, unique_employees, oldest_review, newest_review
+                FROM review_stats
+                WHERE id = 1;
             """)).fetchone()
-            
-            # Get department distribution
+
             dept_dist = connection.execute(text("""
-                SELECT 
-                    metadata->>'department' as department,
-                    COUNT(*) as count
-                FROM langchain_pg_embedding
-                GROUP BY metadata->>'department'
+                SELECT department, count
+                FROM review_stats_departments
+                WHERE count > 0
                 ORDER BY count DESC;
             """)).fetchall()
-            
+
             return {
                 "total_reviews": vector_stats[0],
                 "unique_employees": vector_stats[1],
@@ -168,4 +823,53 @@ def get_review_statistics(connection_string: str) -> Dict[str, Any]:
             }
     except Exception as e:
         logger.error(f"Error getting review statistics: {str(e)}")
-        return {} 
\ No newline at end of file
+        return {}
+
+_vector_archive_ready = set()
+
+def archive_review_vectors(connection_string: str, assessment_ids: List[int]) -> int:
+    """Move the embeddings of archived assessments out of the hot table.
+
+    Rows whose cmetadata assessment_id is one of `assessment_ids` go to
+    langchain_pg_embedding_archive (same columns, no ANN index) in one
+    DELETE ... RETURNING transaction, found through the assessment_id
+    expression index. Vectors written without an assessment_id are left in
+    place. Call reseed_review_stats once the run is done. Returns the number
+    of vectors moved.
+    """
+    if not assessment_ids:
+        return 0
+    engine = get_engine(connection_string)
+    with engine.begin() as connection:
+        if connection_string not in _vector_archive_ready:
+            if not connection.execute(text("SELECT to_regclass('langchain_pg_embedding');")).scalar():
+                return 0
+            connection.execute(text("""
+                CREATE TABLE IF NOT EXISTS langchain_pg_embedding_archive
+                (LIKE langchain_pg_embedding INCLUDING DEFAULTS);
+            """))
+            _vector_archive_ready.add(connection_string)
+        moved = connection.execute(text("""
+            WITH moved AS (
+                DELETE FROM langchain_pg_embedding
+                WHERE cmetadata->>'assessment_id' = ANY(CAST(:assessment_ids AS TEXT[]))
+                RETURNING *
+            ), archived AS (
+                INSERT INTO langchain_pg_embedding_archive SELECT * FROM moved RETURNING 1
+            )
+            SELECT COUNT(*) FROM archived;
+        """), {"assessment_ids": [str(assessment_id) for assessment_id in assessment_ids]}).scalar()
+    logger.info(f"Archived {moved} review vectors of {len(assessment_ids)} assessments")
+    return moved
+
+def reseed_review_stats(connection_string: str):
+    """Recompute the review statistics from the hot table, e.g. after vectors were archived."""
+    try:
+        setup_review_stats_tables(connection_string)
+        engine = get_engine(connection_string)
+        with engine.begin() as connection:
+            connection.execute(text("LOCK TABLE review_stats IN EXCLUSIVE MODE;"))
+            connection.execute(text("DELETE FROM review_stats_employees; DELETE FROM review_stats_departments; DELETE FROM review_stats;"))
+            _seed_review_stats(connection)
+    except Exception as e:
+        logger.error(f"Error re-seeding review statistics: {str(e)}")
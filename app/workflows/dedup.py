@@ -0,0 +1,136 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+import re
+import threading
+import zlib
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Hash family parameters (same construction as datasketch's MinHash)
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """Word n-gram shingles of a review; short texts fall back to their word set."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick (bands, rows) so that the LSH S-curve crosses `threshold` as closely as possible."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """Computes MinHash signatures of review text."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Return the MinHash signature of `text`, or None if it has no shingles."""
+        items = shingles(text)
+        if not items:
+            return None
+        hashes = np.fromiter((zlib.crc32(item.encode("utf-8")) for item in items), dtype=np.uint64, count=len(items))
+        with np.errstate(over="ignore"):
+            permuted = np.bitwise_and((np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME, MAX_HASH)
+        return permuted.min(axis=0)
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH index used to skip embedding near-identical reviews.
+
+    Each canonical review is registered under the id of the vector that was
+    written for it. Later reviews whose estimated Jaccard similarity to a
+    canonical review reaches `threshold` reuse that vector's embedding instead
+    of being embedded again.
+    """
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 128):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, Set[str]]] = [defaultdict(set) for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._stats = {"checked": 0, "duplicates": 0, "characters_saved": 0}
+        self._lock = threading.Lock()
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def find_duplicate(self, text: str) -> Optional[Tuple[str, float]]:
+        """Return (vector_id, estimated similarity) of the closest canonical review above the threshold."""
+        signature = self.hasher.signature(text)
+        with self._lock:
+            self._stats["checked"] += 1
+            if signature is None:
+                return None
+
+            candidates: Set[str] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates |= self._buckets[band].get(key, set())
+
+            best = None
+            for vector_id in candidates:
+                similarity = float(np.mean(self._signatures[vector_id] == signature))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (vector_id, similarity)
+            return best
+
+    def add(self, vector_id: str, text: str):
+        """Register a review that was embedded and stored under `vector_id`."""
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return
+        with self._lock:
+            self._signatures[vector_id] = signature
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band][key].add(vector_id)
+
+    def remove(self, vector_id: str):
+        """Forget a canonical review, e.g. because its vector write failed."""
+        with self._lock:
+            signature = self._signatures.pop(vector_id, None)
+            if signature is None:
+                return
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band][key].discard(vector_id)
+
+    def link(self, vector_id: str, text: str):
+        """Count a near-duplicate review stored with the embedding of `vector_id`."""
+        with self._lock:
+            self._stats["duplicates"] += 1
+            self._stats["characters_saved"] += len(text)
+
+    def stats(self) -> Dict[str, Any]:
+        """Deduplication savings since startup."""
+        with self._lock:
+            checked = self._stats["checked"]
+            return {
+                **self._stats,
+                "canonical_reviews": len(self._signatures),
+                "dedup_ratio": self._stats["duplicates"] / checked if checked else 0.0
+            }
+
+
+# Process-wide near-duplicate index consulted by the vector store write helpers in db_utils
+review_dedup_index = NearDuplicateIndex()
@@ -0,0 +1,83 @@
+from sqlalchemy import Integer, cast, extract, func, select
+from typing import List, Dict, Any
+from datetime import datetime
+
+from ..models import db, Assessment
+
+DEFAULT_ROLLING_WINDOW = 4
+MAX_ROLLING_WINDOW = 20
+
+
+def _review_quarter():
+    # Integer floor division renders as plain integer "/" on both SQLite and PostgreSQL
+    return (cast(extract('month', Assessment.review_date), Integer) + 2) // 3
+
+
+def employee_timeline_statement(user_id: int, employee_id: str, window: int = DEFAULT_ROLLING_WINDOW):
+    """One statement computing an employee's trend metrics with window functions.
+
+    The inner query covers every assessment of the user in the employee's
+    departments, so department ranks compare against peers reviewed in the
+    same quarter; the outer query keeps the employee's rows and derives the
+    deltas. Per-employee windows read the (employee_id, review_date) index order.
+    """
+    by_employee = {
+        "partition_by": Assessment.employee_id,
+        "order_by": (Assessment.review_date, Assessment.id)
+    }
+    rolling = {**by_employee, "rows": (-(window - 1), 0)}
+    year = cast(extract('year', Assessment.review_date), Integer)
+    quarter = _review_quarter()
+    departments = select(Assessment.department).where(
+        Assessment.user_id == user_id, Assessment.employee_id == employee_id
+    )
+
+    history = select(
+        Assessment.id,
+        Assessment.employee_id,
+        Assessment.employee_name,
+        Assessment.department,
+        Assessment.position,
+        Assessment.review_date,
+        Assessment.status,
+        Assessment.overall_rating,
+        Assessment.sentiment_score,
+        Assessment.promotion_recommended,
+        year.label("review_year"),
+        quarter.label("review_quarter"),
+        func.lag(Assessment.overall_rating).over(**by_employee).label("previous_rating"),
+        func.lag(Assessment.sentiment_score).over(**by_employee).label("previous_sentiment"),
+        func.avg(Assessment.overall_rating).over(**rolling).label("rolling_rating"),
+        func.avg(Assessment.sentiment_score).over(**rolling).label("rolling_sentiment"),
+        func.rank().over(
+            partition_by=(Assessment.department, year, quarter),
+            order_by=Assessment.overall_rating.desc().nulls_last()
+        ).label("department_rank"),
+        func.count().over(partition_by=(Assessment.department, year, quarter)).label("department_size")
+    ).where(
+        Assessment.user_id == user_id,
+        Assessment.department.in_(departments)
+    ).subquery()
+
+    return select(
+        history,
+        (history.c.overall_rating - history.c.previous_rating).label("rating_delta"),
+        (history.c.sentiment_score - history.c.previous_sentiment).label("sentiment_delta")
+    ).where(
+        history.c.employee_id == employee_id
+    ).order_by(history.c.review_date, history.c.id)
+
+
+def get_employee_timeline(user_id: int, employee_id: str, window: int = DEFAULT_ROLLING_WINDOW) -> List[Dict[str, Any]]:
+    """An employee's assessments, oldest first, with deltas, rolling averages and department rank."""
+    window = max(1, min(window, MAX_ROLLING_WINDOW))
+    rows = db.session.execute(employee_timeline_statement(user_id, employee_id, window)).mappings().all()
+    timeline = []
+    for row in rows:
+        entry = dict(row)
+        entry["review_date"] = entry["review_date"].isoformat() if isinstance(entry["review_date"], datetime) else entry["review_date"]
+        entry["review_quarter"] = f"{entry.pop('review_year')}Q{entry['review_quarter']}"
+        for key in ("rolling_rating", "rolling_sentiment"):
+            entry[key] = float(entry[key]) if entry[key] is not None else None
+        timeline.append(entry)
+    return timeline
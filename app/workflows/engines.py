@@ -0,0 +1,106 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from typing import Dict, Any
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[str, Engine] = {}
+_pool_counters: Dict[str, Dict[str, int]] = {}
+_engines_lock = threading.Lock()
+
+
+def _engine_key(url: Any) -> str:
+    return make_url(url).render_as_string(hide_password=False)
+
+
+def engine_options(url: Any) -> Dict[str, Any]:
+    """Pool settings from Config for an engine on `url`.
+
+    Pool sizing only applies to server databases; SQLite keeps its default pool.
+    """
+    from config import Config
+
+    options = {
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+        "pool_recycle": Config.DB_POOL_RECYCLE
+    }
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=Config.DB_POOL_SIZE,
+            max_overflow=Config.DB_MAX_OVERFLOW,
+            pool_timeout=Config.DB_POOL_TIMEOUT
+        )
+    return options
+
+
+def _instrument(key: str, engine: Engine):
+    counters = _pool_counters.setdefault(key, {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0})
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        counters["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        counters["checkouts"] += 1
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        counters["checkins"] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        counters["invalidations"] += 1
+
+
+def register_engine(engine: Engine) -> Engine:
+    """Share an engine created elsewhere (e.g. Flask-SQLAlchemy's) for its URL.
+
+    Returns the registered engine, which is the existing one if the URL was
+    already registered.
+    """
+    key = _engine_key(engine.url)
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = engine
+            _instrument(key, engine)
+        return _engines[key]
+
+
+def get_engine(url: Any) -> Engine:
+    """Return the process-wide pooled engine for `url`, creating it on first use."""
+    key = _engine_key(url)
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = create_engine(url, **engine_options(url))
+                _engines[key] = engine
+                _instrument(key, engine)
+                logger.info(f"Created pooled engine for {make_url(url).render_as_string(hide_password=True)}")
+    return engine
+
+
+def pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Current pool usage and lifetime counters for every registered engine."""
+    metrics = {}
+    for key, engine in list(_engines.items()):
+        pool = engine.pool
+        stats = {"pool": type(pool).__name__, **_pool_counters.get(key, {})}
+        # Only QueuePool-style pools report occupancy
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                stats[name] = method()
+        metrics[engine.url.render_as_string(hide_password=True)] = stats
+    return metrics
+
+
+def dispose_engines():
+    """Close all pooled connections, e.g. after forking a worker process."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
@@ -0,0 +1,92 @@
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Optional
+import asyncio
+import atexit
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop running forever in a daemon thread.
+
+    Synchronous code (Flask views, scripts) submits coroutines from any thread
+    and waits on the returned future. Because the loop outlives requests,
+    async clients, locks and vector-store sessions created on it can be reused.
+    """
+
+    def __init__(self, name: str = "background-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedule a coroutine on the loop and return a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BackgroundEventLoop.run() would deadlock when called from the loop thread")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    async def _cancel_pending(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+
+    def stop(self):
+        if self.loop.is_running():
+            try:
+                self.submit(self._cancel_pending()).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Error cancelling pending tasks on the background loop: {str(e)}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+        if not self.loop.is_running() and not self.loop.is_closed():
+            self.loop.close()
+
+
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_pid: Optional[int] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Return this process's background loop, starting it on first use.
+
+    A forked worker (e.g. under gunicorn) does not inherit the parent's loop
+    thread, so a new loop is started when the process id changes.
+    """
+    global _background_loop, _background_loop_pid
+    if _background_loop is None or _background_loop_pid != os.getpid():
+        with _background_loop_lock:
+            if _background_loop is None or _background_loop_pid != os.getpid():
+                _background_loop = BackgroundEventLoop()
+                _background_loop_pid = os.getpid()
+                logger.info(f"Started background event loop in process {_background_loop_pid}")
+    return _background_loop
+
+
+def run_async(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the shared background loop from synchronous code."""
+    return get_background_loop().run(coro, timeout)
+
+
+@atexit.register
+def _stop_background_loop():
+    if _background_loop is not None and _background_loop_pid == os.getpid():
+        _background_loop.stop()
@@ -0,0 +1,171 @@
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import heapq
+import logging
+import math
+import re
+import threading
+
+from langchain.schema import Document
+
+from .metadata_index import MetadataIndex, has_filters
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+    a an and are as at be but by for from has have he her his i in is it its
+    of on or she that the their they this to was were will with
+""".split())
+
+# Constant from the original reciprocal rank fusion paper (Cormack et al., 2009)
+RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split review text into indexable terms."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def document_key(document: Document) -> Tuple[str, Any, Any]:
+    """Identity of a review across retrievers, used to merge ranked lists."""
+    metadata = document.metadata or {}
+    return (document.page_content, metadata.get("employee_id"), metadata.get("timestamp"))
+
+
+def reciprocal_rank_fusion(rankings: List[List[Document]], limit: int, k: int = RRF_K) -> List[Document]:
+    """Fuse several ranked result lists into one using reciprocal rank fusion."""
+    scores: Dict[Tuple[str, Any, Any], float] = defaultdict(float)
+    documents: Dict[Tuple[str, Any, Any], Document] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking):
+            key = document_key(document)
+            scores[key] += 1.0 / (k + rank + 1)
+            documents.setdefault(key, document)
+    best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    return [documents[key] for key, _ in best]
+
+
+class BM25Index:
+    """In-memory BM25 inverted index over review text.
+
+    Documents are added incrementally as reviews are written, so lexical
+    retrieval is always available locally and never needs an embedding call.
+    With a `loader`, reviews that already exist (from before a restart, or
+    written by another worker process) are indexed once on first use. An
+    edited assessment (`is_update` metadata) replaces its earlier document.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._doc_lengths: List[int] = []
+        self._documents: List[Document] = []
+        self._total_length = 0
+        self.metadata_index = MetadataIndex()
+        self._lock = threading.Lock()
+        # Live document per assessment, so the bootstrap and live writes never index one twice
+        self._assessment_docs: Dict[Any, int] = {}
+        # Replaced documents; they keep their slot so document ids stay stable
+        self._removed = set()
+        self._loader: Optional[Callable[[], Iterable[Tuple[str, Dict[str, Any]]]]] = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents) - len(self._removed)
+
+    def set_loader(self, loader: Callable[[], Iterable[Tuple[str, Dict[str, Any]]]]):
+        """Register a source of existing (text, metadata) reviews, read by ensure_loaded."""
+        self._loader = loader
+
+    def ensure_loaded(self):
+        """Index the loader's reviews the first time it is called; blocking, run it off the event loop."""
+        if self._loaded or self._loader is None:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                count = 0
+                for text, metadata in self._loader():
+                    self.add(text, metadata)
+                    count += 1
+                self._loaded = True
+                logger.info(f"Bootstrapped lexical index with {count} existing reviews")
+            except Exception as e:
+                # Left unloaded so the next search retries
+                logger.error(f"Error bootstrapping lexical index: {str(e)}")
+
+    def add(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Index a review and return its document id (None if its assessment is already indexed)."""
+        metadata = dict(metadata or {})
+        tokens = tokenize(text)
+        with self._lock:
+            assessment_id = metadata.get("assessment_id")
+            if assessment_id is not None and assessment_id in self._assessment_docs:
+                if not metadata.get("is_update"):
+                    return None
+                self._remove(self._assessment_docs[assessment_id])
+            doc_id = len(self._documents)
+            if assessment_id is not None:
+                self._assessment_docs[assessment_id] = doc_id
+            for token in tokens:
+                postings = self._postings[token]
+                postings[doc_id] = postings.get(doc_id, 0) + 1
+            self._documents.append(Document(page_content=text, metadata=metadata))
+            self._doc_lengths.append(len(tokens))
+            self._total_length += len(tokens)
+            self.metadata_index.add(doc_id, metadata)
+        return doc_id
+
+    def _remove(self, doc_id: int):
+        # Caller holds the lock; drops the document from the postings and length statistics
+        for token in set(tokenize(self._documents[doc_id].page_content)):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_lengths[doc_id] = 0
+        self._removed.add(doc_id)
+
+    def add_many(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> List[int]:
+        """Index several reviews at once."""
+        return [self.add(text, metadata) for text, metadata in zip(texts, metadatas)]
+
+    def search(self, query: str, k: int = 3, **filters: Any) -> List[Tuple[Document, float]]:
+        """Return the top-k documents by BM25 score, restricted to documents matching the filters."""
+        with self._lock:
+            total_docs = len(self._documents) - len(self._removed)
+            if total_docs == 0:
+                return []
+
+            allowed = None
+            if has_filters(**filters):
+                allowed = set(self.metadata_index.select(**filters).tolist())
+                if not allowed:
+                    return []
+
+            avg_length = self._total_length / total_docs or 1.0
+            scores: Dict[int, float] = defaultdict(float)
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            return [(self._documents[doc_id], score) for doc_id, score in best]
+
+
+# Process-wide lexical index, kept in sync by the vector store write helpers in db_utils
+review_lexical_index = BM25Index()
@@ -0,0 +1,211 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import logging
+import re
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, datetime, None]
+
+# Metadata keys written by add_review_to_vector_store / batch_add_reviews_to_vector_store
+FILTER_FIELDS = ("department", "position", "employee_id")
+
+DATE_ONLY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _as_timestamp(value: DateLike, end_of_day: bool = False) -> Optional[str]:
+    """Normalize a date bound to the ISO string format stored in review metadata.
+
+    Timestamps compare as strings, so a date-only upper bound is widened to the
+    last instant of that day; otherwise "2024-03-31" would sort before every
+    review stored on the 31st.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = value.isoformat() if isinstance(value, date) else str(value)
+    if end_of_day and DATE_ONLY_PATTERN.match(value):
+        return f"{value}T23:59:59.999999"
+    return value
+
+
+def timestamp_bounds(start_date: DateLike, end_date: DateLike) -> Tuple[Optional[str], Optional[str]]:
+    """Inclusive (start, end) bounds comparable with the stored ISO timestamps."""
+    return _as_timestamp(start_date), _as_timestamp(end_date, end_of_day=True)
+
+
+def has_filters(**filters: Any) -> bool:
+    """Return True if any metadata filter value was supplied."""
+    return any(value is not None for value in filters.values())
+
+
+class MetadataIndex:
+    """Inverted index from review metadata to row ids.
+
+    Rows are FAISS positions (refreshed incrementally from the FAISS docstore,
+    reading only rows added since the last refresh) or document ids of the
+    local lexical index (indexed directly through `add`). `select` turns a set of filters
+    into the row ids that satisfy all of them, which can then be handed to
+    FAISS as an ID selector so that filtering happens inside the search.
+    """
+
+    def __init__(self):
+        self._refresh_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._postings: Dict[str, Dict[str, Set[int]]] = {
+            field: defaultdict(set) for field in FILTER_FIELDS
+        }
+        self._timestamps: List[Tuple[str, int]] = []
+        self._indexed_rows = 0
+
+    def __len__(self) -> int:
+        return self._indexed_rows
+
+    def add(self, row_id: int, metadata: Dict[str, Any]):
+        """Index the metadata of a single row."""
+        self._indexed_rows = max(self._indexed_rows, row_id + 1)
+        for field in FILTER_FIELDS:
+            value = metadata.get(field)
+            if value is not None:
+                self._postings[field][str(value)].add(row_id)
+        timestamp = metadata.get("timestamp")
+        if timestamp:
+            insort(self._timestamps, (str(timestamp), row_id))
+
+    def refresh(self, vector_store) -> int:
+        """Index any FAISS rows added since the last refresh. Returns the number of new rows."""
+        with self._refresh_lock:
+            total = vector_store.index.ntotal
+            if total < self._indexed_rows:
+                # The FAISS index was rebuilt underneath us; start over.
+                self._reset()
+
+            added = 0
+            for row_id in range(self._indexed_rows, total):
+                docstore_id = vector_store.index_to_docstore_id.get(row_id)
+                document = vector_store.docstore.search(docstore_id) if docstore_id else None
+                metadata = getattr(document, "metadata", None) or {}
+                self.add(row_id, metadata)
+                added += 1
+
+            self._indexed_rows = total
+        if added:
+            logger.info(f"Indexed metadata for {added} new vectors")
+        return added
+
+    def select(
+        self,
+        department: Optional[str] = None,
+        position: Optional[str] = None,
+        employee_id: Optional[str] = None,
+        start_date: DateLike = None,
+        end_date: DateLike = None
+    ) -> np.ndarray:
+        """Return the sorted row ids matching every supplied filter."""
+        candidates: Optional[Set[int]] = None
+
+        for field, value in (("department", department), ("position", position), ("employee_id", employee_id)):
+            if value is None:
+                continue
+            rows = self._postings[field].get(str(value), set())
+            candidates = set(rows) if candidates is None else candidates & rows
+            if not candidates:
+                return np.empty(0, dtype=np.int64)
+
+        start, end = timestamp_bounds(start_date, end_date)
+        if start is not None or end is not None:
+            lo = bisect_left(self._timestamps, (start, -1)) if start is not None else 0
+            hi = bisect_right(self._timestamps, (end, self._indexed_rows)) if end is not None else len(self._timestamps)
+            rows = {row_id for _, row_id in self._timestamps[lo:hi]}
+            candidates = rows if candidates is None else candidates & rows
+
+        if candidates is None:
+            return np.arange(self._indexed_rows, dtype=np.int64)
+        return np.fromiter(sorted(candidates), dtype=np.int64, count=len(candidates))
+
+    def bitmap(self, row_ids: np.ndarray) -> np.ndarray:
+        """Pack row ids into the little-endian bitmap layout used by faiss.IDSelectorBitmap."""
+        mask = np.zeros(max(self._indexed_rows, 1), dtype=bool)
+        mask[row_ids] = True
+        return np.packbits(mask, bitorder="little")
+
+
+def langchain_filter(
+    department: Optional[str] = None,
+    position: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    start_date: DateLike = None,
+    end_date: DateLike = None
+) -> Optional[Dict[str, Any]]:
+    """Translate metadata filters into the `filter` dict understood by langchain's PGVector."""
+    clauses: Dict[str, Any] = {}
+    for field, value in (("department", department), ("position", position), ("employee_id", employee_id)):
+        if value is not None:
+            clauses[field] = str(value)
+    start, end = timestamp_bounds(start_date, end_date)
+    if start is not None or end is not None:
+        clauses["timestamp"] = {"between": [start or "0000", end or "9999"]}
+    return clauses or None
+
+
+def search_parameters(index, selector):
+    """FAISS search parameters carrying `selector`, typed for the index (IVF and HNSW reject the base class)."""
+    import faiss
+
+    if isinstance(index, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(sel=selector, nprobe=index.nprobe)
+    if isinstance(index, faiss.IndexHNSW):
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=index.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
+
+
+def filtered_faiss_search(
+    vector_store,
+    metadata_index: MetadataIndex,
+    query_vector: List[float],
+    k: int,
+    filters: Dict[str, Any]
+) -> List[Tuple[Any, float]]:
+    """Search a langchain FAISS store, restricting the scan to rows matching the filters.
+
+    Matching rows are resolved from the metadata index and passed to FAISS as an
+    IDSelectorBitmap, so non-matching vectors are skipped during the scan instead
+    of being fetched and discarded afterwards. Returns (document, distance) pairs.
+    """
+    import faiss
+    from langchain.schema import Document
+
+    metadata_index.refresh(vector_store)
+    query = np.array([query_vector], dtype=np.float32)
+
+    if has_filters(**filters):
+        row_ids = metadata_index.select(**filters)
+        if len(row_ids) == 0:
+            return []
+        bitmap = metadata_index.bitmap(row_ids)
+        selector = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap))
+        distances, indices = vector_store.index.search(
+            query, min(k, len(row_ids)), params=search_parameters(vector_store.index, selector)
+        )
+    else:
+        total = vector_store.index.ntotal
+        if total == 0:
+            return []
+        distances, indices = vector_store.index.search(query, min(k, total))
+
+    results = []
+    for distance, row_id in zip(distances[0], indices[0]):
+        if row_id == -1:
+            continue
+        document = vector_store.docstore.search(vector_store.index_to_docstore_id[int(row_id)])
+        if isinstance(document, Document):
+            results.append((document, float(distance)))
+    return results
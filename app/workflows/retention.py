@@ -0,0 +1,161 @@
+from sqlalchemy import delete, select
+from typing import List, Dict, Any, Optional, Iterator, Sequence, Callable
+from datetime import datetime, timedelta
+from collections import defaultdict
+import gzip
+import json
+import logging
+import os
+import time
+import uuid
+
+from ..models import db, Assessment, AssessmentMetric
+from .assessment_export import gzip_chunks, serialize_rows
+from .assessment_queries import ASSESSMENT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+ARCHIVE_FIELDS = (*ASSESSMENT_FIELDS, "updated_at")
+
+
+def retention_cutoff(retention_days: int, now: Optional[datetime] = None) -> datetime:
+    return (now or datetime.utcnow()) - timedelta(days=retention_days)
+
+
+def _year_partition(archive_path: str, year: int) -> str:
+    return os.path.join(archive_path, f"year={year}")
+
+
+def _write_archive_file(archive_path: str, year: int, rows: List[Dict[str, Any]], name: str):
+    """Write rows as gzipped NDJSON and fsync it before anything is deleted."""
+    directory = _year_partition(archive_path, year)
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    with open(tmp_path, "wb") as f:
+        for chunk in gzip_chunks(serialize_rows(rows, "ndjson", ARCHIVE_FIELDS)):
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(directory, name))
+
+
+def archive_assessments(
+    archive_path: str,
+    cutoff: datetime,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None,
+    dry_run: bool = False,
+    after_delete: Optional[Callable[[List[int]], Any]] = None
+) -> Dict[str, Any]:
+    """Move assessments reviewed before `cutoff` to year-partitioned, gzipped NDJSON files.
+
+    Each batch is written and synced to its year's archive file first, then
+    deleted in its own short transaction, so locks are held for one batch at a
+    time and an interruption never loses rows. A batch interrupted between the
+    two steps is archived again on the next run, and readers keep one copy per
+    id. `pause` sleeps between batches to leave room for other writers.
+    `after_delete` is called with each batch's ids once its delete has been
+    committed, e.g. to move the batch's review vectors. It must be idempotent
+    by ids: if it raises, the run stops and the batch can be caught up later
+    from the ids in the archive (see archived_ids). Must run in an app context.
+    """
+    run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S") + "-" + uuid.uuid4().hex[:8]
+    columns = [getattr(Assessment, field) for field in ARCHIVE_FIELDS]
+    totals = {"archived": 0, "batches": 0, "years": set()}
+    last_id = 0
+
+    while max_batches is None or totals["batches"] < max_batches:
+        rows = [dict(row) for row in db.session.execute(
+            select(*columns)
+            .where(Assessment.review_date < cutoff, Assessment.id > last_id)
+            .order_by(Assessment.id)
+            .limit(batch_size)
+        ).mappings()]
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+        ids = [row["id"] for row in rows]
+
+        by_year = defaultdict(list)
+        for row in rows:
+            by_year[row["review_date"].year].append(row)
+
+        if dry_run:
+            db.session.rollback()
+        else:
+            for year, year_rows in by_year.items():
+                _write_archive_file(archive_path, year, year_rows, f"assessments-{run_id}-{totals['batches']:05d}.ndjson.gz")
+            # Metric rows go explicitly, SQLite does not enforce the ON DELETE CASCADE
+            db.session.execute(delete(AssessmentMetric).where(AssessmentMetric.assessment_id.in_(ids)))
+            db.session.execute(
+                delete(Assessment).where(Assessment.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            if after_delete is not None:
+                after_delete(ids)
+
+        totals["archived"] += len(rows)
+        totals["batches"] += 1
+        totals["years"].update(by_year)
+        logger.info(f"{'Would archive' if dry_run else 'Archived'} {totals['archived']} assessments "
+                    f"reviewed before {cutoff.date()} (through id {last_id})")
+        if pause:
+            time.sleep(pause)
+
+    totals["years"] = sorted(totals["years"])
+    return totals
+
+
+def archived_years(archive_path: str) -> List[int]:
+    if not os.path.isdir(archive_path):
+        return []
+    return sorted(int(name.split("=", 1)[1]) for name in os.listdir(archive_path) if name.startswith("year="))
+
+
+def archived_ids(archive_path: str, years: Optional[Sequence[int]] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[int]]:
+    """Ids of archived assessments in batches of up to `batch_size`."""
+    batch = []
+    for row in query_archive(archive_path, years=years):
+        batch.append(row["id"])
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def query_archive(
+    archive_path: str,
+    years: Optional[Sequence[int]] = None,
+    user_id: Optional[int] = None,
+    employee_id: Optional[str] = None,
+    department: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream archived assessments, opening only the requested year partitions.
+
+    Files are decompressed and filtered one line at a time; a row archived
+    twice by an interrupted run is returned once.
+    """
+    seen = set()
+    for year in years if years is not None else archived_years(archive_path):
+        directory = _year_partition(archive_path, year)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".ndjson.gz"):
+                continue
+            with gzip.open(os.path.join(directory, name), "rt", encoding="utf-8") as f:
+                for line in f:
+                    row = json.loads(line)
+                    if row["id"] in seen:
+                        continue
+                    if user_id is not None and row["user_id"] != user_id:
+                        continue
+                    if employee_id is not None and row["employee_id"] != employee_id:
+                        continue
+                    if department is not None and row["department"] != department:
+                        continue
+                    seen.add(row["id"])
+                    yield row
@@ -0,0 +1,230 @@
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import math
+import re
+import uuid
+
+import faiss
+import numpy as np
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from .metadata_index import MetadataIndex, filtered_faiss_search, langchain_filter
+
+logger = logging.getLogger(__name__)
+
+SHARD_STRATEGIES = ("department", "employee_hash")
+
+# Shards smaller than this stay exact: a flat scan is already fast and IVF needs enough points to train
+IVF_MIN_VECTORS = 10_000
+DEFAULT_NPROBE = 8
+
+# Creates and populates a new shard: (shard_name, texts, metadatas, ids) -> vector store
+ShardFactory = Callable[[str, List[str], List[Dict[str, Any]], List[str]], Awaitable[Any]]
+
+
+def tuned_index_spec(total: int) -> str:
+    """FAISS index_factory spec for a shard of `total` vectors."""
+    if total < IVF_MIN_VECTORS:
+        return "Flat"
+    # ~4*sqrt(n) lists, keeping at least 39 training points per centroid
+    nlist = max(1, min(int(4 * math.sqrt(total)), total // 39))
+    return f"IVF{nlist},Flat"
+
+
+def shard_for(metadata: Dict[str, Any], shard_by: str = "department", num_shards: int = 8) -> str:
+    """Return the name of the shard a review belongs to."""
+    if shard_by == "department":
+        department = re.sub(r"[^a-z0-9]+", "_", str(metadata.get("department") or "").lower()).strip("_")
+        return department or "unassigned"
+    if shard_by == "employee_hash":
+        digest = hashlib.md5(str(metadata.get("employee_id", "")).encode("utf-8")).hexdigest()
+        return f"shard_{int(digest, 16) % num_shards:02d}"
+    raise ValueError(f"Unknown shard strategy '{shard_by}', expected one of {SHARD_STRATEGIES}")
+
+
+def stored_embedding(store: FAISS, vector_id: str) -> Optional[List[float]]:
+    """Read back the vector a FAISS store holds under `vector_id`."""
+    row = next((row for row, doc_id in store.index_to_docstore_id.items() if doc_id == vector_id), None)
+    if row is None:
+        return None
+    return store.index.reconstruct(row).tolist()
+
+
+def add_embeddings(store, texts: List[str], embeddings: List[List[float]], metadatas: List[Dict[str, Any]], ids: List[str]):
+    """Add precomputed embeddings to a FAISS or pgvector store (their signatures differ)."""
+    if isinstance(store, FAISS):
+        return store.add_embeddings(list(zip(texts, embeddings)), metadatas=metadatas, ids=ids)
+    return store.add_embeddings(texts, embeddings, metadatas=metadatas, ids=ids)
+
+
+class ShardedVectorIndex:
+    """Review vector index split into independent shards by department or employee hash.
+
+    Writes are routed to one shard per review. Queries that pin the shard key
+    (a department filter for department sharding, an employee_id filter for hash
+    sharding) touch only that shard; all other queries fan out to every shard
+    concurrently and the per-shard top-k lists are merged with a heap. Rebuilds
+    lock and replace one shard at a time while the others keep serving.
+
+    The object exposes `aadd_texts` and `asimilarity_search`, so it can be passed
+    anywhere a single langchain vector store is used today.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        shard_by: str = "department",
+        num_shards: int = 8,
+        shard_factory: Optional[ShardFactory] = None
+    ):
+        if shard_by not in SHARD_STRATEGIES:
+            raise ValueError(f"Unknown shard strategy '{shard_by}', expected one of {SHARD_STRATEGIES}")
+        self.embeddings = embeddings
+        self.shard_by = shard_by
+        self.num_shards = num_shards
+        self.shards: Dict[str, Any] = {}
+        self._shard_factory = shard_factory or self._create_faiss_shard
+        self._metadata_indexes: Dict[str, MetadataIndex] = defaultdict(MetadataIndex)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _create_faiss_shard(
+        self,
+        name: str,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> FAISS:
+        return await FAISS.afrom_texts(texts, self.embeddings, metadatas=metadatas, ids=ids)
+
+    def shard_name(self, metadata: Dict[str, Any]) -> str:
+        return shard_for(metadata, self.shard_by, self.num_shards)
+
+    async def aadd_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> List[str]:
+        """Route each text to its shard and write all touched shards concurrently."""
+        metadatas = metadatas or [{} for _ in texts]
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+
+        grouped: Dict[str, List[Tuple[str, Dict[str, Any], str]]] = defaultdict(list)
+        for text, metadata, doc_id in zip(texts, metadatas, ids):
+            grouped[self.shard_name(metadata)].append((text, metadata, doc_id))
+
+        async def write_shard(name: str, items: List[Tuple[str, Dict[str, Any], str]]):
+            shard_texts, shard_metadatas, shard_ids = (list(column) for column in zip(*items))
+            async with self._locks[name]:
+                if name not in self.shards:
+                    self.shards[name] = await self._shard_factory(name, shard_texts, shard_metadatas, shard_ids)
+                    logger.info(f"Created vector shard '{name}'")
+                else:
+                    await self.shards[name].aadd_texts(shard_texts, metadatas=shard_metadatas, ids=shard_ids)
+
+        await asyncio.gather(*(write_shard(name, items) for name, items in grouped.items()))
+        return ids
+
+    async def aadd_embeddings(
+        self,
+        texts: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> List[str]:
+        """Route precomputed embeddings to their shards; a shard that does not exist yet is created from the texts."""
+        grouped: Dict[str, List[Tuple[str, List[float], Dict[str, Any], str]]] = defaultdict(list)
+        for item in zip(texts, embeddings, metadatas, ids):
+            grouped[self.shard_name(item[2])].append(item)
+
+        async def write_shard(name: str, items: List[Tuple[str, List[float], Dict[str, Any], str]]):
+            shard_texts, shard_embeddings, shard_metadatas, shard_ids = (list(column) for column in zip(*items))
+            async with self._locks[name]:
+                if name not in self.shards:
+                    self.shards[name] = await self._shard_factory(name, shard_texts, shard_metadatas, shard_ids)
+                    logger.info(f"Created vector shard '{name}'")
+                else:
+                    await asyncio.to_thread(
+                        add_embeddings, self.shards[name], shard_texts, shard_embeddings, shard_metadatas, shard_ids
+                    )
+
+        await asyncio.gather(*(write_shard(name, items) for name, items in grouped.items()))
+        return ids
+
+    def _target_shards(self, filters: Dict[str, Any]) -> List[str]:
+        """Return the shards a query has to visit given its filters."""
+        if self.shard_by == "department" and filters.get("department") is not None:
+            name = self.shard_name({"department": filters["department"]})
+        elif self.shard_by == "employee_hash" and filters.get("employee_id") is not None:
+            name = self.shard_name({"employee_id": filters["employee_id"]})
+        else:
+            return list(self.shards)
+        return [name] if name in self.shards else []
+
+    def _search_shard(self, name: str, query_vector: List[float], k: int, filters: Dict[str, Any]) -> List[Tuple[Document, float]]:
+        store = self.shards[name]
+        if isinstance(store, FAISS):
+            return filtered_faiss_search(store, self._metadata_indexes[name], query_vector, k, filters)
+        return store.similarity_search_with_score_by_vector(query_vector, k=k, filter=langchain_filter(**filters))
+
+    async def asimilarity_search_with_score(self, query: str, k: int = 4, **filters: Any) -> List[Tuple[Document, float]]:
+        """Embed the query once, search the target shards in parallel and merge the top-k by distance."""
+        targets = self._target_shards(filters)
+        if not targets:
+            return []
+
+        query_vector = await self.embeddings.aembed_query(query)
+
+        per_shard = await asyncio.gather(*(
+            asyncio.to_thread(self._search_shard, name, query_vector, k, filters) for name in targets
+        ))
+        return heapq.nsmallest(k, itertools.chain.from_iterable(per_shard), key=lambda item: item[1])
+
+    async def asimilarity_search(self, query: str, k: int = 4, **filters: Any) -> List[Document]:
+        return [document for document, _ in await self.asimilarity_search_with_score(query, k=k, **filters)]
+
+    async def rebuild_shard(self, name: str, index_factory: Optional[str] = None, nprobe: int = DEFAULT_NPROBE) -> int:
+        """Rebuild one FAISS shard's index from its stored vectors, leaving other shards untouched.
+
+        The vectors go into an index sized for the shard: `index_factory` is a
+        FAISS factory spec, by default exact "Flat" for small shards and an
+        inverted-file index probing `nprobe` lists once a shard outgrows a flat
+        scan. Writes to the shard wait for the rebuild; searches keep using the
+        old index until the new one is swapped in. Row order is preserved, so the
+        shard's metadata index stays valid. Returns the number of vectors in the shard.
+        """
+        store = self.shards.get(name)
+        if not isinstance(store, FAISS):
+            raise ValueError(f"Shard '{name}' is not a local FAISS shard")
+
+        def rebuild() -> int:
+            total = store.index.ntotal
+            vectors = store.index.reconstruct_n(0, total) if total else np.empty((0, store.index.d), dtype=np.float32)
+            spec = index_factory or tuned_index_spec(total)
+            index = faiss.index_factory(store.index.d, spec, faiss.METRIC_L2)
+            if not index.is_trained:
+                index.train(vectors)
+            index.add(vectors)
+            if isinstance(index, faiss.IndexIVF):
+                index.nprobe = nprobe
+                # Keeps reconstruct_n available for the next rebuild
+                index.make_direct_map()
+            store.index = index
+            logger.info(f"Rebuilding vector shard '{name}' as {spec}")
+            return total
+
+        async with self._locks[name]:
+            total = await asyncio.to_thread(rebuild)
+        logger.info(f"Rebuilt vector shard '{name}' with {total} vectors")
+        return total
+
+    def shard_sizes(self) -> Dict[str, int]:
+        """Number of vectors per local FAISS shard."""
+        return {name: store.index.ntotal for name, store in self.shards.items() if isinstance(store, FAISS)}
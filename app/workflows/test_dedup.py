@@ -0,0 +1,36 @@
+import unittest
+from app.workflows.dedup import NearDuplicateIndex, shingles
+
+REVIEW = ("Consistently delivers high quality work ahead of schedule, mentors junior engineers "
+          "on the team and communicates project risks clearly to stakeholders every sprint.")
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NearDuplicateIndex(threshold=0.85)
+        self.index.add("vec-1", REVIEW)
+
+    def test_shingles_fall_back_to_words(self):
+        """Test that texts shorter than a shingle yield their word set."""
+        self.assertEqual(shingles("Great work"), {"great", "work"})
+
+    def test_near_duplicate_is_found(self):
+        """Test that a review differing only in case and punctuation matches its canonical vector."""
+        duplicate = self.index.find_duplicate(REVIEW.upper().replace(",", ";"))
+        self.assertIsNotNone(duplicate)
+        vector_id, similarity = duplicate
+        self.assertEqual(vector_id, "vec-1")
+        self.assertGreaterEqual(similarity, 0.85)
+
+    def test_distinct_review_is_not_a_duplicate(self):
+        """Test that unrelated text stays below the threshold."""
+        self.assertIsNone(self.index.find_duplicate(
+            "Struggles with estimation and missed two release deadlines; needs closer guidance on testing."
+        ))
+
+    def test_removed_vector_is_forgotten(self):
+        """Test that a removed canonical review is no longer matched."""
+        self.index.remove("vec-1")
+        self.assertIsNone(self.index.find_duplicate(REVIEW))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from langchain.schema import Document
+from app.workflows.lexical_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+class TestLexicalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = BM25Index()
+        self.index.add(
+            "Outstanding leadership and clear communication across the team.",
+            {"employee_id": "EMP001", "department": "Product", "timestamp": "2024-01-15T10:00:00"}
+        )
+        self.index.add(
+            "Strong debugging skills, needs to improve project estimation.",
+            {"employee_id": "EMP002", "department": "Engineering", "timestamp": "2024-04-15T10:00:00"}
+        )
+        self.index.add(
+            "Shows leadership potential and mentors junior developers.",
+            {"employee_id": "EMP003", "department": "Engineering", "timestamp": "2024-07-15T10:00:00"}
+        )
+
+    def test_tokenize_drops_stopwords(self):
+        """Test that tokenization lowercases and removes stopwords."""
+        self.assertEqual(tokenize("The Leadership of a Team"), ["leadership", "team"])
+
+    def test_search_ranks_matching_reviews(self):
+        """Test that BM25 search returns only reviews containing the query terms."""
+        results = self.index.search("leadership", k=5)
+        employee_ids = [doc.metadata["employee_id"] for doc, _ in results]
+        self.assertEqual(sorted(employee_ids), ["EMP001", "EMP003"])
+        self.assertTrue(all(score > 0 for _, score in results))
+
+    def test_search_applies_metadata_filters(self):
+        """Test that department and date filters restrict lexical results."""
+        results = self.index.search("leadership", k=5, department="Engineering")
+        self.assertEqual([doc.metadata["employee_id"] for doc, _ in results], ["EMP003"])
+
+        results = self.index.search("leadership", k=5, end_date="2024-02-01")
+        self.assertEqual([doc.metadata["employee_id"] for doc, _ in results], ["EMP001"])
+
+        # A date-only end bound covers the whole day
+        results = self.index.search("leadership", k=5, end_date="2024-01-15")
+        self.assertEqual([doc.metadata["employee_id"] for doc, _ in results], ["EMP001"])
+
+    def test_update_replaces_assessment_document(self):
+        """Test that an edited assessment stops matching the terms of its old text."""
+        index = BM25Index()
+        index.add("Excellent mentoring of new hires.", {"employee_id": "EMP004", "assessment_id": 4})
+        self.assertIsNone(index.add("Excellent mentoring of new hires.", {"employee_id": "EMP004", "assessment_id": 4}))
+        index.add("Missed several sprint deadlines.", {"employee_id": "EMP004", "assessment_id": 4, "is_update": True})
+
+        self.assertEqual(index.search("mentoring", k=5), [])
+        results = index.search("deadlines", k=5)
+        self.assertEqual([doc.page_content for doc, _ in results], ["Missed several sprint deadlines."])
+        self.assertEqual(len(index), 1)
+
+    def test_reciprocal_rank_fusion(self):
+        """Test that documents ranked well by both retrievers come first."""
+        a = Document(page_content="a", metadata={"employee_id": "1"})
+        b = Document(page_content="b", metadata={"employee_id": "2"})
+        c = Document(page_content="c", metadata={"employee_id": "3"})
+        fused = reciprocal_rank_fusion([[a, b, c], [b, c]], limit=2)
+        self.assertEqual([doc.page_content for doc in fused], ["b", "c"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Dict, Any, Optional
+import logging
+import threading
+import time
+
+from ..models import db, User
+from .cache_invalidation import invalidate_on_commit
+
+logger = logging.getLogger(__name__)
+
+# Bounds staleness when another worker process changed the user
+DEFAULT_TTL_SECONDS = 60
+
+_user_cache: Dict[int, Any] = {}
+_user_cache_lock = threading.Lock()
+
+
+def user_by_id(user_id: int) -> Optional[User]:
+    return db.session.execute(lambda_stmt(lambda: select(User).where(User.id == user_id))).scalar_one_or_none()
+
+
+def user_by_username(username: str) -> Optional[User]:
+    return db.session.execute(lambda_stmt(lambda: select(User).where(User.username == username))).scalar_one_or_none()
+
+
+def user_by_email(email: str) -> Optional[User]:
+    return db.session.execute(lambda_stmt(lambda: select(User).where(User.email == email))).scalar_one_or_none()
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+def load_cached_user(user_id: int, ttl: float = DEFAULT_TTL_SECONDS) -> Optional[User]:
+    """User for the login manager, usually without a query.
+
+    The cache holds plain column values rather than ORM instances; a hit is
+    attached to the current session with merge(load=False), which emits no SQL
+    and still lets relationships lazy-load as usual.
+    """
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        user = User(**cached[1])
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    user = user_by_id(user_id)
+    if user is not None:
+        with _user_cache_lock:
+            _user_cache[user_id] = (now + ttl, _snapshot(user))
+    return user
+
+
+def invalidate_user(user_id: Optional[int] = None):
+    """Drop one cached user, or all of them when `user_id` is None."""
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+
+invalidate_on_commit("user_cache", User, lambda user: (user.id,), invalidate_user, include_new=False)
@@ -0,0 +1,143 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from typing import List, Dict, Any, Optional, Sequence
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_TABLE = "langchain_pg_embedding"
+ANN_INDEX_NAME = "ix_langchain_pg_embedding_embedding_ann"
+ANN_METHODS = ("hnsw", "ivfflat")
+
+
+def pgvector_version(connection: Connection) -> Optional[str]:
+    return connection.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'vector';")).scalar()
+
+
+def supports_hnsw(connection: Connection) -> bool:
+    """HNSW indexes need pgvector 0.5.0 or later."""
+    version = pgvector_version(connection)
+    if not version:
+        return False
+    major, minor = (int(part) for part in version.split(".")[:2])
+    return (major, minor) >= (0, 5)
+
+
+def default_lists(rows: int) -> int:
+    """pgvector's starting point for IVFFlat: rows / 1000 up to 1M rows, sqrt(rows) above."""
+    if rows <= 1_000_000:
+        return max(1, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+def ann_index_sql(method: str, lists: Optional[int] = None, m: int = 16, ef_construction: int = 64) -> str:
+    """CREATE INDEX statement for the embedding column with cosine distance (PGVector's default)."""
+    if method == "hnsw":
+        options = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+    elif method == "ivfflat":
+        options = f"lists = {int(lists or 100)}"
+    else:
+        raise ValueError(f"Unknown ANN index method '{method}', expected one of {ANN_METHODS}")
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {ANN_INDEX_NAME} "
+        f"ON {EMBEDDING_TABLE} USING {method} (embedding vector_cosine_ops) WITH ({options});"
+    )
+
+
+def rebuild_ann_index(
+    engine: Engine,
+    method: str = "hnsw",
+    lists: Optional[int] = None,
+    m: int = 16,
+    ef_construction: int = 64
+) -> Dict[str, Any]:
+    """Drop and recreate the ANN index on the embedding column.
+
+    Runs outside a transaction so the index can be built CONCURRENTLY without
+    blocking writes. IVFFlat `lists` defaults to default_lists(row count).
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if method == "hnsw" and not supports_hnsw(connection):
+            raise ValueError(f"pgvector {pgvector_version(connection)} does not support HNSW; use ivfflat")
+        rows = connection.execute(text(f"SELECT COUNT(*) FROM {EMBEDDING_TABLE};")).scalar()
+        if method == "ivfflat" and lists is None:
+            lists = default_lists(rows)
+
+        started = time.perf_counter()
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {ANN_INDEX_NAME};"))
+        connection.execute(text(ann_index_sql(method, lists=lists, m=m, ef_construction=ef_construction)))
+        build_seconds = time.perf_counter() - started
+
+    logger.info(f"Rebuilt {method} index on {rows} embeddings in {build_seconds:.1f}s")
+    return {"method": method, "rows": rows, "lists": lists, "m": m,
+            "ef_construction": ef_construction, "build_seconds": build_seconds}
+
+
+def _search_ids(connection: Connection, query_vector: str, k: int) -> List[str]:
+    return [row[0] for row in connection.execute(text(f"""
+        SELECT uuid::text FROM {EMBEDDING_TABLE}
+        ORDER BY embedding <=> CAST(:query_vector AS vector)
+        LIMIT :k;
+    """), {"query_vector": query_vector, "k": k})]
+
+
+def measure_recall(
+    engine: Engine,
+    setting: str,
+    values: Sequence[int],
+    sample_size: int = 100,
+    k: int = 10
+) -> List[Dict[str, Any]]:
+    """Recall@k and mean latency of the ANN index for each value of a search setting.
+
+    `setting` is "hnsw.ef_search" or "ivfflat.probes". Stored embeddings are
+    sampled as queries; the exact neighbours come from the same query with index
+    scans disabled.
+    """
+    with engine.connect() as connection:
+        queries = [row[0] for row in connection.execute(text(f"""
+            SELECT embedding::text FROM {EMBEDDING_TABLE} ORDER BY random() LIMIT :sample_size;
+        """), {"sample_size": sample_size})]
+        connection.commit()
+
+        exact = []
+        with connection.begin():
+            connection.execute(text("SET LOCAL enable_indexscan = off;"))
+            for query_vector in queries:
+                exact.append(set(_search_ids(connection, query_vector, k)))
+
+        results = []
+        for value in values:
+            hits, elapsed = 0, 0.0
+            with connection.begin():
+                connection.execute(text(f"SET LOCAL {setting} = {int(value)};"))
+                for query_vector, truth in zip(queries, exact):
+                    started = time.perf_counter()
+                    found = _search_ids(connection, query_vector, k)
+                    elapsed += time.perf_counter() - started
+                    hits += len(truth.intersection(found))
+            total = sum(len(truth) for truth in exact) or 1
+            results.append({
+                "setting": setting,
+                "value": value,
+                "recall": hits / total,
+                "mean_ms": 1000 * elapsed / max(len(queries), 1)
+            })
+            logger.info(f"{setting}={value}: recall@{k} {hits / total:.3f}, {1000 * elapsed / max(len(queries), 1):.2f} ms/query")
+    return results
+
+
+def smallest_meeting_target(results: List[Dict[str, Any]], recall_target: float) -> Optional[Dict[str, Any]]:
+    """The cheapest setting that reaches the recall target, if any does."""
+    meeting = [result for result in results if result["recall"] >= recall_target]
+    return min(meeting, key=lambda result: result["value"]) if meeting else None
+
+
+def apply_search_setting(engine: Engine, setting: str, value: int):
+    """Persist a search setting (hnsw.ef_search / ivfflat.probes) as the database default for new sessions."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        database = connection.execute(text("SELECT current_database();")).scalar()
+        connection.execute(text(f'ALTER DATABASE "{database}" SET {setting} = {int(value)};'))
+    logger.info(f"Set {setting} = {value} for database {database}")
@@ -0,0 +1,111 @@
+import argparse
+import json
+import sys
+
+from app import create_app
+from app.workflows.db_utils import archive_review_vectors, reseed_review_stats
+from app.workflows.retention import archive_assessments, archived_ids, query_archive, retention_cutoff
+
+
+def run(app, args):
+    days = args.older_than_days or app.config['ASSESSMENT_RETENTION_DAYS']
+    batch_size = args.batch_size or app.config['RETENTION_BATCH_SIZE']
+    cutoff = retention_cutoff(days)
+
+    moved = []
+    after_delete = None
+    if args.archive_vectors:
+        vector_url = _vector_url(app, '--archive-vectors')
+
+        def after_delete(ids):
+            # Only once the assessments are gone for good; the move is idempotent by ids
+            moved.append(archive_review_vectors(vector_url, ids))
+
+    with app.app_context():
+        try:
+            result = archive_assessments(
+                app.config['ASSESSMENT_ARCHIVE_PATH'],
+                cutoff,
+                batch_size=batch_size,
+                pause=args.pause,
+                max_batches=args.max_batches,
+                dry_run=args.dry_run,
+                after_delete=after_delete
+            )
+        except Exception as e:
+            if args.archive_vectors and sum(moved):
+                reseed_review_stats(vector_url)
+            sys.exit(f"Archiving stopped: {str(e)}\n"
+                     f"Batches already archived are safe; run '{sys.argv[0]} vectors' to move any vectors they left behind")
+    print(f"{'Would archive' if args.dry_run else 'Archived'} {result['archived']} assessments reviewed before "
+          f"{cutoff.date()} in {result['batches']} batches (years: {', '.join(map(str, result['years'])) or 'none'})")
+
+    if args.archive_vectors and not args.dry_run:
+        if sum(moved):
+            reseed_review_stats(vector_url)
+        print(f"Moved {sum(moved)} review vectors to langchain_pg_embedding_archive")
+
+
+def vectors(app, args):
+    vector_url = _vector_url(app, 'vectors')
+    moved = sum(
+        archive_review_vectors(vector_url, ids)
+        for ids in archived_ids(app.config['ASSESSMENT_ARCHIVE_PATH'], years=args.year,
+                                batch_size=args.batch_size or app.config['RETENTION_BATCH_SIZE'])
+    )
+    if moved:
+        reseed_review_stats(vector_url)
+    print(f"Moved {moved} review vectors of archived assessments to langchain_pg_embedding_archive")
+
+
+def _vector_url(app, option):
+    vector_url = app.config['VECTOR_DATABASE_URL']
+    if not vector_url or not vector_url.startswith('postgres'):
+        sys.exit(f"{option} needs a PostgreSQL VECTOR_DATABASE_URL")
+    return vector_url
+
+
+def query(app, args):
+    rows = query_archive(
+        app.config['ASSESSMENT_ARCHIVE_PATH'],
+        years=args.year,
+        employee_id=args.employee_id,
+        department=args.department
+    )
+    for row in rows:
+        sys.stdout.write(json.dumps(row) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old assessments and their vectors, or query the archive.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Move assessments past the retention age to the archive")
+    run_parser.add_argument('--older-than-days', type=int, help="Defaults to ASSESSMENT_RETENTION_DAYS")
+    run_parser.add_argument('--batch-size', type=int, help="Rows per delete transaction (default: RETENTION_BATCH_SIZE)")
+    run_parser.add_argument('--pause', type=float, default=0.0, help="Seconds to sleep between batches")
+    run_parser.add_argument('--max-batches', type=int, help="Stop after this many batches")
+    run_parser.add_argument('--archive-vectors', action='store_true',
+                            help="Also move the archived assessments' review vectors out of langchain_pg_embedding")
+    run_parser.add_argument('--dry-run', action='store_true', help="Report what would be archived without changing anything")
+    run_parser.set_defaults(handler=run)
+
+    vectors_parser = subparsers.add_parser(
+        'vectors', help="Move the review vectors of already archived assessments, e.g. after a run stopped partway"
+    )
+    vectors_parser.add_argument('--year', type=int, action='append', help="Year partition to read (repeatable; default: all)")
+    vectors_parser.add_argument('--batch-size', type=int, help="Ids per move transaction (default: RETENTION_BATCH_SIZE)")
+    vectors_parser.set_defaults(handler=vectors)
+
+    query_parser = subparsers.add_parser('query', help="Print archived assessments as NDJSON")
+    query_parser.add_argument('--year', type=int, action='append', help="Year partition to read (repeatable; default: all)")
+    query_parser.add_argument('--employee-id')
+    query_parser.add_argument('--department')
+    query_parser.set_defaults(handler=query)
+
+    args = parser.parse_args()
+    args.handler(create_app(), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from app.vector_backends import VECTOR_BACKENDS, create_vector_backend
+
+DEPARTMENTS = ["Sales", "Engineering", "Marketing", "Support", "Finance"]
+
+
+def make_workload(num_vectors, num_queries, dimension, seed=42):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((num_vectors, dimension), dtype=np.float32)
+    queries = rng.standard_normal((num_queries, dimension), dtype=np.float32)
+    ids = [f"vec-{i}" for i in range(num_vectors)]
+    metadata = [{"department": DEPARTMENTS[i % len(DEPARTMENTS)], "rating": int(i % 5) + 1} for i in range(num_vectors)]
+    return ids, vectors, metadata, queries
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def benchmark(name, workload, top_k, batch_size, **options):
+    ids, vectors, metadata, queries = workload
+    backend = create_vector_backend(name, index_name="benchmark", dimension=vectors.shape[1], **options)
+    try:
+        _, insert_time = timed(lambda: [
+            backend.upsert(ids[i:i + batch_size], vectors[i:i + batch_size], metadata[i:i + batch_size])
+            for i in range(0, len(ids), batch_size)
+        ])
+        _, single_time = timed(lambda: [backend.search(query, top_k) for query in queries])
+        _, batch_time = timed(lambda: backend.search_batch(queries, top_k))
+        filters = [{"department": DEPARTMENTS[i % len(DEPARTMENTS)]} for i in range(len(queries))]
+        _, filtered_time = timed(lambda: backend.search_batch(queries, top_k, filters))
+        return {
+            "backend": name,
+            "inserts/s": len(ids) / insert_time,
+            "single q/s": len(queries) / single_time,
+            "batch q/s": len(queries) / batch_time,
+            "filtered q/s": len(queries) / filtered_time
+        }
+    finally:
+        backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector backends under the same workload")
+    parser.add_argument("--backends", nargs="+", default=["numpy", "faiss"], choices=VECTOR_BACKENDS)
+    parser.add_argument("--vectors", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    workload = make_workload(args.vectors, args.queries, args.dimension)
+    print(f"{args.vectors} vectors, {args.queries} queries, dimension {args.dimension}, top_k {args.top_k}")
+    for name in args.backends:
+        options = {}
+        store_path = None
+        if name == "numpy":
+            store_path = tempfile.mkdtemp(prefix="vector_benchmark_")
+            options["path"] = store_path
+        try:
+            result = benchmark(name, workload, args.top_k, args.batch_size, **options)
+            print("  ".join(f"{key}: {value:,.0f}" if isinstance(value, float) else f"{key}: {value}" for key, value in result.items()))
+        except Exception as e:
+            print(f"backend: {name}  failed: {str(e)}")
+        finally:
+            if store_path:
+                shutil.rmtree(store_path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import random
 from faker import Faker
+import argparse
 import csv
-from vector_db import VectorDB
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from vector_db import VectorDB, EncodingPool
 
 fake = Faker()
 
@@ -37,61 +41,151 @@ def generate_reviews(sales_volume):
         reviews.append(fake.paragraph(nb_sentences=3))
     return reviews
 
-def generate_salespeople():
-    salespeople_names = ["Alice Smith", "Bob Johnson", "Charlie Lee", "Diana Patel", "Ethan Kim"]
-    salespeople = []
-    
-    for name in salespeople_names:
-        qualifications = generate_qualification()
-        sales_volume = generate_sales_volume()
-        total_revenue = generate_total_revenue(sales_volume)
-        customer_satisfaction = generate_customer_satisfaction()
-        reviews = generate_reviews(sales_volume)
-        
-        salesperson = Salesperson(name, qualifications, sales_volume, total_revenue, customer_satisfaction, reviews)
-        salespeople.append(salesperson)
+DEFAULT_SALESPEOPLE_NAMES = ["Alice Smith", "Bob Johnson", "Charlie Lee", "Diana Patel", "Ethan Kim"]
+
+CSV_FIELDNAMES = ['name', 'qualifications', 'sales_volume', 'total_revenue', 'customer_satisfaction', 'reviews']
+
+def generate_salesperson(name):
+    qualifications = generate_qualification()
+    sales_volume = generate_sales_volume()
+    total_revenue = generate_total_revenue(sales_volume)
+    customer_satisfaction = generate_customer_satisfaction()
+    reviews = generate_reviews(sales_volume)
+    return Salesperson(name, qualifications, sales_volume, total_revenue, customer_satisfaction, reviews)
+
+def iter_salespeople(population_size=len(DEFAULT_SALESPEOPLE_NAMES)):
+    """Lazily generate salespeople: the default names first, then random names."""
+    for idx in range(population_size):
+        name = DEFAULT_SALESPEOPLE_NAMES[idx] if idx < len(DEFAULT_SALESPEOPLE_NAMES) else fake.name()
+        yield generate_salesperson(name)
+
+def generate_salespeople(population_size=len(DEFAULT_SALESPEOPLE_NAMES)):
+    return list(iter_salespeople(population_size))
+
+def chunked(iterable, size):
+    """Yield lists of up to `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
-    return salespeople
+def csv_row(salesperson):
+    return {
+        'name': salesperson.name,
+        'qualifications': salesperson.qualifications,
+        'sales_volume': salesperson.sales_volume,
+        'total_revenue': salesperson.total_revenue,
+        'customer_satisfaction': salesperson.customer_satisfaction,
+        'reviews': '|'.join(salesperson.reviews)
+    }
+
+def embedding_text(salesperson):
+    return f"{salesperson.name} {salesperson.qualifications} {' '.join(salesperson.reviews)}"
+
+def embedding_metadata(salesperson):
+    # Full review text is kept in the CSV; vector metadata stays small
+    return {
+        "name": salesperson.name,
+        "qualifications": salesperson.qualifications,
+        "sales_volume": salesperson.sales_volume,
+        "total_revenue": salesperson.total_revenue,
+        "customer_satisfaction": salesperson.customer_satisfaction
+    }
 
 def write_to_csv(salespeople, file_path):
     with open(file_path, mode='w', newline='') as csv_file:
-        fieldnames = ['name', 'qualifications', 'sales_volume', 'total_revenue', 'customer_satisfaction', 'reviews']
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
         
         writer.writeheader()
         for salesperson in salespeople:
-            writer.writerow({
-                'name': salesperson.name,
-                'qualifications': salesperson.qualifications,
-                'sales_volume': salesperson.sales_volume,
-                'total_revenue': salesperson.total_revenue,
-                'customer_satisfaction': salesperson.customer_satisfaction,
-                'reviews': '|'.join(salesperson.reviews)
-            })
-
-def generate_embeddings(salespeople):
-    vector_db = VectorDB("salespeople", 384)
+            writer.writerow(csv_row(salesperson))
+
+def generate_embeddings(salespeople, vector_db=None, chunk_size=256):
+    vector_db = vector_db or VectorDB("salespeople", 384)
     
-    for idx, salesperson in enumerate(salespeople):
-        text = f"{salesperson.name} {salesperson.qualifications} {' '.join(salesperson.reviews)}"
+    offset = 0
+    for chunk in chunked(salespeople, chunk_size):
         vector_db.add_vectors({
-            "id": [str(idx)],
-            "text": [text],
-            "metadata": [{
-                "name": salesperson.name,
-                "qualifications": salesperson.qualifications,
-                "sales_volume": salesperson.sales_volume,
-                "total_revenue": salesperson.total_revenue,
-                "customer_satisfaction": salesperson.customer_satisfaction,
-                "reviews": salesperson.reviews
-            }]
+            "id": [str(offset + idx) for idx in range(len(chunk))],
+            "text": [embedding_text(salesperson) for salesperson in chunk],
+            "metadata": [embedding_metadata(salesperson) for salesperson in chunk]
         })
+        offset += len(chunk)
 
-def main():
-    salespeople = generate_salespeople()
-    write_to_csv(salespeople, 'car_sales_data.csv')
-    generate_embeddings(salespeople)
-    
+def stream_salespeople(
+    population_size,
+    file_path,
+    chunk_size=256,
+    encode_batch_size=64,
+    embed=True,
+    on_chunk=None,
+    encode_workers=1
+):
+    """Generate salespeople in chunks and stream each chunk to the CSV and the vector index.
+
+    Only one chunk is generated at a time and at most one upsert is in flight
+    in a background thread while the next chunk is being generated and encoded,
+    so memory stays bounded by `chunk_size` regardless of the population size.
+    With `encode_workers` > 1 each chunk is encoded across that many processes.
+    Returns throughput statistics.
+    """
+    stats = {"rows": 0, "chunks": 0, "generate_seconds": 0.0, "csv_seconds": 0.0,
+             "encode_seconds": 0.0, "upsert_seconds": 0.0}
+    encoding_pool = EncodingPool(processes=encode_workers) if embed and encode_workers > 1 else None
+    vector_db = VectorDB("salespeople", 384, encoding_pool=encoding_pool) if embed else None
+    started = time.perf_counter()
+
+    def upsert(ids, vectors, metadata):
+        upsert_started = time.perf_counter()
+        vector_db.upsert(ids, vectors, metadata)
+        stats["upsert_seconds"] += time.perf_counter() - upsert_started
+
+    with open(file_path, mode='w', newline='') as csv_file, ThreadPoolExecutor(max_workers=1) as upserter:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        pending_upsert = None
+
+        salespeople = iter_salespeople(population_size)
+        while True:
+            step = time.perf_counter()
+            chunk = list(islice(salespeople, chunk_size))
+            if not chunk:
+                break
+            stats["generate_seconds"] += time.perf_counter() - step
+
+            step = time.perf_counter()
+            writer.writerows(csv_row(salesperson) for salesperson in chunk)
+            stats["csv_seconds"] += time.perf_counter() - step
+
+            if vector_db is not None:
+                step = time.perf_counter()
+                vectors = vector_db.encode([embedding_text(salesperson) for salesperson in chunk], batch_size=encode_batch_size)
+                stats["encode_seconds"] += time.perf_counter() - step
+
+                if pending_upsert is not None:
+                    pending_upsert.result()
+                ids = [str(stats["rows"] + idx) for idx in range(len(chunk))]
+                pending_upsert = upserter.submit(upsert, ids, vectors, [embedding_metadata(s) for s in chunk])
+
+            stats["rows"] += len(chunk)
+            stats["chunks"] += 1
+            if on_chunk:
+                on_chunk(chunk)
+            elapsed = time.perf_counter() - started
+            print(f"Processed {stats['rows']:,}/{population_size:,} salespeople ({stats['rows'] / elapsed:,.0f} rows/s)")
+
+        if pending_upsert is not None:
+            pending_upsert.result()
+
+    if encoding_pool is not None:
+        encoding_pool.close()
+    stats["total_seconds"] = time.perf_counter() - started
+    stats["rows_per_second"] = stats["rows"] / stats["total_seconds"] if stats["total_seconds"] else 0.0
+    return stats
+
+def print_salespeople(salespeople):
     for salesperson in salespeople:
         print(f"Name: {salesperson.name}")
         print(f"Qualifications: {salesperson.qualifications}")
@@ -103,5 +197,30 @@ def main():
             print(f"- {review}")
         print()
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic car sales data and embeddings.")
+    parser.add_argument('--population', type=int, default=len(DEFAULT_SALESPEOPLE_NAMES), help="Number of salespeople to generate")
+    parser.add_argument('--output', default='car_sales_data.csv', help="CSV output path")
+    parser.add_argument('--chunk-size', type=int, default=256, help="Salespeople per CSV/encode/upsert chunk")
+    parser.add_argument('--encode-batch-size', type=int, default=64, help="SentenceTransformer encode batch size")
+    parser.add_argument('--encode-workers', type=int, default=1, help="Processes used to encode each chunk")
+    parser.add_argument('--no-embed', action='store_true', help="Only write the CSV")
+    parser.add_argument('--verbose', action='store_true', help="Print every generated salesperson")
+    args = parser.parse_args()
+
+    stats = stream_salespeople(
+        args.population,
+        args.output,
+        chunk_size=args.chunk_size,
+        encode_batch_size=args.encode_batch_size,
+        embed=not args.no_embed,
+        on_chunk=print_salespeople if args.verbose else None,
+        encode_workers=args.encode_workers
+    )
+
+    print(f"Generated {stats['rows']:,} salespeople in {stats['total_seconds']:.1f}s ({stats['rows_per_second']:,.0f} rows/s)")
+    print(f"  generate: {stats['generate_seconds']:.1f}s, csv: {stats['csv_seconds']:.1f}s, "
+          f"encode: {stats['encode_seconds']:.1f}s, upsert: {stats['upsert_seconds']:.1f}s")
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
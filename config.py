@@ -12,6 +12,13 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(basedir, 'app.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pools shared by Flask-SQLAlchemy and the raw SQL helpers
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE') or 5)
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW') or 10)
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT') or 30)
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE') or 1800)
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() != 'false'
     
     # Mail settings
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
@@ -23,4 +30,23 @@ class Config:
     
     # Application settings
     ITEMS_PER_PAGE = 10
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size 
\ No newline at end of file
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size 
+
+    # Static files get content-hash URLs, precompressed bodies and a year of immutable caching
+    STATIC_FINGERPRINTING = os.environ.get('STATIC_FINGERPRINTING', 'true').lower() != 'false'
+    STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+    # Vector storage: "numpy" (local memory-mapped files), "faiss", "pgvector" or "pinecone"
+    VECTOR_BACKEND = os.environ.get('VECTOR_BACKEND') or 'numpy'
+    VECTOR_STORE_PATH = os.environ.get('VECTOR_STORE_PATH') or os.path.join(basedir, 'vector_store')
+    VECTOR_DATABASE_URL = os.environ.get('VECTOR_DATABASE_URL') or os.environ.get('DATABASE_URL')
+    PINECONE_API_KEY = os.environ.get('PINECONE_API_KEY')
+    PINECONE_ENV = os.environ.get('PINECONE_ENV')
+
+    # Columnar Parquet copy of assessments for analytics, refreshed by snapshot_assessments.py
+    ANALYTICS_SNAPSHOT_PATH = os.environ.get('ANALYTICS_SNAPSHOT_PATH') or os.path.join(basedir, 'analytics_snapshot')
+
+    # Retention: older assessments move to gzipped, year-partitioned files and their vectors to an archive table
+    ASSESSMENT_RETENTION_DAYS = int(os.environ.get('ASSESSMENT_RETENTION_DAYS') or 730)
+    ASSESSMENT_ARCHIVE_PATH = os.environ.get('ASSESSMENT_ARCHIVE_PATH') or os.path.join(basedir, 'assessment_archive')
+    RETENTION_BATCH_SIZE = int(os.environ.get('RETENTION_BATCH_SIZE') or 500)
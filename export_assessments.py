@@ -0,0 +1,53 @@
+import argparse
+import sys
+
+from app import create_app
+from app.models import User
+from app.workflows.assessment_export import DEFAULT_YIELD_PER, EXPORT_FORMATS, export_assessments
+from app.workflows.assessment_queries import parse_date, parse_fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a user's assessments to a CSV or NDJSON file.")
+    parser.add_argument('--user', required=True, help="Username whose assessments are exported")
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument('--output', default='-', help="Output file, or - for stdout")
+    parser.add_argument('--gzip', action='store_true', help="Gzip the output on the fly")
+    parser.add_argument('--fields', help="Comma-separated columns to export (default: all)")
+    parser.add_argument('--department')
+    parser.add_argument('--position')
+    parser.add_argument('--status')
+    parser.add_argument('--start-date', help="ISO 8601 date")
+    parser.add_argument('--end-date', help="ISO 8601 date")
+    parser.add_argument('--yield-per', type=int, default=DEFAULT_YIELD_PER, help="Rows fetched per cursor round trip")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        user = User.query.filter_by(username=args.user).first()
+        if user is None:
+            sys.exit(f"Unknown user '{args.user}'")
+
+        chunks = export_assessments(
+            user.id,
+            args.format,
+            fields=parse_fields(args.fields),
+            compress=args.gzip,
+            yield_per=args.yield_per,
+            department=args.department,
+            position=args.position,
+            status=args.status,
+            start_date=parse_date(args.start_date, 'start_date'),
+            end_date=parse_date(args.end_date, 'end_date')
+        )
+        output = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import io
+import os
+import sys
+
+from app import create_app
+from app.models import User
+from app.workflows.assessment_pipeline import AssessmentPipeline
+from app.workflows.bulk_import import IMPORT_FORMATS, analyze_imported_assessments, detect_format, import_assessments
+from app.workflows.event_loop import run_async
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import assessments from a JSONL or CSV file.")
+    parser.add_argument('path', help="File to import, or - for stdin")
+    parser.add_argument('--user', required=True, help="Username that will own the imported assessments")
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help="Defaults to the file extension (JSONL otherwise)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Rows per INSERT/COPY batch")
+    parser.add_argument('--max-errors', type=int, help="Stop after this many invalid rows")
+    parser.add_argument('--analyze', action='store_true', help="Run the assessment pipeline on imported rows")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        user = User.query.filter_by(username=args.user).first()
+        if user is None:
+            sys.exit(f"Unknown user '{args.user}'")
+
+        fmt = args.format or detect_format(args.path)
+        if args.path == '-':
+            stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+        else:
+            stream = open(args.path, encoding='utf-8', newline='')
+        with stream:
+            result = import_assessments(
+                stream,
+                fmt,
+                user.id,
+                batch_size=args.batch_size,
+                return_ids=args.analyze,
+                max_errors=args.max_errors
+            )
+
+    for error in result["errors"]:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    print(f"Imported {result['imported']}/{result['total']} assessments ({result['failed']} failed)"
+          + (" - stopped early after too many errors" if result["stopped_early"] else ""))
+
+    if args.analyze and result["ids"]:
+        pipeline = AssessmentPipeline(
+            db_connection_string=os.getenv('DATABASE_URL'),
+            openai_api_key=os.getenv('OPENAI_API_KEY')
+        )
+        totals = run_async(analyze_imported_assessments(app, pipeline, result["ids"]))
+        print(f"Analyzed {totals['analyzed']} assessments ({totals['failed']} failed)")
+
+    sys.exit(1 if result["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""pgvector ANN index on review embeddings
+
+Revision ID: 4e1b7c9a2d35
+Revises: cd5d178a6877
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e1b7c9a2d35'
+down_revision = 'cd5d178a6877'
+branch_labels = None
+depends_on = None
+
+# text-embedding-ada-002
+EMBEDDING_DIMENSION = 1536
+ANN_INDEX_NAME = 'ix_langchain_pg_embedding_embedding_ann'
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade():
+    if not _is_postgres():
+        return
+    bind = op.get_bind()
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector;')
+
+    # Own the langchain tables so they exist (with a fixed dimension) before PGVector first runs
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS langchain_pg_collection (
+            uuid UUID PRIMARY KEY,
+            name VARCHAR,
+            cmetadata JSON
+        );
+    """)
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS langchain_pg_embedding (
+            uuid UUID PRIMARY KEY,
+            collection_id UUID REFERENCES langchain_pg_collection (uuid) ON DELETE CASCADE,
+            embedding vector({EMBEDDING_DIMENSION}),
+            document VARCHAR,
+            cmetadata JSON,
+            custom_id VARCHAR
+        );
+    """)
+    # ANN indexes require a dimensioned column; older PGVector versions created it without one
+    dimensions = bind.execute(sa.text("""
+        SELECT atttypmod FROM pg_attribute
+        WHERE attrelid = 'langchain_pg_embedding'::regclass AND attname = 'embedding';
+    """)).scalar()
+    if dimensions is None or dimensions < 0:
+        op.execute(f'ALTER TABLE langchain_pg_embedding ALTER COLUMN embedding TYPE vector({EMBEDDING_DIMENSION});')
+
+    version = bind.execute(sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector';")).scalar()
+    major, minor = (int(part) for part in version.split('.')[:2])
+    if (major, minor) >= (0, 5):
+        method, options = 'hnsw', 'm = 16, ef_construction = 64'
+    else:
+        # IVFFlat lists should follow the data size; retune with tune_vector_index.py once loaded
+        method, options = 'ivfflat', 'lists = 100'
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {ANN_INDEX_NAME} '
+            f'ON langchain_pg_embedding USING {method} (embedding vector_cosine_ops) WITH ({options});'
+        )
+
+
+def downgrade():
+    if not _is_postgres():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {ANN_INDEX_NAME};')
@@ -0,0 +1,44 @@
+"""expression and GIN indexes on review embedding metadata
+
+Revision ID: 9c3d5f2e8a61
+Revises: 4e1b7c9a2d35
+Create Date: 2026-10-19 09:27:05.530617
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3d5f2e8a61'
+down_revision = '4e1b7c9a2d35'
+branch_labels = None
+depends_on = None
+
+# Filtered searches and statistics compare cmetadata->>'key' as text
+EXPRESSION_INDEXES = {
+    'ix_langchain_pg_embedding_employee_id': "(cmetadata->>'employee_id')",
+    'ix_langchain_pg_embedding_department': "collection_id, (cmetadata->>'department')",
+    'ix_langchain_pg_embedding_timestamp': "collection_id, (cmetadata->>'timestamp')",
+}
+GIN_INDEX_NAME = 'ix_langchain_pg_embedding_cmetadata_gin'
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, columns in EXPRESSION_INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON langchain_pg_embedding ({columns});')
+        # cmetadata is JSON, so containment (@>) filters go through a jsonb cast
+        op.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {GIN_INDEX_NAME} '
+            f'ON langchain_pg_embedding USING gin ((cmetadata::jsonb) jsonb_path_ops);'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name in [GIN_INDEX_NAME, *EXPRESSION_INDEXES]:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name};')
@@ -0,0 +1,29 @@
+"""fairness validation report of the stored analysis
+
+Revision ID: a8c4e1f7d392
+Revises: f3a9d6b0c2e7
+Create Date: 2026-10-19 14:05:12.583107
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4e1f7d392'
+down_revision = 'f3a9d6b0c2e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() runs at app startup, so the column may already exist
+    if 'validation_report' in {column['name'] for column in sa.inspect(op.get_bind()).get_columns('assessment')}:
+        return
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('validation_report', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.drop_column('validation_report')
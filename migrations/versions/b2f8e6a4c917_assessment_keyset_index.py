@@ -0,0 +1,25 @@
+"""index for keyset pagination of assessments
+
+Revision ID: b2f8e6a4c917
+Revises: 9c3d5f2e8a61
+Create Date: 2026-10-19 10:04:52.771390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2f8e6a4c917'
+down_revision = '9c3d5f2e8a61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() may already have created it on new databases
+    op.execute('CREATE INDEX IF NOT EXISTS ix_assessment_user_review_date_id ON assessment (user_id, review_date, id);')
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS ix_assessment_user_review_date_id;')
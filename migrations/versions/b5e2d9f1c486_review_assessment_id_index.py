@@ -0,0 +1,35 @@
+"""expression index on the assessment_id of review embeddings
+
+Revision ID: b5e2d9f1c486
+Revises: a8c4e1f7d392
+Create Date: 2026-10-19 14:41:53.209716
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e2d9f1c486'
+down_revision = 'a8c4e1f7d392'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_langchain_pg_embedding_assessment_id'
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Retention moves vectors by the ids of the assessments it archives
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            f"ON langchain_pg_embedding ((cmetadata->>'assessment_id'));"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME};')
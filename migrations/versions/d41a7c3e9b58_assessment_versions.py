@@ -0,0 +1,44 @@
+"""row and analysis versions for assessment ETags
+
+Revision ID: d41a7c3e9b58
+Revises: b2f8e6a4c917
+Create Date: 2026-10-19 11:12:37.418205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41a7c3e9b58'
+down_revision = 'b2f8e6a4c917'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() runs at app startup, so the columns may already exist
+    existing_columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('assessment')}
+    columns = [
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('analysis_version', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False)
+    ]
+    missing_columns = [column for column in columns if column.name not in existing_columns]
+    if not missing_columns:
+        return
+
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        for column in missing_columns:
+            batch_op.add_column(column)
+
+    # Rows that already hold an analysis count as analyzed once
+    if 'analysis_version' not in existing_columns:
+        op.execute("UPDATE assessment SET analysis_version = 1 WHERE status = 'completed'")
+
+
+def downgrade():
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('analysis_version')
+        batch_op.drop_column('version')
@@ -0,0 +1,70 @@
+"""full-text search index over assessments
+
+Revision ID: e7b2c5d81f04
+Revises: d41a7c3e9b58
+Create Date: 2026-10-19 11:48:05.903126
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b2c5d81f04'
+down_revision = 'd41a7c3e9b58'
+branch_labels = None
+depends_on = None
+
+SQLITE_SETUP = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS assessment_fts USING fts5(
+        employee_name, position, review_text, additional_comments,
+        content='assessment', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_insert AFTER INSERT ON assessment BEGIN
+        INSERT INTO assessment_fts(rowid, employee_name, position, review_text, additional_comments)
+        VALUES (new.id, new.employee_name, new.position, new.review_text, new.additional_comments);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_delete AFTER DELETE ON assessment BEGIN
+        INSERT INTO assessment_fts(assessment_fts, rowid, employee_name, position, review_text, additional_comments)
+        VALUES ('delete', old.id, old.employee_name, old.position, old.review_text, old.additional_comments);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS assessment_fts_update AFTER UPDATE OF
+        employee_name, position, review_text, additional_comments ON assessment BEGIN
+        INSERT INTO assessment_fts(assessment_fts, rowid, employee_name, position, review_text, additional_comments)
+        VALUES ('delete', old.id, old.employee_name, old.position, old.review_text, old.additional_comments);
+        INSERT INTO assessment_fts(rowid, employee_name, position, review_text, additional_comments)
+        VALUES (new.id, new.employee_name, new.position, new.review_text, new.additional_comments);
+    END"""
+]
+
+POSTGRES_SETUP = [
+    """ALTER TABLE assessment ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(employee_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(position, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(review_text, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(additional_comments, '')), 'D')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_assessment_search_vector ON assessment USING gin (search_vector)"
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRES_SETUP:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SETUP:
+            op.execute(statement)
+        op.execute("INSERT INTO assessment_fts(assessment_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_assessment_search_vector')
+        op.execute('ALTER TABLE assessment DROP COLUMN IF EXISTS search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('assessment_fts_insert', 'assessment_fts_delete', 'assessment_fts_update'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS assessment_fts')
@@ -0,0 +1,172 @@
+"""typed analysis columns, per-metric table and composite indexes
+
+Revision ID: f3a9d6b0c2e7
+Revises: e7b2c5d81f04
+Create Date: 2026-10-19 12:20:41.662019
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9d6b0c2e7'
+down_revision = 'e7b2c5d81f04'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _document(value):
+    # Values may be serialized once or twice depending on how they were written
+    for _ in range(2):
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _backfill(connection):
+    assessment = sa.table(
+        'assessment',
+        sa.column('id', sa.Integer), sa.column('performance_metrics', sa.Text),
+        sa.column('sentiment_analysis', sa.Text), sa.column('promotion_recommendation', sa.Text),
+        sa.column('overall_rating', sa.Float), sa.column('sentiment_score', sa.Float),
+        sa.column('sentiment_label', sa.String), sa.column('sentiment_confidence', sa.Float),
+        sa.column('promotion_recommended', sa.Boolean), sa.column('promotion_confidence', sa.Float)
+    )
+    metric = sa.table(
+        'assessment_metric',
+        sa.column('assessment_id', sa.Integer), sa.column('name', sa.String), sa.column('value', sa.Float)
+    )
+    update = assessment.update().where(assessment.c.id == sa.bindparam('assessment_id')).values(
+        overall_rating=sa.bindparam('overall_rating'),
+        sentiment_score=sa.bindparam('sentiment_score'),
+        sentiment_label=sa.bindparam('sentiment_label'),
+        sentiment_confidence=sa.bindparam('sentiment_confidence'),
+        promotion_recommended=sa.bindparam('promotion_recommended'),
+        promotion_confidence=sa.bindparam('promotion_confidence')
+    )
+
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(assessment.c.id, assessment.c.performance_metrics,
+                      assessment.c.sentiment_analysis, assessment.c.promotion_recommendation)
+            .where(assessment.c.id > last_id).order_by(assessment.c.id).limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+
+        updates, metric_rows = [], []
+        for row in rows:
+            metrics = _document(row.performance_metrics)
+            sentiment = _document(row.sentiment_analysis)
+            promotion = _document(row.promotion_recommendation)
+            label = sentiment.get('sentiment_label')
+            recommended = promotion.get('promotion_recommended')
+            updates.append({
+                'assessment_id': row.id,
+                'overall_rating': _number(metrics.get('overall_rating')),
+                'sentiment_score': _number(sentiment.get('sentiment_score')),
+                'sentiment_label': str(label)[:20] if label is not None else None,
+                'sentiment_confidence': _number(sentiment.get('confidence')),
+                'promotion_recommended': recommended if isinstance(recommended, bool) else None,
+                'promotion_confidence': _number(promotion.get('confidence_score'))
+            })
+            for name, value in metrics.items():
+                number = _number(value)
+                if number is not None and len(str(name)) <= 50:
+                    metric_rows.append({'assessment_id': row.id, 'name': str(name), 'value': number})
+
+        # The app may already have written metrics for rows it touched since db.create_all() made the table
+        existing = set(connection.execute(
+            sa.select(metric.c.assessment_id).distinct()
+            .where(metric.c.assessment_id.in_([row.id for row in rows]))
+        ).scalars())
+        metric_rows = [metric_row for metric_row in metric_rows if metric_row['assessment_id'] not in existing]
+
+        connection.execute(update, updates)
+        if metric_rows:
+            connection.execute(metric.insert(), metric_rows)
+
+
+def _typed_columns():
+    return (
+        sa.Column('overall_rating', sa.Float(), nullable=True),
+        sa.Column('sentiment_score', sa.Float(), nullable=True),
+        sa.Column('sentiment_label', sa.String(length=20), nullable=True),
+        sa.Column('sentiment_confidence', sa.Float(), nullable=True),
+        sa.Column('promotion_recommended', sa.Boolean(), nullable=True),
+        sa.Column('promotion_confidence', sa.Float(), nullable=True)
+    )
+
+
+INDEXES = (
+    ('ix_assessment_metric_name_value', 'assessment_metric', ['name', 'value']),
+    ('ix_assessment_employee_review_date', 'assessment', ['employee_id', 'review_date']),
+    ('ix_assessment_department_status', 'assessment', ['department', 'status'])
+)
+
+
+def upgrade():
+    # db.create_all() runs at app startup, so parts of this may already exist
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing_columns = {column['name'] for column in inspector.get_columns('assessment')}
+    missing_columns = [column for column in _typed_columns() if column.name not in existing_columns]
+
+    if missing_columns:
+        with op.batch_alter_table('assessment', schema=None) as batch_op:
+            for column in missing_columns:
+                batch_op.add_column(column)
+
+    if not inspector.has_table('assessment_metric'):
+        op.create_table('assessment_metric',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('assessment_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessment.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('assessment_id', 'name', name='uq_assessment_metric_assessment_name')
+        )
+
+    # Rows written before the typed columns existed still need them derived
+    if missing_columns:
+        _backfill(bind)
+
+    # After the backfill so the bulk writes do not maintain them row by row
+    inspector = sa.inspect(bind)
+    for name, table, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_assessment_department_status', table_name='assessment')
+    op.drop_index('ix_assessment_employee_review_date', table_name='assessment')
+    op.drop_index('ix_assessment_metric_name_value', table_name='assessment_metric')
+    op.drop_table('assessment_metric')
+
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.drop_column('promotion_confidence')
+        batch_op.drop_column('promotion_recommended')
+        batch_op.drop_column('sentiment_confidence')
+        batch_op.drop_column('sentiment_label')
+        batch_op.drop_column('sentiment_score')
+        batch_op.drop_column('overall_rating')
@@ -0,0 +1,25 @@
+import argparse
+
+from app import create_app
+from app.workflows.analytics_snapshot import DEFAULT_BATCH_SIZE, DEFAULT_SAFETY_LAG_SECONDS, refresh_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the Parquet analytics snapshot of assessments.")
+    parser.add_argument('--path', help="Snapshot directory (default: ANALYTICS_SNAPSHOT_PATH)")
+    parser.add_argument('--full', action='store_true', help="Rebuild from scratch instead of refreshing incrementally")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Rows per Parquet write")
+    parser.add_argument('--safety-lag', type=float, default=DEFAULT_SAFETY_LAG_SECONDS,
+                        help="Seconds before the high-water mark to re-read for late commits")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        path = args.path or app.config['ANALYTICS_SNAPSHOT_PATH']
+        result = refresh_snapshot(path, full=args.full, batch_size=args.batch_size, safety_lag=args.safety_lag)
+
+    print(f"Wrote {result['written']} assessments to {path} (high-water mark: {result['high_water']})")
+
+
+if __name__ == "__main__":
+    main()
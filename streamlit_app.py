@@ -5,7 +5,8 @@ from app import create_app
 from app.models import db, User, Assessment
 from app.workflows.assessment_pipeline import AssessmentPipeline
 from app.workflows.db_utils import setup_vector_store, add_review_to_vector_store, batch_add_reviews_to_vector_store
-import asyncio
+from app.workflows.event_loop import run_async
+from app.workflows.dashboard_stats import get_dashboard_stats
 import json
 from datetime import datetime
 import pandas as pd
@@ -36,17 +37,24 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-try:
-    # Initialize Flask app
+# Streamlit re-runs this script on every interaction; cache the app and pipeline
+# so their engines and connection pools are created once per process
+@st.cache_resource
+def get_flask_app():
     logger.info("Initializing Flask app...")
-    app = create_app()
-    
-    # Initialize assessment pipeline
+    return create_app()
+
+@st.cache_resource
+def get_pipeline():
     logger.info("Initializing assessment pipeline...")
-    pipeline = AssessmentPipeline(
+    return AssessmentPipeline(
         db_connection_string=os.getenv("DATABASE_URL"),
         openai_api_key=os.getenv("OPENAI_API_KEY")
     )
+
+try:
+    app = get_flask_app()
+    pipeline = get_pipeline()
 except Exception as e:
     logger.error(f"Error during initialization: {str(e)}")
     raise
@@ -178,16 +186,11 @@ def dashboard():
                 st.session_state['page'] = 'new_assessment'
                 st.experimental_rerun()
         
-        # Get assessment counts
-        total_assessments = Assessment.query.filter_by(user_id=st.session_state['user'].id).count()
-        pending_reviews = Assessment.query.filter_by(
-            user_id=st.session_state['user'].id,
-            status='pending'
-        ).count()
-        completed_reviews = Assessment.query.filter_by(
-            user_id=st.session_state['user'].id,
-            status='completed'
-        ).count()
+        # Get assessment counts and recent assessments (cached until they change)
+        summary = get_dashboard_stats(st.session_state['user'].id)
+        total_assessments = summary["total"]
+        pending_reviews = summary["pending"]
+        completed_reviews = summary["completed"]
         
         # Metric Cards
         col1, col2, col3 = st.columns(3)
@@ -223,7 +226,7 @@ def dashboard():
         st.markdown("### Recent Assessments")
         
         # Get assessments
-        assessments = Assessment.query.filter_by(user_id=st.session_state['user'].id).order_by(Assessment.review_date.desc()).limit(5).all()
+        assessments = summary["recent"]
         
         if not assessments:
             st.info("No assessments found. Create your first assessment to get started!")
@@ -232,8 +235,7 @@ def dashboard():
         # Create table data
         table_data = []
         for assessment in assessments:
-            metrics = json.loads(assessment.performance_metrics)
-            rating = metrics["overall_rating"]
+            rating = float(assessment["overall_rating"] or 0)
             rating_class = f"rating-{int(rating)}"
             
             # Format the rating badge with color
@@ -248,10 +250,10 @@ def dashboard():
             '''
             
             table_data.append({
-                "Employee Name": assessment.employee_name,
-                "Position": assessment.position,
-                "Department": assessment.department,
-                "Review Period": assessment.review_date.strftime("Q%q %Y"),
+                "Employee Name": assessment["employee_name"],
+                "Position": assessment["position"],
+                "Department": assessment["department"],
+                "Review Period": f"Q{(assessment['review_date'].month - 1) // 3 + 1} {assessment['review_date'].year}",
                 "Rating": rating_badge,
                 "Actions": actions
             })
@@ -380,7 +382,7 @@ def assessment_form():
                 try:
                     # Process assessment
                     with st.spinner("Processing assessment..."):
-                        result = asyncio.run(pipeline.process_single_review(
+                        result = run_async(pipeline.process_single_review(
                             review_text=review_text,
                             employee_id=employee_id,
                             performance_metrics=assessment_data["performance_metrics"]
@@ -406,11 +408,12 @@ def assessment_form():
                         db.session.commit()
                         
                         # Add to vector store
-                        asyncio.run(add_review_to_vector_store(
+                        run_async(add_review_to_vector_store(
                             pipeline.vector_store,
                             review_text,
                             {
                                 "employee_id": employee_id,
+                                "assessment_id": assessment.id,
                                 "department": department,
                                 "position": position
                             }
@@ -459,8 +462,18 @@ def assessment_form():
 def view_assessments():
     """View and analyze submitted assessments."""
     with app.app_context():
-        # Get all assessments
-        assessments = Assessment.query.filter_by(user_id=st.session_state['user'].id).all()
+        # Typed columns only, no JSON documents to load and parse per row
+        assessments = db.session.query(
+            Assessment.employee_name,
+            Assessment.position,
+            Assessment.department,
+            Assessment.review_date,
+            Assessment.overall_rating,
+            Assessment.sentiment_label,
+            Assessment.promotion_recommended
+        ).filter(
+            Assessment.user_id == st.session_state['user'].id
+        ).order_by(Assessment.review_date.desc()).all()
         
         if not assessments:
             st.info("No assessments found. Create your first assessment to get started!")
@@ -469,38 +482,30 @@ def view_assessments():
         # Convert to DataFrame
         data = []
         for assessment in assessments:
-            try:
-                metrics = json.loads(assessment.performance_metrics)
-                sentiment = json.loads(assessment.sentiment_analysis)
-                promotion = json.loads(assessment.promotion_recommendation)
-                
-                # Format rating with color
-                rating = float(metrics.get("overall_rating", 0))
-                rating_class = f"rating-{int(rating)}"
-                rating_badge = f'<span class="rating-badge {rating_class}">{rating:.1f}/5</span>'
-                
-                # Format actions
-                actions = f'''
-                <div style="white-space: nowrap;">
-                    <a href="#" class="action-button">View</a>
-                    <a href="#" class="action-button">Edit</a>
-                </div>
-                '''
-                
-                data.append({
-                    "Employee Name": assessment.employee_name,
-                    "Position": assessment.position,
-                    "Department": assessment.department,
-                    "Review Date": assessment.review_date.strftime("%Y-%m-%d"),
-                    "Rating": rating,  # Store raw number for calculations
-                    "Rating_Display": rating_badge,  # Store HTML for display
-                    "Sentiment": sentiment.get("sentiment_label", "N/A"),
-                    "Promotion": "Yes" if promotion.get("promotion_recommended", False) else "No",
-                    "Actions": actions
-                })
-            except Exception as e:
-                logger.error(f"Error processing assessment {assessment.id}: {str(e)}")
-                continue
+            # Format rating with color
+            rating = float(assessment.overall_rating or 0)
+            rating_class = f"rating-{int(rating)}"
+            rating_badge = f'<span class="rating-badge {rating_class}">{rating:.1f}/5</span>'
+            
+            # Format actions
+            actions = f'''
+            <div style="white-space: nowrap;">
+                <a href="#" class="action-button">View</a>
+                <a href="#" class="action-button">Edit</a>
+            </div>
+            '''
+            
+            data.append({
+                "Employee Name": assessment.employee_name,
+                "Position": assessment.position,
+                "Department": assessment.department,
+                "Review Date": assessment.review_date.strftime("%Y-%m-%d"),
+                "Rating": rating,  # Store raw number for calculations
+                "Rating_Display": rating_badge,  # Store HTML for display
+                "Sentiment": assessment.sentiment_label or "N/A",
+                "Promotion": "Yes" if assessment.promotion_recommended else "No",
+                "Actions": actions
+            })
         
         if not data:
             st.error("Error loading assessment data. Please try again later.")
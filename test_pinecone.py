@@ -1,8 +1,7 @@
 from pinecone import Pinecone
 
-PINECONE_API_KEY = "your_actual_api_key"
-PINECONE_ENV = "your_actual_env"
+from config import Config
 
-pc = Pinecone(api_key=PINECONE_API_KEY, environment=PINECONE_ENV)
+pc = Pinecone(api_key=Config.PINECONE_API_KEY, environment=Config.PINECONE_ENV)
 
-print(pc.list_indexes().names) 
\ No newline at end of file
+print(pc.list_indexes().names)
@@ -0,0 +1,83 @@
+import argparse
+import logging
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from app.workflows.engines import get_engine
+from app.workflows.vector_indexes import (
+    ANN_METHODS, apply_search_setting, default_lists, measure_recall,
+    rebuild_ann_index, smallest_meeting_target
+)
+
+logging.basicConfig(level=logging.INFO)
+
+EF_SEARCH_CANDIDATES = [10, 20, 40, 80, 160, 320, 640]
+
+
+def print_results(results, recall_target):
+    for result in results:
+        marker = "*" if result["recall"] >= recall_target else " "
+        print(f" {marker} {result['setting']}={result['value']:<5} recall {result['recall']:.3f}  {result['mean_ms']:.2f} ms/query")
+
+
+def tune_hnsw(engine, args):
+    if args.rebuild:
+        rebuild_ann_index(engine, "hnsw", m=args.m, ef_construction=args.ef_construction)
+    results = measure_recall(engine, "hnsw.ef_search", args.ef_search or EF_SEARCH_CANDIDATES, args.sample, args.k)
+    print_results(results, args.recall)
+    return smallest_meeting_target(results, args.recall)
+
+
+def tune_ivfflat(engine, args):
+    best = None
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT COUNT(*) FROM langchain_pg_embedding;")).scalar()
+    base = default_lists(rows)
+    candidates = args.lists or sorted({max(1, base // 2), base, base * 2})
+    for lists in candidates:
+        rebuild_ann_index(engine, "ivfflat", lists=lists)
+        probes = sorted({p for p in (1, 2, 4, 8, 16, 32, 64, 128) if p <= lists} | {lists})
+        print(f"lists={lists}")
+        results = measure_recall(engine, "ivfflat.probes", probes, args.sample, args.k)
+        print_results(results, args.recall)
+        candidate = smallest_meeting_target(results, args.recall)
+        if candidate and (best is None or candidate["mean_ms"] < best["mean_ms"]):
+            best = {**candidate, "lists": lists}
+    if best and best["lists"] != candidates[-1]:
+        # Leave the index built with the winning number of lists
+        rebuild_ann_index(engine, "ivfflat", lists=best["lists"])
+    return best
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Rebuild and tune the pgvector ANN index on review embeddings.")
+    parser.add_argument('--database-url', default=os.getenv('DATABASE_URL'), help="Defaults to DATABASE_URL")
+    parser.add_argument('--method', choices=ANN_METHODS, default='hnsw')
+    parser.add_argument('--recall', type=float, default=0.95, help="Target recall@k")
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--sample', type=int, default=100, help="Stored embeddings used as test queries")
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild the HNSW index before measuring")
+    parser.add_argument('--m', type=int, default=16, help="HNSW max connections per layer")
+    parser.add_argument('--ef-construction', type=int, default=64, help="HNSW build candidate list size")
+    parser.add_argument('--ef-search', type=int, nargs='+', help="HNSW ef_search values to try")
+    parser.add_argument('--lists', type=int, nargs='+', help="IVFFlat lists values to try (each rebuilds the index)")
+    parser.add_argument('--apply', action='store_true', help="Persist the chosen ef_search/probes as the database default")
+    args = parser.parse_args()
+
+    engine = get_engine(args.database_url)
+    best = tune_hnsw(engine, args) if args.method == 'hnsw' else tune_ivfflat(engine, args)
+    if best is None:
+        print(f"No setting reached recall {args.recall}; try larger values or rebuild with a bigger m/lists")
+        return
+
+    extra = f" with lists={best['lists']}" if "lists" in best else ""
+    print(f"Recommended {best['setting']}={best['value']}{extra} (recall {best['recall']:.3f}, {best['mean_ms']:.2f} ms/query)")
+    if args.apply:
+        apply_search_setting(engine, best["setting"], best["value"])
+
+
+if __name__ == "__main__":
+    main()
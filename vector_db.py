@@ -1,27 +1,112 @@
-from pinecone import Pinecone, ServerlessSpec
+import math
+import multiprocessing
+import os
+import threading
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
-PINECONE_API_KEY = "your_actual_api_key"
-PINECONE_ENV = "your_actual_env"
+from app.vector_backends import VectorBackend, create_vector_backend
+
+DEFAULT_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_model(model_name=DEFAULT_MODEL_NAME):
+    """Return the process-wide SentenceTransformer for `model_name`, loading it on first use."""
+    model = _models.get(model_name)
+    if model is None:
+        with _models_lock:
+            model = _models.get(model_name)
+            if model is None:
+                model = _models[model_name] = SentenceTransformer(model_name)
+    return model
+
+
+def _encode_chunk(args):
+    model_name, texts, batch_size = args
+    return np.asarray(get_model(model_name).encode(texts, batch_size=batch_size), dtype=np.float32)
+
+
+class EncodingPool:
+    """Encode large corpora across worker processes, each holding one copy of the model.
+
+    Input is split into chunks that are encoded in parallel; `imap` returns
+    the chunk results in submission order, so output rows line up with input.
+    """
+
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, processes=None, chunk_size=1024):
+        self.model_name = model_name
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # spawn avoids forking a parent that may already hold torch threads
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(self.processes, initializer=get_model, initargs=(model_name,))
+
+    def _chunks(self, texts, batch_size):
+        # Small inputs are still spread over every worker
+        size = max(1, min(self.chunk_size, math.ceil(len(texts) / self.processes)))
+        for start in range(0, len(texts), size):
+            yield self.model_name, texts[start:start + size], batch_size
+
+    def encode(self, texts, batch_size=64):
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(list(self._pool.imap(_encode_chunk, self._chunks(texts, batch_size))))
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
-pc = Pinecone(api_key=PINECONE_API_KEY, environment=PINECONE_ENV)
 
 class VectorDB:
-    def __init__(self, index_name, dimension):
-        if index_name not in pc.list_indexes().names():
-            pc.create_index(
-                name=index_name,
-                dimension=dimension,
-                metric='cosine'
-            )
-        self.index = pc.Index(index_name)
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
-
-    def add_vectors(self, data):
-        vectors = self.model.encode(data['text']).tolist()
-        self.index.upsert(vectors=zip(data['id'], vectors))
-
-    def search_vectors(self, query, top_k=5):
-        query_vector = self.model.encode([query]).tolist()
-        result = self.index.query(queries=query_vector, top_k=top_k, include_metadata=True)
-        return [{"id": match['id'], "score": match['score'], "metadata": match['metadata']} for match in result['matches'][0]] 
\ No newline at end of file
+    def __init__(self, index_name, dimension, backend=None, model_name=DEFAULT_MODEL_NAME, encoding_pool=None):
+        # Backend is chosen by the VECTOR_BACKEND setting unless given explicitly
+        if not isinstance(backend, VectorBackend):
+            backend = create_vector_backend(backend, index_name=index_name, dimension=dimension)
+        self.backend = backend
+        self.model = get_model(model_name)
+        self.encoding_pool = encoding_pool
+
+    def encode(self, texts, batch_size=64):
+        if self.encoding_pool is not None:
+            return self.encoding_pool.encode(texts, batch_size=batch_size).tolist()
+        return self.model.encode(texts, batch_size=batch_size).tolist()
+
+    def upsert(self, ids, vectors, metadata=None):
+        self.backend.upsert(ids, vectors, metadata)
+
+    def add_vectors(self, data, batch_size=64):
+        vectors = self.encode(data['text'], batch_size=batch_size)
+        self.upsert(data['id'], vectors, data.get('metadata'))
+
+    def delete_vectors(self, ids):
+        return self.backend.delete(ids)
+
+    def search_vectors(self, query, top_k=5, metadata_filter=None):
+        return self.search_vectors_batch([query], top_k=top_k, metadata_filters=[metadata_filter])[0]
+
+    def search_vectors_batch(self, queries, top_k=5, metadata_filters=None, batch_size=64):
+        """Search many queries at once, returning one top-k list per query.
+
+        All queries are encoded in a single model call and passed to the backend
+        as one matrix. `metadata_filters` is an optional list with one filter
+        (or None) per query, or a single filter applied to every query.
+        """
+        if not queries:
+            return []
+        if metadata_filters is None or isinstance(metadata_filters, dict):
+            metadata_filters = [metadata_filters] * len(queries)
+        if len(metadata_filters) != len(queries):
+            raise ValueError(f"Got {len(metadata_filters)} filters for {len(queries)} queries")
+        query_vectors = self.model.encode(list(queries), batch_size=batch_size)
+        return self.backend.search_batch(query_vectors, top_k=top_k, filters=metadata_filters)